@@ -1,11 +1,14 @@
 """Data-processing utilities."""
 
 
+from .local_cache import LocalFileCache
+from .metadata_catalog import MetadataCatalog
 from .pandas import PandasFlatteningSubsampler, PandasMLPreprocessor
-from .s3_parquet import S3ParquetDataFeeder
+from .s3_parquet import Combiner, S3ParquetDataFeeder
 
 
 __all__ = (
+    'LocalFileCache', 'MetadataCatalog',
     'PandasFlatteningSubsampler', 'PandasMLPreprocessor',
-    'S3ParquetDataFeeder',
+    'Combiner', 'S3ParquetDataFeeder',
 )
@@ -16,6 +16,8 @@ from .. import debug, s3
 from ..log import STDOUT_HANDLER
 from ..namespace import Namespace
 
+from .local_cache import LocalFileCache
+
 
 __all__ = (
     'AbstractDataHandler', 'AbstractFileDataHandler', 'AbstractS3FileDataHandler',   # noqa: E501
@@ -512,6 +514,11 @@ class AbstractFileDataHandler(AbstractDataHandler):
     _LOCAL_CACHE_DIR_PATH: Path = (Path(tempfile.gettempdir()).resolve(strict=True) /   # noqa: E501
                                    '.h1st/data-proc-cache')
 
+    # local file cache manager
+    # (set `LOCAL_CACHE.maxNBytes` to bound disk usage by LRU eviction)
+    LOCAL_CACHE: LocalFileCache = LocalFileCache(dirPath=_LOCAL_CACHE_DIR_PATH,
+                                                 maxNBytes=None)
+
     # ====================================
     # MIN. NO. OF FILES FOR REPR. SAMPLING
     # ------------------------------------
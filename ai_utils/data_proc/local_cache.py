@@ -0,0 +1,348 @@
+"""Size-bounded local file cache."""
+
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+import fcntl
+import os
+from pathlib import Path
+from threading import RLock
+import time
+from typing import BinaryIO, Iterator, Optional
+from typing import Dict, List, Tuple   # Py3.9+: use built-ins
+
+from ..fs import PathType
+from ..namespace import Namespace
+
+
+__all__ = ('LocalFileCache',)
+
+
+# flake8: noqa
+# (too many camelCase names)
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+class LocalFileCache:
+    """Size-bounded local file cache with least-recently-used eviction.
+
+    Files are tracked (per process) in order of last access, initially as per
+    their access times on disk. Whenever the total size exceeds ``maxNBytes``
+    (upon adding or unpinning files, or lowering ``maxNBytes``),
+    least-recently-used files not pinned (e.g., being read) are deleted.
+    Hidden files & directories (e.g., temporary downloads, lock files) are not tracked.
+
+    Pins hold shared locks on hidden pin-lock files next to pinned files,
+    so that files pinned by any process sharing the cache directory are not evicted.
+    Processes sharing the cache directory can also serialize downloads of the same file
+    by holding its lock (see ``locked``), the file then not being evicted either.
+    Evicted files' pin-lock & lock files are deleted along with them.
+    """
+
+    def __init__(self, dirPath: PathType, maxNBytes: Optional[int] = None):
+        """Init Local File Cache."""
+        self.dirPath: Path = Path(dirPath)
+
+        # maximum total number of bytes of cached files (None: unbounded)
+        self._maxNBytes: Optional[int] = maxNBytes
+
+        self._lock: RLock = RLock()
+
+        # file paths -> numbers of bytes, in order of last access (lazily scanned)
+        self._filesNBytes: Optional[OrderedDict] = None
+        self._nBytes: int = 0
+
+        self._pinCounts: Counter = Counter()
+
+        # pinned file paths -> open pin-lock files holding shared locks
+        self._pinLockFiles: Dict[Path, BinaryIO] = {}
+
+        self._stats: Namespace = Namespace(hits=0, misses=0,
+                                           evictedNFiles=0, evictedNBytes=0)
+
+    def __repr__(self) -> str:
+        """Return string repr."""
+        return (f'{type(self).__name__}["{self.dirPath}", '
+                f'max {self.maxNBytes:,} bytes]'
+                if self.maxNBytes
+                else f'{type(self).__name__}["{self.dirPath}", unbounded]')
+
+    @property
+    def maxNBytes(self) -> Optional[int]:
+        """Maximum total number of bytes of cached files (None: unbounded)."""
+        return self._maxNBytes
+
+    @maxNBytes.setter
+    def maxNBytes(self, maxNBytes: Optional[int], /):
+        """Set maximum total number of bytes of cached files, evicting files if over it."""
+        self._maxNBytes: Optional[int] = maxNBytes
+
+        self.evict()
+
+    @staticmethod
+    def _pinLockPath(path: Path) -> Path:
+        return path.with_name(f'.{path.name}.pin')
+
+    @staticmethod
+    def _lockPath(path: Path) -> Path:
+        return path.with_name(f'.{path.name}.lock')
+
+    @staticmethod
+    def _openLocked(lockPath: Path, operation: int) -> BinaryIO:
+        """Open & lock lock file, retrying if deleted (upon eviction) before being locked.
+
+        (so that a lock is never held on a deleted lock file, which others would not see)
+        """
+        while True:
+            lockFile: BinaryIO = open(lockPath, mode='ab')   # pylint: disable=consider-using-with
+
+            try:
+                fcntl.flock(lockFile.fileno(), operation)
+
+            except BaseException as err:   # e.g., BlockingIOError if non-blocking
+                lockFile.close()
+                raise err
+
+            try:
+                if os.fstat(lockFile.fileno()).st_ino == os.stat(lockPath).st_ino:
+                    return lockFile
+
+            except FileNotFoundError:
+                pass
+
+            lockFile.close()
+
+    def _scannedFilesNBytes(self) -> OrderedDict:
+        # (to be called with lock held)
+        if self._filesNBytes is None:
+            filesAccessTimesAndNBytes: List[Tuple[float, Path, int]] = []
+
+            for dirPath, dirNames, fileNames in os.walk(self.dirPath):
+                dirNames[:] = [dirName for dirName in dirNames if not dirName.startswith('.')]
+
+                for fileName in fileNames:
+                    if not fileName.startswith('.'):
+                        filePath: Path = Path(dirPath) / fileName
+
+                        try:
+                            fileStat: os.stat_result = filePath.stat()
+                        except FileNotFoundError:
+                            continue
+
+                        filesAccessTimesAndNBytes.append((fileStat.st_atime, filePath,
+                                                          fileStat.st_size))
+
+            self._filesNBytes: OrderedDict = OrderedDict(
+                (filePath, nBytes)
+                for _, filePath, nBytes in sorted(filesAccessTimesAndNBytes,
+                                                  key=lambda i: i[0]))
+
+            self._nBytes: int = sum(self._filesNBytes.values())
+
+        return self._filesNBytes
+
+    def contains(self, path: PathType, nBytes: Optional[int] = None) -> bool:
+        """Check if file is cached (with expected number of bytes, if given).
+
+        (neither counting a hit/miss nor marking the file as used,
+        e.g. for checks within a single access, see ``recordAccess``)
+        """
+        path: Path = Path(path)
+
+        with self._lock:
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+
+            try:
+                fileNBytes: Optional[int] = path.stat().st_size
+            except FileNotFoundError:
+                fileNBytes: Optional[int] = None
+
+            if (fileNBytes is not None) and ((nBytes is None) or (fileNBytes == nBytes)):
+                # (also tracking files cached by other processes or by syncing)
+                if path not in filesNBytes:
+                    self._nBytes += fileNBytes
+                    filesNBytes[path] = fileNBytes
+
+                elif filesNBytes[path] != fileNBytes:
+                    self._nBytes += fileNBytes - filesNBytes[path]
+                    filesNBytes[path] = fileNBytes
+
+                return True
+
+            return False
+
+    def recordAccess(self, path: PathType, hit: bool):
+        """Count a hit/miss for a file access, a hit marking the file as most recently used."""
+        path: Path = Path(path)
+
+        with self._lock:
+            if not hit:
+                self._stats.misses += 1
+                return
+
+            self._stats.hits += 1
+
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+            if path in filesNBytes:
+                filesNBytes.move_to_end(path)
+
+            # (updating only access time, for LRU order across processes)
+            try:
+                os.utime(path, times=(time.time(), path.stat().st_mtime))
+            except FileNotFoundError:
+                pass
+
+    def lookup(self, path: PathType, nBytes: Optional[int] = None) -> bool:
+        """Check if file is cached (with expected number of bytes, if given), counting hit/miss.
+
+        A hit marks the file as most recently used.
+        """
+        self.recordAccess(path, hit=(hit := self.contains(path, nBytes=nBytes)))
+        return hit
+
+    def add(self, path: PathType):
+        """Track newly cached file as most recently used, then evict files if over budget."""
+        path: Path = Path(path)
+
+        with self._lock:
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+
+            self._nBytes -= filesNBytes.pop(path, 0)
+
+            filesNBytes[path] = nBytes = path.stat().st_size
+            self._nBytes += nBytes
+
+            self.evict()
+
+    def evict(self):
+        """Delete least-recently-used files pinned by no process until within budget."""
+        if self.maxNBytes is None:
+            return
+
+        with self._lock:
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+
+            for path in list(filesNBytes):
+                if self._nBytes <= self.maxNBytes:
+                    break
+
+                if self._pinCounts[path]:
+                    continue
+
+                # (exclusive locks on pin-lock & lock files, to skip files pinned or being
+                #  downloaded by other processes & to keep them from doing so while deleting)
+                try:
+                    pinLockFile: BinaryIO = self._openLocked(self._pinLockPath(path),
+                                                             fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+
+                with pinLockFile:
+                    try:
+                        lockFile: BinaryIO = self._openLocked(self._lockPath(path),
+                                                              fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue
+
+                    with lockFile:
+                        nBytes: int = filesNBytes.pop(path)
+                        self._nBytes -= nBytes
+
+                        path.unlink(missing_ok=True)
+
+                        # (deleted while locked, others then retrying on new ones if need be)
+                        self._lockPath(path).unlink(missing_ok=True)
+                        self._pinLockPath(path).unlink(missing_ok=True)
+
+                self._stats.evictedNFiles += 1
+                self._stats.evictedNBytes += nBytes
+
+    def remove(self, *paths: PathType):
+        """Delete file(s) from cache (e.g., stale), whether or not tracked."""
+        with self._lock:
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+
+            for path in paths:
+                path: Path = Path(path)
+
+                self._nBytes -= filesNBytes.pop(path, 0)
+
+                path.unlink(missing_ok=True)
+
+                # (pin-lock file no longer needed, e.g. for directory to be removable)
+                self._pinLockPath(path).unlink(missing_ok=True)
+
+    def pin(self, *paths: PathType):
+        """Protect file(s) from eviction by any process (until unpinned as many times)."""
+        with self._lock:
+            for path in paths:
+                path: Path = Path(path)
+
+                if not self._pinCounts[path]:
+                    path.parent.mkdir(mode=0o777, parents=True, exist_ok=True)
+
+                    self._pinLockFiles[path] = self._openLocked(self._pinLockPath(path),
+                                                                fcntl.LOCK_SH)
+
+                self._pinCounts[path] += 1
+
+    def unpin(self, *paths: PathType):
+        """Release file(s) pinned earlier, then evict files if over budget."""
+        with self._lock:
+            for path in paths:
+                path: Path = Path(path)
+
+                self._pinCounts[path] -= 1
+
+                if self._pinCounts[path] <= 0:
+                    del self._pinCounts[path]
+
+                    if (pinLockFile := self._pinLockFiles.pop(path, None)) is not None:
+                        pinLockFile.close()   # (releasing shared lock)
+
+            self.evict()
+
+    @contextmanager
+    def pinned(self, *paths: PathType) -> Iterator[None]:
+        """Protect file(s) from eviction within context."""
+        self.pin(*paths)
+
+        try:
+            yield
+
+        finally:
+            self.unpin(*paths)
+
+    @staticmethod
+    @contextmanager
+    def locked(path: PathType) -> Iterator[None]:
+        """Hold exclusive lock on file path across processes & threads (e.g., to download it).
+
+        (advisory lock on hidden lock file next to the path, released even if process dies,
+        & deleted upon the file's eviction)
+        """
+        path: Path = Path(path)
+
+        path.parent.mkdir(mode=0o777, parents=True, exist_ok=True)
+
+        with LocalFileCache._openLocked(LocalFileCache._lockPath(path),
+                                        fcntl.LOCK_EX) as lockFile:
+            try:
+                yield
+
+            finally:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+
+    @property
+    def stats(self) -> Namespace:
+        """Hits, misses, evicted numbers of files & bytes, and current numbers of files & bytes."""
+        with self._lock:
+            filesNBytes: OrderedDict = self._scannedFilesNBytes()
+
+            return Namespace(**self._stats,
+                             nFiles=len(filesNBytes), nBytes=self._nBytes,
+                             nPinnedFiles=len(self._pinCounts))
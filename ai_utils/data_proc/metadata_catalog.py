@@ -0,0 +1,160 @@
+"""Persistent on-disk catalog of S3 file listings, Parquet file metadata & local copies."""
+
+
+from __future__ import annotations
+
+from contextlib import closing, contextmanager
+import json
+from pathlib import Path
+import sqlite3
+from threading import Lock
+import time
+from typing import Iterator, Optional
+from typing import Dict, List, Set   # Py3.9+: use built-ins
+
+from pyarrow.ipc import read_schema as readSerializedSchema
+from pyarrow.lib import Schema, py_buffer   # pylint: disable=no-name-in-module
+
+from ..fs import PathType
+from ..namespace import Namespace
+
+
+__all__ = ('MetadataCatalog',)
+
+
+# flake8: noqa
+# (too many camelCase names)
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+class MetadataCatalog:
+    """Persistent on-disk catalog of S3 file listings, Parquet file metadata & local copies.
+
+    File metadata (schema, numbers of columns & rows) are keyed by S3 file path & ETag,
+    so that metadata of files since overwritten are never used.
+    Local copies are recorded with the ETags & numbers of bytes downloaded,
+    so that files already cached in the same versions need not be downloaded again.
+    The catalog is an SQLite database, safe for concurrent use by threads & processes.
+    """
+
+    # number of S3 file paths per lookup query
+    # (SQLite limits numbers of query parameters)
+    _LOOKUP_BATCH_SIZE: int = 500
+
+    # database paths whose tables (& WAL journal mode) are initialized, by this process
+    _INITIALIZED_DB_PATHS: Set[Path] = set()
+    _INIT_LOCK: Lock = Lock()
+
+    def __init__(self, dbPath: PathType):
+        """Init Metadata Catalog."""
+        self.dbPath: Path = Path(dbPath)
+
+    def __repr__(self) -> str:
+        """Return string repr."""
+        return f'{type(self).__name__}["{self.dbPath}"]'
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # (connecting per use, as SQLite connections must not be shared across threads/processes)
+        self.dbPath.parent.mkdir(mode=0o777, parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(database=self.dbPath, timeout=60)) as connection:
+            self._initialize(connection)
+
+            with connection:   # (committing upon success, else rolling back)
+                yield connection
+
+    def _initialize(self, connection: sqlite3.Connection):
+        # (once per database path & process, rather than upon every connection)
+        with self._INIT_LOCK:
+            if self.dbPath in self._INITIALIZED_DB_PATHS:
+                return
+
+            with connection:
+                # (journal mode persisting in the database file)
+                connection.execute('PRAGMA journal_mode=WAL')
+
+                connection.execute('CREATE TABLE IF NOT EXISTS listings '
+                                   '(path TEXT PRIMARY KEY, listedAt REAL, filePathsETags TEXT)')
+
+                connection.execute('CREATE TABLE IF NOT EXISTS files '
+                                   '(filePath TEXT, eTag TEXT, nCols INTEGER, nRows INTEGER, '
+                                   'schema BLOB, PRIMARY KEY (filePath, eTag))')
+
+                connection.execute('CREATE TABLE IF NOT EXISTS localCopies '
+                                   '(localPath TEXT PRIMARY KEY, eTag TEXT, nBytes INTEGER)')
+
+            self._INITIALIZED_DB_PATHS.add(self.dbPath)
+
+    def listing(self, path: str, maxAge: Optional[float] = None) -> Optional[Dict[str, str]]:
+        """Get catalogued file paths & ETags under S3 path, if listed within ``maxAge`` seconds."""
+        with self._connection() as connection:
+            row: Optional[tuple] = connection.execute(
+                'SELECT listedAt, filePathsETags FROM listings WHERE path = ?', (path,)).fetchone()
+
+        if (row is None) or ((maxAge is not None) and (time.time() - row[0] > maxAge)):
+            return None
+
+        return json.loads(row[1])
+
+    def putListing(self, path: str, filePathsETags: Dict[str, str]):
+        """Catalog file paths & ETags listed under S3 path."""
+        with self._connection() as connection:
+            connection.execute('INSERT OR REPLACE INTO listings VALUES (?, ?, ?)',
+                               (path, time.time(), json.dumps(filePathsETags)))
+
+    def filesMetadata(self, filePathsETags: Dict[str, Optional[str]]) -> Dict[str, Namespace]:
+        """Get catalogued metadata of files with matching ETags (files without ETags skipped)."""
+        filePaths: List[str] = [filePath for filePath, eTag in filePathsETags.items() if eTag]
+
+        filesMetadata: Dict[str, Namespace] = {}
+
+        with self._connection() as connection:
+            for i in range(0, len(filePaths), self._LOOKUP_BATCH_SIZE):
+                batchFilePaths: List[str] = filePaths[i:(i + self._LOOKUP_BATCH_SIZE)]
+
+                for filePath, eTag, nCols, nRows, schema in connection.execute(
+                        'SELECT filePath, eTag, nCols, nRows, schema FROM files '
+                        f"WHERE filePath IN ({', '.join('?' * len(batchFilePaths))})",
+                        batchFilePaths):
+                    if eTag == filePathsETags[filePath]:
+                        filesMetadata[filePath] = \
+                            Namespace(nCols=nCols, nRows=nRows,
+                                      schema=readSerializedSchema(py_buffer(schema)))
+
+        return filesMetadata
+
+    def putFileMetadata(self, filePath: str, eTag: Optional[str],
+                        schema: Schema, nCols: int, nRows: int):
+        """Catalog file metadata (unless ETag unknown), replacing those of other ETags."""
+        if not eTag:
+            return
+
+        with self._connection() as connection:
+            connection.execute('DELETE FROM files WHERE filePath = ?', (filePath,))
+
+            connection.execute('INSERT INTO files VALUES (?, ?, ?, ?, ?)',
+                               (filePath, eTag, nCols, nRows, schema.serialize().to_pybytes()))
+
+    def localCopy(self, localPath: PathType) -> Optional[Namespace]:
+        """Get ETag & number of bytes of file version last downloaded to local path, if any."""
+        with self._connection() as connection:
+            row: Optional[tuple] = connection.execute(
+                'SELECT eTag, nBytes FROM localCopies WHERE localPath = ?',
+                (str(localPath),)).fetchone()
+
+        return None if row is None else Namespace(eTag=row[0], nBytes=row[1])
+
+    def putLocalCopy(self, localPath: PathType, eTag: str, nBytes: int):
+        """Record ETag & number of bytes of file version downloaded to local path."""
+        with self._connection() as connection:
+            connection.execute('INSERT OR REPLACE INTO localCopies VALUES (?, ?, ?)',
+                               (str(localPath), eTag, nBytes))
+
+    def removeLocalCopies(self, *localPaths: PathType):
+        """Forget local copies (e.g., deleted)."""
+        with self._connection() as connection:
+            connection.executemany('DELETE FROM localCopies WHERE localPath = ?',
+                                   [(str(localPath),) for localPath in localPaths])
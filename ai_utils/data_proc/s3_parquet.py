@@ -3,49 +3,74 @@
 
 from __future__ import annotations
 
+import ast
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
 import datetime
-from functools import lru_cache, partial
-from itertools import chain
+from functools import lru_cache, partial, reduce as foldLeft
+from itertools import chain, islice
 from logging import Logger
 import math
+from multiprocessing import get_context as getMultiprocessingContext
+import operator
+import os
 from pathlib import Path
 import random
 import re
+from threading import RLock
 import time
-from typing import Any, Optional, Union
-from typing import Collection, Dict, List, Set, Tuple   # Py3.9+: use built-ins
+from typing import Any, Callable, Iterator, Optional, Union
+from typing import Collection, Deque, Dict, FrozenSet, List, Set, Tuple   # Py3.9+: use built-ins
 from urllib.parse import ParseResult, urlparse
 from uuid import uuid4
 from warnings import simplefilter
-
-from numpy import isfinite, ndarray, vstack
-from pandas import DataFrame, Series, concat, isnull, notnull, read_parquet
+from weakref import finalize
+
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from numpy import dtype as numpyDType, empty, isfinite, ndarray, vstack, zeros
+from numpy.lib.format import open_memmap
+from pandas import (DataFrame, Series, concat, isnull, notnull, read_parquet,
+                    BooleanDtype, Float32Dtype, Float64Dtype, StringDtype,
+                    Int8Dtype, Int16Dtype, Int32Dtype, Int64Dtype,
+                    UInt8Dtype, UInt16Dtype, UInt32Dtype, UInt64Dtype)
 from pandas.errors import PerformanceWarning
 from pandas._libs.missing import NAType   # pylint: disable=no-name-in-module
 from tqdm import tqdm
 
-from pyarrow.dataset import dataset
-from pyarrow.fs import S3FileSystem
-from pyarrow.lib import RecordBatch, Schema, Table   # pylint: disable=no-name-in-module
-from pyarrow.parquet import FileMetaData, read_metadata, read_schema, read_table
+from pyarrow.dataset import Expression, field, scalar
+from pyarrow.feather import read_table as readFeather, write_feather
+from pyarrow.fs import FileSystem, S3FileSystem
+from pyarrow.ipc import IpcWriteOptions, RecordBatchFileWriter, open_file as openIPCFile
+from pyarrow.lib import (RecordBatch, Schema, Table,   # pylint: disable=no-name-in-module
+                         ArrowException, BufferOutputStream, BufferReader, ChunkedArray,
+                         array as arrowArray, concat_tables, from_numpy_dtype, nulls,
+                         schema as makeArrowSchema)
+from pyarrow.parquet import (FileMetaData, ParquetFile,
+                             read_metadata, read_table, write_metadata)
 
 from .. import debug, s3
 from ..data_types.arrow import (
     DataType, _ARROW_STR_TYPE, _ARROW_DATE_TYPE,
-    is_binary, is_boolean, is_num, is_possible_cat, is_possible_feature, is_string)
+    bool_, float32, float64, int8, int16, int32, int64, string, uint8, uint16, uint32, uint64,
+    is_binary, is_boolean, is_floating, is_integer, is_num, is_possible_cat, is_possible_feature,
+    is_string)
 from ..data_types.numpy_pandas import NUMPY_FLOAT_TYPES, NUMPY_INT_TYPES
 from ..data_types.python import PY_NUM_TYPES, PyNumType, PyPossibleFeatureType, PY_LIST_OR_TUPLE
 from ..default_dict import DefaultDict
-from ..fs import mkdir
 from ..iter import to_iterable
 from ..namespace import Namespace, DICT_OR_NAMESPACE_TYPES
 
 from ._abstract import (AbstractDataHandler, AbstractFileDataHandler, AbstractS3FileDataHandler,
                         ColsType, ReducedDataSetType)
+from .metadata_catalog import MetadataCatalog
 from .pandas import PandasMLPreprocessor
 
 
-__all__ = ('S3ParquetDataFeeder',)
+__all__ = 'Combiner', 'S3ParquetDataFeeder'
 
 
 # flake8: noqa
@@ -72,14 +97,195 @@ __all__ = ('S3ParquetDataFeeder',)
 simplefilter(action="ignore", category=PerformanceWarning)
 
 
+# row filter pushed down into file reads:
+# True / False, (comparison op, col, value) or ('and' / 'or', (row filter, ...))
+RowFilterType = Union[bool, Tuple]
+
+
 def randomSample(population: Collection[Any], sampleSize: int,
                  returnCollectionType=set) -> Collection[Any]:
     """Draw random sample from population."""
-    return returnCollectionType(random.sample(population=population, k=sampleSize)
+    # (sets not accepted as populations by Python 3.11+'s random.sample)
+    return returnCollectionType(random.sample(
+                                    population=(tuple(population)
+                                                if isinstance(population, (set, frozenset))
+                                                else population),
+                                    k=sampleSize)
                                 if len(population) > sampleSize
                                 else population)
 
 
+# Arrow types -> Pandas nullable dtypes, as by `read_parquet(..., use_nullable_dtypes=True)`
+_ARROW_TO_PANDAS_NULLABLE_DTYPES: Dict[DataType, Any] = {
+    int8(): Int8Dtype(), int16(): Int16Dtype(), int32(): Int32Dtype(), int64(): Int64Dtype(),
+    uint8(): UInt8Dtype(), uint16(): UInt16Dtype(), uint32(): UInt32Dtype(),
+    uint64(): UInt64Dtype(),
+    bool_(): BooleanDtype(),
+    string(): StringDtype(),
+    float32(): Float32Dtype(), float64(): Float64Dtype()}
+
+
+def _arrowToPandas(arrowObj: Union[RecordBatch, Table],
+                   nullableDTypes: bool = False) -> DataFrame:
+    """Convert Arrow Record Batch or Table to Pandas Data Frame.
+
+    (if ``nullableDTypes``, with the same dtypes as Parquet files read by Pandas)
+    """
+    # arrow.apache.org/docs/python/generated/pyarrow.RecordBatch.html
+    # #pyarrow.RecordBatch.to_pandas
+    return arrowObj.to_pandas(
+        memory_pool=None,
+        categories=None,
+        strings_to_categorical=False,
+        zero_copy_only=False,
+
+        integer_object_nulls=False,
+        # TODO: check
+        # (bool, default False) –
+        # Cast integers with nulls to objects
+
+        date_as_object=True,
+        # TODO: check
+        # (bool, default True) –
+        # Cast dates to objects.
+        # If False, convert to datetime64[ns] dtype.
+
+        timestamp_as_object=False,
+        use_threads=True,
+
+        deduplicate_objects=True,
+        # TODO: check
+        # (bool, default False) –
+        # Do not create multiple copies Python objects when created,
+        # to save on memory use. Conversion will be slower.
+
+        ignore_metadata=False,
+        safe=True,
+
+        split_blocks=True,
+        # TODO: check
+        # (bool, default False) –
+        # If True, generate one internal “block”
+        # for each column when creating a pandas.DataFrame
+        # from a RecordBatch or Table.
+        # While this can temporarily reduce memory
+        # note that various pandas operations can
+        # trigger “consolidation” which may balloon memory use.
+
+        self_destruct=True,
+        # TODO: check
+        # EXPERIMENTAL: If True, attempt to deallocate
+        # the originating Arrow memory while
+        # converting the Arrow object to pandas.
+        # If you use the object after calling to_pandas
+        # with this option it will crash your program.
+        # Note that you may not see always memory usage improvements.
+        # For example, if multiple columns share
+        # an underlying allocation, memory can’t be freed
+        # until all columns are converted.
+
+        types_mapper=_ARROW_TO_PANDAS_NULLABLE_DTYPES.get if nullableDTypes else None)
+
+
+@dataclass(init=True,
+           repr=True,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class Combiner:
+    """Incremental reducer folding per-file results into an accumulator as they come.
+
+    - ``initial``: initial accumulator value (must be an identity for ``merge``)
+    - ``combine(acc, partial)``: fold a per-file result into an accumulator,
+    returning the new accumulator (without mutating ``initial``)
+    - ``merge(acc1, acc2)`` *(optional)*: merge 2 accumulators,
+    enabling parallel workers to pre-aggregate their own files before merging
+    """
+
+    initial: Any
+    combine: Callable[[Any, Any], Any]
+    merge: Optional[Callable[[Any, Any], Any]] = None
+
+
+@dataclass(init=True,
+           repr=False,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class _PartitionKeyIndex:
+    """Sorted index of files by values of a partition key, for filtering by binary search.
+
+    - ``sortedValues``: distinct partition-key values (as strings), sorted
+    - ``filePathSets``: paths of files having each of those values, aligned with them
+    """
+
+    sortedValues: Tuple[str]
+    filePathSets: Tuple[FrozenSet[str]]
+
+    def filePathsInRange(self, fromVal: Optional[str] = None,
+                         toVal: Optional[str] = None) -> Set[str]:
+        """Paths of files with values between ``fromVal`` & ``toVal`` (inclusive)."""
+        return set().union(*self.filePathSets[
+            (0 if fromVal is None else bisect_left(self.sortedValues, fromVal)):
+            (len(self.sortedValues) if toVal is None
+             else bisect_right(self.sortedValues, toVal))])
+
+    def filePathsIn(self, values: Collection[str]) -> Set[str]:
+        """Paths of files with values among given ones."""
+        return set().union(*(self.filePathSets[i]
+                             for v in values
+                             if ((i := bisect_left(self.sortedValues, v))
+                                 < len(self.sortedValues)) and (self.sortedValues[i] == v)))
+
+
+@dataclass(init=True,
+           repr=False,
+           eq=True,
+           order=False,
+           unsafe_hash=False,
+           frozen=True)
+class _PlanNode:
+    """Logical-plan node recorded by a ``map`` call, optimized before files are read.
+
+    - ``op``: ``'project'`` (``__getitem__``), ``'filter'``, ``'cast'`` (``castType``),
+    ``'preprocess'`` or ``'map'`` (opaque mapper(s))
+    - ``arg``: projected column(s), filtering condition, columns-to-types, or ``None``
+    - ``mappers``: function(s) applying the node to each file's content
+    - ``inputCols`` / ``passThrough`` / ``reduceMustInclCols``: as per ``map``'s arguments
+    - ``rowFilter``: row filter pushed down into file reads, if any
+    """
+
+    op: str
+    arg: Any
+    mappers: Tuple[callable]
+    inputCols: Optional[FrozenSet[str]] = None
+    passThrough: bool = True
+    reduceMustInclCols: FrozenSet[str] = frozenset()
+    rowFilter: Optional[RowFilterType] = None
+
+    def __str__(self) -> str:
+        """Return string repr."""
+        if self.op == 'project':
+            argStr: str = (self.arg
+                           if isinstance(self.arg, str)
+                           else ', '.join(to_iterable(self.arg, iterable_type=list)))
+
+        elif self.op == 'cast':
+            argStr: str = ', '.join(f'{col}: {colType}' for col, colType in self.arg.items())
+
+        elif self.op == 'filter':
+            argStr: str = self.arg + (' (pushed down)' if self.rowFilter is not None else '')
+
+        else:
+            argStr: str = ', '.join(getattr(func := getattr(mapper, 'func', mapper),
+                                            '__name__', type(func).__name__)
+                                    for mapper in self.mappers)
+
+        return f'{self.op.capitalize()}[{argStr}]'
+
+
 class S3ParquetDataFeeder(AbstractS3FileDataHandler):
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """S3 Parquet Data Feeder."""
@@ -88,6 +294,56 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
     _CACHE: Dict[str, Namespace] = {}
     _FILE_CACHES: Dict[str, Namespace] = {}
 
+    # ETags of listed files, for building their caches lazily upon their first use
+    _LISTED_FILE_ETAGS: Dict[str, Optional[str]] = {}
+
+    # last-modified times of listed files (unknown if listings reused from catalog),
+    # for trusting summary files' metadata only of files not modified since
+    _LISTED_FILE_LAST_MODIFIED: Dict[str, datetime.datetime] = {}
+
+    # metadata (schemas, numbers of columns & rows) of files loaded from summary files
+    _SUMMARIZED_FILES_METADATA: Dict[str, Namespace] = {}
+
+    # lock on data sets' columns & types, extended as file caches are built
+    # (e.g., by prefetching & downloading threads)
+    _SCHEMA_LOCK: RLock = RLock()
+
+    # whether to load data sets' Parquet summary files (`_metadata`, else `_common_metadata`),
+    # e.g. written by Spark, to get all files' metadata (or common schema) from 1 object
+    # instead of reading files' footers
+    _USE_SUMMARY_METADATA: bool = True
+
+    # number of bytes at end of file to fetch speculatively for reading Parquet metadata
+    # (footers larger than this, e.g. of files with very many row groups, need another request)
+    _FOOTER_FETCH_N_BYTES: int = 64 * 1024
+
+    # whether to list data sets by first listing first-level partition directories,
+    # then listing those concurrently (instead of by 1 sequential paginated listing)
+    _LIST_SHARDED: bool = False
+
+    # maximum number of partition directories listed concurrently by sharded listing
+    _LIST_MAX_N_CONCURRENT_PREFIXES: int = 32
+
+    # maximum number of files downloaded concurrently by cacheLocally(...)
+    _SYNC_MAX_N_CONCURRENT_FILES: int = 8
+
+    # boto3 transfer settings for downloading each file
+    # (files above multipart threshold downloaded by concurrent ranged GETs of chunk size)
+    _DOWNLOAD_TRANSFER_CONFIG: TransferConfig = TransferConfig(multipart_threshold=2 ** 23,
+                                                               multipart_chunksize=2 ** 23,
+                                                               max_concurrency=10,
+                                                               use_threads=True)
+
+    # persistent catalog of S3 listings & file metadata, shared across processes
+    # (None: disabled)
+    _METADATA_CATALOG: Optional[MetadataCatalog] = MetadataCatalog(
+        dbPath=AbstractFileDataHandler._LOCAL_CACHE_DIR_PATH / '.metadata-catalog.sqlite3')
+
+    # maximum age (in seconds) of catalogued S3 listings to reuse instead of re-listing
+    # (files added/changed since then only seen once listings expire;
+    # None: always re-list, still reusing catalogued metadata of files with unchanged ETags)
+    _CATALOG_LISTING_MAX_AGE: Optional[float] = 15 * 60
+
     # default arguments dict
     # (cannot be ai_utils.namespace.Namespace
     # because that makes nested dicts into normal dicts)
@@ -104,12 +360,107 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
         minProportionByMaxNCats=DefaultDict(
             AbstractDataHandler._DEFAULT_MIN_PROPORTION_BY_MAX_N_CATS))
 
+    # default parallel execution settings for reduce(...)
+    # (executor: 'thread' (mappers then having to be thread-safe),
+    #  'process' (mappers then having to be picklable) or None for serial;
+    #  maxWorkers: None for executor's default)
+    _REDUCE_EXECUTOR: Optional[str] = None
+    _REDUCE_MAX_N_WORKERS: Optional[int] = None
+
+    # default prefetching settings for reduce(...)
+    # (prefetch: number of concurrent downloads, or None for downloading within mapping workers;
+    #  prefetchAhead: maximum number of files being or having been downloaded but not yet mapped,
+    #  or None for twice the number of concurrent downloads)
+    _REDUCE_PREFETCH: Optional[int] = None
+    _REDUCE_PREFETCH_AHEAD: Optional[int] = None
+
+    # start method of reduce(...) worker processes
+    # (not forking this process, whose prefetching / download threads may be running)
+    _PROCESS_START_METHOD: str = 'forkserver'
+
+    # whether reduce(...) memory-maps locally-cached files
+    # (sharing the OS page cache among worker processes
+    #  instead of copying file bytes into each one's Arrow heap)
+    _REDUCE_MEMORY_MAP: bool = True
+
+    # whether reduce(...) reads only requested column chunks directly from S3
+    # (by coalesced ranged reads) instead of from downloaded, locally-cached files
+    _REDUCE_REMOTE: bool = False
+
+    # whether reduce(...) reads from hot-cache tier of locally-cached files re-encoded into
+    # Arrow IPC (Feather v2) files (created upon first access), memory-mapped with zero copy
+    # (for data sets scanned so often that Parquet decoding & decompression costs dominate)
+    _REDUCE_HOT_CACHE: bool = False
+
+    # sub-directory of local cache directory for hot-cache tier
+    # (not a possible S3 bucket name)
+    _HOT_CACHE_DIR_NAME: str = '_hot-cache'
+
+    # compression of hot-cache files: None for zero-copy reads, or 'lz4' / 'zstd' for less disk
+    _HOT_CACHE_COMPRESSION: Optional[str] = None
+
+    # hot-cache file schema metadata key for version (ETag, or else size) of file re-encoded
+    _HOT_CACHE_SOURCE_METADATA_KEY: bytes = b'ai_utils.hotCacheSource'
+
+    # sub-directory of local cache directory for reduce(...) results spilled to disk
+    # (not hidden, so that spill files count towards local cache's budget)
+    _SPILL_DIR_NAME: str = '_spill'
+
+    # reduce(...) keyword arguments to pass through from profiling methods
+    _REDUCE_EXEC_KWARGS: Tuple[str] = ('executor', 'maxWorkers',
+                                       'prefetch', 'prefetchAhead',
+                                       'memoryMap', 'remote', 'hotCache')
+
+    # filter(...) condition comparisons translatable into row filters pushed down into file reads
+    _ROW_FILTER_CMP_OPS: Dict[type, str] = {ast.Eq: '==', ast.NotEq: '!=',
+                                            ast.Lt: '<', ast.LtE: '<=',
+                                            ast.Gt: '>', ast.GtE: '>=',
+                                            ast.In: 'in', ast.NotIn: 'not in'}
+    _ROW_FILTER_FLIPPED_CMP_OPS: Dict[str, str] = {'==': '==', '!=': '!=',
+                                                   '<': '>', '<=': '>=',
+                                                   '>': '<', '>=': '<='}
+    _ROW_FILTER_CMP_FUNCS: Dict[str, Callable[[Any, Any], bool]] = {
+        '==': operator.eq, '!=': operator.ne,
+        '<': operator.lt, '<=': operator.le,
+        '>': operator.gt, '>=': operator.ge,
+        'in': lambda v, values: v in values, 'not in': lambda v, values: v not in values}
+
+    # row filter comparisons whose Arrow expressions keep nulls,
+    # which Pandas filters out or not depending on column dtypes (hence not exact)
+    _ROW_FILTER_NULL_KEEPING_OPS: Tuple[str] = ('!=', 'not in')
+
     def __init__(self, path: str, *, awsRegion: Optional[str] = None,
                  _mappers: Optional[callable] = None,
+                 _plan: Optional[Tuple[_PlanNode]] = None,
                  _reduceMustInclCols: Optional[ColsType] = None,
+                 _rowFilters: Optional[Tuple[RowFilterType]] = None,
+                 _rowFiltersPushable: Optional[bool] = None,
+                 partitionRange: Optional[Tuple[str, Optional[str], Optional[str]]] = None,
+                 shardedListing: Optional[bool] = None,
+                 warm: bool = False,
                  verbose: bool = True, **kwargs: Any):
-        # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-        """Init S3 Parquet Data Feeder."""
+        # pylint: disable=too-many-arguments,too-many-branches,too-many-locals
+        # pylint: disable=too-many-statements
+        """Init S3 Parquet Data Feeder.
+
+        If ``shardedListing`` (default: ``_LIST_SHARDED``), first-level partition directories
+        (e.g. ``date=...``) are listed first, then listed concurrently.
+        ``partitionRange``, e.g. ``('date', '2022-01-01', '2022-12-31')``
+        (inclusive; either end possibly ``None``), limits listing (then sharded) to
+        first-level partition directories within that range, for data sets with very many files.
+
+        Upon listing, only the first few files' schemas are probed (concurrently);
+        other files' partition keys, metadata & types are parsed & checked upon their first use.
+        Listing & schema-probing durations are recorded in ``constructionTimings``.
+
+        Listings are catalogued persistently (see ``_METADATA_CATALOG``) & reused, also by
+        restarted processes, for up to ``_CATALOG_LISTING_MAX_AGE`` seconds (default: 15 minutes;
+        set it to ``None`` to always re-list, e.g. for data sets being written to).
+
+        If ``warm``, files to be read first by profiling (i.e., preliminary representative
+        sample & schema-probe files) start being downloaded in the background
+        (see ``warmLocalCache``).
+        """
         if verbose or debug.ON:
             logger: Logger = self.classStdOutLogger()
 
@@ -119,14 +470,27 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
         self.awsRegion: Optional[str] = awsRegion
 
-        if path in self._CACHE:
-            _cache: Namespace = self._CACHE[path]
+        self.partitionRange: Optional[Tuple[str, Optional[str], Optional[str]]] = (
+            None if partitionRange is None else tuple(partitionRange))
+
+        if self.partitionRange is not None:
+            assert len(self.partitionRange) == 3, \
+                ValueError('*** partitionRange MUST BE (<colName>, <fromVal>, <toVal>) ***')
+
+        # key of data set's cache (& catalogued listing), distinguishing partition ranges
+        self._cacheKey: str = (path
+                               if self.partitionRange is None
+                               else (f'{path}[{self.partitionRange[0]}='
+                                     f'{self.partitionRange[1]}..{self.partitionRange[2]}]'))
+
+        if self._cacheKey in self._CACHE:
+            _cache: Namespace = self._CACHE[self._cacheKey]
         else:
-            self._CACHE[path] = _cache = Namespace()
+            self._CACHE[self._cacheKey] = _cache = Namespace()
 
         if _cache:
             if debug.ON:
-                logger.debug(msg=f'*** RETRIEVING CACHE FOR "{path}" ***')
+                logger.debug(msg=f'*** RETRIEVING CACHE FOR "{self._cacheKey}" ***')
 
         else:
             _parsedURL: ParseResult = urlparse(url=path, scheme='', allow_fragments=True)
@@ -135,156 +499,130 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
             _cache.tmpDirPath = f's3://{_cache.s3Bucket}/{self._TMP_DIR_S3_KEY}'
 
+            tic: float = time.time()
+
             if path in self._FILE_CACHES:
                 _cache.nFiles = 1
                 _cache.filePaths = {path}
 
-            else:
-                if verbose:
-                    logger.info(msg=(msg := f'Loading "{path}" by Arrow...'))
-                    tic: float = time.time()
-
-                s3.rm(path=path,
-                      is_dir=True,
-                      globs='*_$folder$',   # redundant AWS EMR-generated files
-                      quiet=True,
-                      verbose=False)
-
-                _cache._srcArrowDS = dataset(source=path.replace('s3://', ''),
-                                             schema=None,
-                                             format='parquet',
-                                             filesystem=S3FileSystem(region=awsRegion),
-                                             partitioning=None,
-                                             partition_base_dir=None,
-                                             exclude_invalid_files=None,
-                                             ignore_prefixes=None)
-
-                if verbose:
-                    toc: float = time.time()
-                    logger.info(msg=f'{msg} done!   <{toc - tic:,.1f} s>')
-
-                if _filePaths := _cache._srcArrowDS.files:
-                    _cache.filePaths = {f's3://{filePath}'
-                                        for filePath in _filePaths
-                                        if not filePath.endswith('_$folder$')}
-                    _cache.nFiles = len(_cache.filePaths)
-
-                else:
-                    _cache.nFiles = 1
-                    _cache.filePaths = {path}
-
-            _cache.srcColsInclPartitionKVs = set()
-            _cache.srcTypesInclPartitionKVs = Namespace()
-
-            for i, filePath in enumerate(_cache.filePaths):
-                if filePath in self._FILE_CACHES:
-                    fileCache: Namespace = self._FILE_CACHES[filePath]
+                filePathsETags: Dict[str, Optional[str]] = {}
 
-                    if (fileCache.nRows is None) and (i < self._SCHEMA_MIN_N_FILES):
-                        fileCache.localPath = self.fileLocalPath(filePath=filePath)
-
-                        schema: Schema = read_schema(where=fileCache.localPath)
-
-                        fileCache.srcColsExclPartitionKVs = (set(schema.names)
-                                                             - {'__index_level_0__'})
-
-                        fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
-
-                        for col in (fileCache.srcColsExclPartitionKVs
-                                    .difference(fileCache.partitionKVs)):
-                            fileCache.srcTypesExclPartitionKVs[col] = \
-                                fileCache.srcTypesInclPartitionKVs[col] = \
-                                schema.field(col).type
+            else:
+                if (self._METADATA_CATALOG is not None) and \
+                        (self._CATALOG_LISTING_MAX_AGE is not None) and \
+                        (_catalogedFilePathsETags := self._METADATA_CATALOG.listing(
+                            path=self._cacheKey, maxAge=self._CATALOG_LISTING_MAX_AGE)):
+                    if verbose:
+                        logger.info(msg=f'Reusing Catalogued Listing of "{self._cacheKey}"')
 
-                        metadata: FileMetaData = read_metadata(where=fileCache.localPath)
-                        fileCache.nCols = metadata.num_columns
-                        fileCache.nRows = metadata.num_rows
+                    filePathsETags: Dict[str, Optional[str]] = _catalogedFilePathsETags
 
                 else:
-                    srcColsInclPartitionKVs: Set[str] = set()
-
-                    srcTypesExclPartitionKVs: Namespace = Namespace()
-                    srcTypesInclPartitionKVs: Namespace = Namespace()
-
-                    partitionKVs: Dict[str, Union[datetime.date, str]] = {}
-
-                    for partitionKV in re.findall(pattern='[^/]+=[^/]+/', string=filePath):
-                        k, v = partitionKV.split(sep='=', maxsplit=1)
+                    if verbose:
+                        logger.info(msg=(msg := f'Listing "{self._cacheKey}"...'))
 
-                        srcColsInclPartitionKVs.add(k)
+                    if (self.partitionRange is not None) or \
+                            (self._LIST_SHARDED if shardedListing is None else shardedListing):
+                        filePathsETags: Dict[str, Optional[str]] = \
+                            self._listFilePathsETagsSharded(path,
+                                                            partitionRange=self.partitionRange)
 
-                        if k == self._DATE_COL:
-                            srcTypesInclPartitionKVs[k] = _ARROW_DATE_TYPE
-                            partitionKVs[k] = datetime.datetime.strptime(v[:-1], '%Y-%m-%d').date()
+                    else:
+                        # (not when sharding, as this sequentially lists the whole data set)
+                        s3.rm(path=path,
+                              is_dir=True,
+                              globs='*_$folder$',   # redundant AWS EMR-generated files
+                              quiet=True,
+                              verbose=False)
 
-                        else:
-                            srcTypesInclPartitionKVs[k] = _ARROW_STR_TYPE
-                            partitionKVs[k] = v[:-1]
+                        filePathsETags: Dict[str, Optional[str]] = self._listFilePathsETags(path)
 
-                    if i < self._SCHEMA_MIN_N_FILES:
-                        localPath: Path = self.fileLocalPath(filePath=filePath)
+                    assert filePathsETags, \
+                        FileNotFoundError(f'*** NO FILES IN "{self._cacheKey}" ***')
 
-                        schema: Schema = read_schema(where=localPath)
+                    if self._METADATA_CATALOG is not None:
+                        self._METADATA_CATALOG.putListing(path=self._cacheKey,
+                                                          filePathsETags=filePathsETags)
 
-                        srcColsExclPartitionKVs: Set[str] = (set(schema.names)
-                                                             - {'__index_level_0__'})
+                    if verbose:
+                        toc: float = time.time()
+                        logger.info(msg=f'{msg} done!   <{toc - tic:,.1f} s>')
 
-                        srcColsInclPartitionKVs.update(srcColsExclPartitionKVs)
+                _cache.filePaths = set(filePathsETags)
+                _cache.nFiles = len(_cache.filePaths)
 
-                        for col in srcColsExclPartitionKVs.difference(partitionKVs):
-                            srcTypesExclPartitionKVs[col] = \
-                                srcTypesInclPartitionKVs[col] = \
-                                schema.field(col).type
+            # (for building file caches lazily, upon files' first use: see _fileCaches)
+            self._LISTED_FILE_ETAGS.update(filePathsETags)
 
-                        metadata: FileMetaData = read_metadata(where=localPath)
-                        nCols: int = metadata.num_columns
-                        nRows: int = metadata.num_rows
+            listingToc: float = time.time()
 
-                    else:
-                        localPath: Optional[Path] = None
+            _cache.srcColsInclPartitionKVs = set()
+            _cache.srcTypesInclPartitionKVs = Namespace()
 
-                        srcColsExclPartitionKVs: Optional[Set[str]] = None
+            _cache.cachedLocally = False
 
-                        nCols: Optional[int] = None
-                        nRows: Optional[int] = None
+            # (preliminary representative sample shared by all feeders of data set,
+            # e.g. derived by `map` / `filter` / `[...]`: see prelimReprSampleFilePaths)
+            _cache.prelimReprSampleFilePaths = None
 
-                    self._FILE_CACHES[filePath] = fileCache = \
-                        Namespace(localPath=localPath,
+            # (data set's columns & types to be extended by files' as their schemas are read)
+            self.__dict__.update(_cache)
 
-                                  partitionKVs=partitionKVs,
+            # load summary file if any, so that files' metadata need not be read from footers
+            summarySchema: Optional[Schema] = (
+                self._loadSummaryMetadata(verbose=verbose)
+                if self._USE_SUMMARY_METADATA and (_cache.filePaths != {path})
+                else None)
 
-                                  srcColsExclPartitionKVs=srcColsExclPartitionKVs,
-                                  srcColsInclPartitionKVs=srcColsInclPartitionKVs,
+            # probe schemas of first few files concurrently (unless schema summarized),
+            # leaving other files' partition keys, metadata & types for upon their first use
+            schemaProbeFilePaths: Tuple[str] = tuple(islice(_cache.filePaths,
+                                                            0
+                                                            if summarySchema is not None
+                                                            else self._SCHEMA_MIN_N_FILES))
 
-                                  srcTypesExclPartitionKVs=srcTypesExclPartitionKVs,
-                                  srcTypesInclPartitionKVs=srcTypesInclPartitionKVs,
+            if verbose and schemaProbeFilePaths:
+                logger.info(msg=(msg := f'Probing Schemas of {len(schemaProbeFilePaths):,} '
+                                        'File(s)...'))
 
-                                  nCols=nCols, nRows=nRows)
+            self._probeFileSchemas(schemaProbeFilePaths)
 
-                _cache.srcColsInclPartitionKVs |= fileCache.srcColsInclPartitionKVs
+            toc: float = time.time()
 
-                for col, arrowType in fileCache.srcTypesInclPartitionKVs.items():
-                    if col in _cache.srcTypesInclPartitionKVs:
-                        assert arrowType == _cache.srcTypesInclPartitionKVs[col], \
-                            TypeError(f'*** {filePath} COLUMN {col}: '
-                                      f'DETECTED TYPE {arrowType} != '
-                                      f'{_cache.srcTypesInclPartitionKVs[col]} ***')
-                    else:
-                        _cache.srcTypesInclPartitionKVs[col] = arrowType
+            if verbose and schemaProbeFilePaths:
+                logger.info(msg=f'{msg} done!   <{toc - listingToc:,.1f} s>')
 
-            _cache.cachedLocally = False
+            # construction timings (in seconds), e.g. for diagnosing slow construction
+            _cache.constructionTimings = Namespace(listing=listingToc - tic,
+                                                   schemaProbing=toc - listingToc,
+                                                   total=toc - tic)
 
         self.__dict__.update(_cache)
 
-        self._mappers: Tuple[callable] = (()
-                                          if _mappers is None
-                                          else to_iterable(_mappers, iterable_type=tuple))
+        # logical plan of mappers (opaque ones, if given as such, reading all columns),
+        # optimized upon reading (see ``_optimizedPlan``)
+        self._plan: Tuple[_PlanNode] = (
+            tuple(_plan)
+            if _plan is not None
+            else tuple(_PlanNode(op='map', arg=None, mappers=(mapper,))
+                       for mapper in (() if _mappers is None
+                                      else to_iterable(_mappers, iterable_type=tuple))))
+
+        self._mappers: Tuple[callable] = tuple(chain.from_iterable(node.mappers
+                                                                   for node in self._plan))
 
         self._reduceMustInclCols: Set[str] = (set()
                                               if _reduceMustInclCols is None
                                               else to_iterable(_reduceMustInclCols,
                                                                iterable_type=set))
 
+        # row filters to push down into file reads, and whether further ones can be
+        # (i.e., whether all mappers so far have only selected rows / columns without changes)
+        self._rowFilters: Tuple[RowFilterType] = () if _rowFilters is None else tuple(_rowFilters)
+        self._rowFiltersPushable: bool = (not self._mappers
+                                          if _rowFiltersPushable is None
+                                          else _rowFiltersPushable)
+
         # extract standard keyword arguments
         self._extractStdKwArgs(kwargs, resetToClassDefaults=True, inplace=True)
 
@@ -294,6 +632,9 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
         # set profiling settings and create empty profiling cache
         self._emptyCache()
 
+        if warm:
+            self.warmLocalCache(verbose=verbose)
+
     # ===========
     # STRING REPR
     # -----------
@@ -397,9 +738,16 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
     # -------
     # _emptyCache
     # _inheritCache
-    # cacheLocally
-    # fileLocalPath
-    # cacheFileMetadataAndSchema
+    # _listFilePathsETags
+    # cacheLocally / warmLocalCache
+    # _localCachePath / _pinLocalFile / _unpinLocalFile
+    # fileLocalPath / _syncFileLocally
+    # _hotCachePath / _hotCacheFileSource / fileHotCachePath
+    # _fetchFileFooterMetadata / fileMetadata
+    # _loadSummaryMetadata / writeSummaryMetadata
+    # _fileCaches / _fileCache / _mergeFileTypes / _setFileSchema / _setFileMetadata
+    # _probeFileSchemas
+    # cacheFileMetadataAndSchema / _cacheFilesMetadataAndSchemas / _catalogFileMetadata
 
     def _emptyCache(self):
         self._cache: Namespace = \
@@ -455,545 +803,2416 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
                     self._cache.__dict__[cacheCategory][newCol] = \
                         oldS3ParquetDF._cache.__dict__[cacheCategory][oldCol]
 
+    def _listFilePathsETags(self, path: str, subPrefix: str = '') -> Dict[str, str]:
+        """List file paths & ETags under S3 directory path (or of S3 file path).
+
+        As by Arrow datasets, files with path components starting with "." or "_" are ignored.
+
+        (If ``subPrefix`` is given, e.g. a partition directory's, only files under it are listed.)
+        """
+        parsedURL: ParseResult = urlparse(url=path, scheme='', allow_fragments=True)
+
+        dirPrefix: str = f"{_dirKey}/" if (_dirKey := parsedURL.path[1:].rstrip('/')) else ''
+
+        filePathsETags: Dict[str, str] = {}
+
+        for page in self.S3_CLIENT.get_paginator('list_objects_v2').paginate(
+                Bucket=parsedURL.netloc, Prefix=dirPrefix + subPrefix):
+            for s3Obj in page.get('Contents', []):
+                relKey: str = s3Obj['Key'][len(dirPrefix):]
+
+                if relKey and (not relKey.endswith(('/', '_$folder$'))) and \
+                        not any(component.startswith(('.', '_'))
+                                for component in relKey.split('/')):
+                    filePath: str = f's3://{parsedURL.netloc}/{s3Obj["Key"]}'
+
+                    filePathsETags[filePath] = s3Obj['ETag']
+                    self._LISTED_FILE_LAST_MODIFIED[filePath] = s3Obj['LastModified']
+
+        if subPrefix:
+            return filePathsETags
+
+        if not filePathsETags:   # single file
+            filePathsETags[path] = self.S3_CLIENT.head_object(Bucket=parsedURL.netloc,
+                                                              Key=parsedURL.path[1:])['ETag']
+
+        return filePathsETags
+
+    def _listFilePathsETagsSharded(
+            self, path: str,
+            partitionRange: Optional[Tuple[str, Optional[str], Optional[str]]] = None
+            ) -> Dict[str, str]:
+        """List file paths & ETags under S3 directory path, by first-level directories.
+
+        First-level directories (e.g., ``date=...`` partitions) are listed first
+        (by delimited listing, not descending into them), then each listed concurrently.
+        If ``partitionRange`` is given, only first-level partition directories of that key
+        with values within that range (compared as strings, as by ``filterByPartitionKeys``)
+        are listed, ignoring files directly under the path.
+        """
+        parsedURL: ParseResult = urlparse(url=path, scheme='', allow_fragments=True)
+
+        dirPrefix: str = f"{_dirKey}/" if (_dirKey := parsedURL.path[1:].rstrip('/')) else ''
+
+        subPrefixes: List[str] = []
+
+        # (files directly under the path, listed by the same delimited listing)
+        filePathsETags: Dict[str, str] = {}
+
+        for page in self.S3_CLIENT.get_paginator('list_objects_v2').paginate(
+                Bucket=parsedURL.netloc, Prefix=dirPrefix, Delimiter='/'):
+            for commonPrefix in page.get('CommonPrefixes', []):
+                subPrefix: str = commonPrefix['Prefix'][len(dirPrefix):]
+
+                if subPrefix.startswith(('.', '_')):
+                    continue
+
+                if partitionRange is not None:
+                    col, fromVal, toVal = partitionRange
+
+                    assert subPrefix.startswith(f'{col}='), \
+                        ValueError(f'*** "{commonPrefix["Prefix"]}" NOT A FIRST-LEVEL PARTITION '
+                                   f'OF "{col}" AS REQUIRED BY partitionRange ***')
+
+                    v: str = subPrefix[len(col) + 1:-1]
+
+                    if ((fromVal is not None) and (v < str(fromVal))) or \
+                            ((toVal is not None) and (v > str(toVal))):
+                        continue
+
+                subPrefixes.append(subPrefix)
+
+            if partitionRange is None:
+                for s3Obj in page.get('Contents', []):
+                    relKey: str = s3Obj['Key'][len(dirPrefix):]
+
+                    if relKey and (not relKey.endswith('_$folder$')) and \
+                            not relKey.startswith(('.', '_')):
+                        filePath: str = f's3://{parsedURL.netloc}/{s3Obj["Key"]}'
+
+                        filePathsETags[filePath] = s3Obj['ETag']
+                        self._LISTED_FILE_LAST_MODIFIED[filePath] = s3Obj['LastModified']
+
+        if not (subPrefixes or filePathsETags or (partitionRange is not None)):
+            return self._listFilePathsETags(path)   # e.g., single file
+
+        with ThreadPoolExecutor(max_workers=self._LIST_MAX_N_CONCURRENT_PREFIXES) as threadPool:
+            for subPrefixFilePathsETags in threadPool.map(partial(self._listFilePathsETags, path),
+                                                          subPrefixes):
+                filePathsETags.update(subPrefixFilePathsETags)
+
+        return filePathsETags
+
     def cacheLocally(self, verbose: bool = True):
-        """Cache files to local disk."""
-        if not (_cache := self._CACHE[self.path]).cachedLocally:
+        """Cache files to local disk.
+
+        Files are downloaded concurrently (each by concurrent multipart ranged GETs),
+        skipping files already cached locally in the same versions (as per ETags & sizes).
+        Other, stale files previously cached under this data set's path are deleted
+        (unless listing was limited to a partition range).
+        """
+        if not (_cache := self._CACHE[self._cacheKey]).cachedLocally:
             if verbose:
                 self.stdOutLogger.info(msg=(msg := 'Caching Files to Local Disk...'))
                 tic: float = time.time()
 
-            parsedURL: ParseResult = urlparse(url=self.path, scheme='', allow_fragments=True)
+            filePaths: Tuple[str] = tuple(self.filePaths)
 
-            localPath: str = str(self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:])
+            # (building caches of files not yet used, so that all get their local paths recorded)
+            self._fileCaches(filePaths)
 
-            s3.sync(from_dir_path=self.path, to_dir_path=localPath,
-                    delete=True, quiet=True, verbose=True)
+            with ThreadPoolExecutor(max_workers=self._SYNC_MAX_N_CONCURRENT_FILES) as threadPool:
+                filesNBytesDownloaded: Iterator[int] = threadPool.map(self._syncFileLocally,
+                                                                      filePaths)
 
-            for filePath in self.filePaths:
-                self._FILE_CACHES[filePath].localPath = filePath.replace(self.path, localPath)
+                filesNBytesDownloaded: List[int] = list(
+                    tqdm(filesNBytesDownloaded, total=len(filePaths))
+                    if verbose and (len(filePaths) > 1)
+                    else filesNBytesDownloaded)
+
+            # delete stale files (e.g., deleted from S3), as by `aws s3 sync --delete`
+            # (other partitions' files not being stale)
+            if (self.partitionRange is None) and \
+                    (localDirPath := self._localCachePath(filePath=self.path)).is_dir():
+                localPaths: Set[Path] = {self._localCachePath(filePath=filePath)
+                                         for filePath in filePaths}
+
+                if staleLocalPaths := [
+                        localPath
+                        for localPath in localDirPath.rglob('*')
+                        if localPath.is_file() and (localPath not in localPaths) and
+                        not any(part.startswith('.')
+                                for part in localPath.relative_to(localDirPath).parts)]:
+                    self.LOCAL_CACHE.remove(*staleLocalPaths)
+
+                    if self._METADATA_CATALOG is not None:
+                        self._METADATA_CATALOG.removeLocalCopies(*staleLocalPaths)
 
             _cache.cachedLocally = True
 
             if verbose:
                 toc: float = time.time()
-                self.stdOutLogger.info(msg=f'{msg} done!   <{toc - tic:,.1f} s>')
+
+                nFilesDownloaded: int = sum(1 for nBytes in filesNBytesDownloaded if nBytes)
+                nBytesDownloaded: int = sum(filesNBytesDownloaded)
+
+                self.stdOutLogger.info(
+                    msg=f'{msg} done!   <{toc - tic:,.1f} s: '
+                        f'{nFilesDownloaded:,} file(s) downloaded '
+                        f'({nBytesDownloaded / 2 ** 20:,.1f} MiB, '
+                        f'{nBytesDownloaded / 2 ** 20 / max(toc - tic, 1e-6):,.1f} MiB/s), '
+                        f'{len(filePaths) - nFilesDownloaded:,} already cached>')
+
+    def warmLocalCache(self, filePaths: Optional[Collection[str]] = None, *,
+                       verbose: bool = True) -> List[Future]:
+        """Start downloading files into local cache in the background, returning futures.
+
+        By default, the files warmed are those read first by profiling:
+        the preliminary representative sample files (``prelimReprSampleFilePaths``,
+        hence fixed by this call, also for feeders derived by ``map`` / ``filter`` / ``[...]``)
+        & the schema-probe files.
+
+        Later reads of files still being downloaded wait for, then reuse, those downloads.
+        """
+        if filePaths is None:
+            filePaths: Set[str] = (
+                self.prelimReprSampleFilePaths |
+                # (same files as probed for schemas upon listing, i.e. first ones in same order)
+                set(islice(self.filePaths, self._SCHEMA_MIN_N_FILES)))
+
+        if verbose:
+            self.stdOutLogger.info(msg=f'Warming Local Cache with {len(filePaths):,} File(s) '
+                                       'in the Background...')
+
+        threadPool: ThreadPoolExecutor = \
+            ThreadPoolExecutor(max_workers=self._SYNC_MAX_N_CONCURRENT_FILES)
+
+        futures: List[Future] = [threadPool.submit(self.fileLocalPath, filePath=filePath)
+                                 for filePath in filePaths]
+
+        # (not waiting: worker threads exit once all submitted downloads are done)
+        threadPool.shutdown(wait=False)
+
+        return futures
+
+    def _localCachePath(self, filePath: str) -> Path:
+        parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
+        return self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:]
+
+    def _pinLocalFile(self, filePath: str, filesystem: Optional[FileSystem] = None):
+        # protect locally-cached file (& its hot-cache file) from eviction while being read
+        # (unless to be read remotely through filesystem, hence neither downloaded nor cached)
+        if filesystem is None:
+            self.LOCAL_CACHE.pin(self._localCachePath(filePath=filePath),
+                                 self._hotCachePath(filePath=filePath))
+
+    def _unpinLocalFile(self, filePath: str, filesystem: Optional[FileSystem] = None):
+        if filesystem is None:
+            self.LOCAL_CACHE.unpin(self._localCachePath(filePath=filePath),
+                                   self._hotCachePath(filePath=filePath))
 
     def fileLocalPath(self, filePath: str) -> Path:
-        """Get local cache file path."""
-        if (filePath in self._FILE_CACHES) and self._FILE_CACHES[filePath].localPath:
-            return self._FILE_CACHES[filePath].localPath
+        """Get local cache file path, (re-)downloading file if not cached (e.g., evicted).
+
+        (counting a single local-cache hit, or miss if downloaded)
+        """
+        if (filePath in self._FILE_CACHES) and \
+                (knownLocalPath := self._FILE_CACHES[filePath].localPath) and \
+                self.LOCAL_CACHE.contains(knownLocalPath):
+            self.LOCAL_CACHE.recordAccess(knownLocalPath, hit=True)
+            return knownLocalPath
+
+        localPath: Path = self._localCachePath(filePath=filePath)
 
+        self.LOCAL_CACHE.recordAccess(localPath, hit=not self._syncFileLocally(filePath=filePath))
+
+        return localPath
+
+    def _syncFileLocally(self, filePath: str) -> int:
+        """Download file into local cache unless already cached in same version.
+
+        Concurrent calls for the same file, even from other processes sharing the local cache,
+        are serialized so that only the first one downloads it.
+
+        Returns number of bytes downloaded (0 if skipped).
+        """
+        localPath: Path = self._localCachePath(filePath=filePath)
+
+        eTag: Optional[str] = (self._FILE_CACHES[filePath].eTag
+                               if filePath in self._FILE_CACHES
+                               else self._LISTED_FILE_ETAGS.get(filePath))
+
+        # let only 1 process (or thread) download file at a time, others waiting to then reuse it
+        with self.LOCAL_CACHE.locked(localPath):
+            localCopy: Optional[Namespace] = (self._METADATA_CATALOG.localCopy(localPath=localPath)
+                                              if self._METADATA_CATALOG is not None
+                                              else None)
+
+            # skip without any request if local copy is of listed version & intact
+            if eTag and (localCopy is not None) and (localCopy.eTag == eTag) and \
+                    self.LOCAL_CACHE.contains(localPath, nBytes=localCopy.nBytes):
+                nBytesDownloaded: int = 0
+
+            else:
+                parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
+
+                s3ObjMetadata: Dict[str, Any] = self.S3_CLIENT.head_object(
+                    Bucket=parsedURL.netloc, Key=parsedURL.path[1:])
+                eTag: str = s3ObjMetadata['ETag']
+
+                # (local copy of unknown version assumed same if of same size)
+                if ((localCopy is None) or (localCopy.eTag == eTag)) and \
+                        self.LOCAL_CACHE.contains(localPath,
+                                                  nBytes=s3ObjMetadata['ContentLength']):
+                    nBytesDownloaded: int = 0
+
+                else:
+                    # download to temporary file in same directory, then atomically move into place,
+                    # so that an interrupted download never leaves a truncated file looking cached
+                    tmpLocalPath: Path = localPath.with_name(f'.{localPath.name}.{uuid4().hex}.tmp')
+
+                    try:
+                        self.S3_CLIENT.download_file(Bucket=parsedURL.netloc,
+                                                     Key=parsedURL.path[1:],
+                                                     Filename=str(tmpLocalPath),
+                                                     Config=self._DOWNLOAD_TRANSFER_CONFIG)
+
+                        assert (nBytesDownloaded := tmpLocalPath.stat().st_size) == \
+                            s3ObjMetadata['ContentLength'], \
+                            IOError(f'*** {filePath}: DOWNLOADED {nBytesDownloaded:,} BYTES != '
+                                    f"{s3ObjMetadata['ContentLength']:,} BYTES ***")
+
+                        # fail rather than keep a mix of parts of different object versions
+                        # (as download_file's ExtraArgs do not accept IfMatch)
+                        assert (eTagAfterDownload := self.S3_CLIENT.head_object(
+                                    Bucket=parsedURL.netloc, Key=parsedURL.path[1:])['ETag']) \
+                            == eTag, \
+                            IOError(f'*** {filePath}: CHANGED DURING DOWNLOAD '
+                                    f'(ETag {eTag} -> {eTagAfterDownload}) ***')
+
+                        os.replace(src=tmpLocalPath, dst=localPath)
+
+                    except Exception as err:
+                        self.stdOutLogger.error(msg=f'*** FAILED TO DOWNLOAD "{filePath}" ***')
+                        raise err
+
+                    finally:
+                        tmpLocalPath.unlink(missing_ok=True)
+
+                    self.LOCAL_CACHE.add(localPath)
+
+                if self._METADATA_CATALOG is not None:
+                    self._METADATA_CATALOG.putLocalCopy(localPath=localPath, eTag=eTag,
+                                                        nBytes=s3ObjMetadata['ContentLength'])
+
+        if filePath in self._FILE_CACHES:
+            self._FILE_CACHES[filePath].localPath = localPath
+
+            # (version cached, for cataloguing its metadata)
+            self._FILE_CACHES[filePath].eTag = eTag
+
+        return nBytesDownloaded
+
+    def _hotCachePath(self, filePath: str) -> Path:
+        parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
+        return (self._LOCAL_CACHE_DIR_PATH / self._HOT_CACHE_DIR_NAME /
+                parsedURL.netloc / f'{parsedURL.path[1:]}.feather')
+
+    @classmethod
+    def _hotCacheFileSource(cls, hotCachePath: Path) -> Optional[str]:
+        # version of file re-encoded into hot-cache file (only reading the file's schema)
+        try:
+            source: Optional[bytes] = \
+                (openIPCFile(source=str(hotCachePath)).schema.metadata or {}).get(
+                    cls._HOT_CACHE_SOURCE_METADATA_KEY)
+
+        except (ArrowException, OSError):   # e.g., truncated
+            return None
+
+        return None if source is None else source.decode()
+
+    def fileHotCachePath(self, filePath: str) -> Path:
+        """Get hot-cache file path, re-encoding locally-cached file if not yet (or outdated).
+
+        The hot-cache file is an Arrow IPC (Feather v2) file with the same record batches,
+        compressed as per ``_HOT_CACHE_COMPRESSION`` (by default uncompressed, for zero-copy
+        memory-mapped reads), tagged with the version (ETag) of the file re-encoded,
+        so that it is rewritten whenever the file changes.
+        """
+        hotCachePath: Path = self._hotCachePath(filePath=filePath)
+
+        # let only 1 process (or thread) re-encode file at a time, others waiting to then reuse it
+        with self.LOCAL_CACHE.locked(hotCachePath):
+            # if file version known & already re-encoded, no need for locally-cached file
+            # (e.g., since evicted)
+            if (eTag := (self._FILE_CACHES[filePath].eTag
+                         if filePath in self._FILE_CACHES
+                         else self._LISTED_FILE_ETAGS.get(filePath))) and \
+                    self.LOCAL_CACHE.contains(hotCachePath) and \
+                    (self._hotCacheFileSource(hotCachePath) == eTag):
+                self.LOCAL_CACHE.recordAccess(hotCachePath, hit=True)
+                return hotCachePath
+
+            localPath: Path = Path(self.fileLocalPath(filePath=filePath))
+
+            # (ETag possibly learned upon syncing, else falling back to size)
+            source: str = ((self._FILE_CACHES[filePath].eTag
+                            if filePath in self._FILE_CACHES
+                            else None)
+                           or f'{localPath.stat().st_size} bytes')
+
+            if self.LOCAL_CACHE.contains(hotCachePath) and \
+                    (self._hotCacheFileSource(hotCachePath) == source):
+                self.LOCAL_CACHE.recordAccess(hotCachePath, hit=True)
+                return hotCachePath
+
+            tmpHotCachePath: Path = hotCachePath.with_name(
+                f'.{hotCachePath.name}.{uuid4().hex}.tmp')
+
+            try:
+                fileParquet: ParquetFile = ParquetFile(source=localPath, memory_map=True)
+
+                schema: Schema = fileParquet.schema_arrow
+                schema: Schema = schema.with_metadata(
+                    {**(schema.metadata or {}),
+                     self._HOT_CACHE_SOURCE_METADATA_KEY: source.encode()})
+
+                # (record batch by record batch, so as not to hold the whole file in memory)
+                with RecordBatchFileWriter(sink=str(tmpHotCachePath),
+                                           schema=schema,
+                                           options=IpcWriteOptions(
+                                               compression=self._HOT_CACHE_COMPRESSION)) \
+                        as hotCacheFileWriter:
+                    for recordBatch in fileParquet.iter_batches(batch_size=2 ** 16,
+                                                                use_threads=True,
+                                                                use_pandas_metadata=True):
+                        hotCacheFileWriter.write_batch(
+                            RecordBatch.from_arrays(arrays=recordBatch.columns, schema=schema))
+
+                os.replace(src=tmpHotCachePath, dst=hotCachePath)
+
+            finally:
+                tmpHotCachePath.unlink(missing_ok=True)
+
+            self.LOCAL_CACHE.add(hotCachePath)
+            self.LOCAL_CACHE.recordAccess(hotCachePath, hit=False)
+
+        return hotCachePath
+
+    def _fetchFileFooterMetadata(self, filePath: str, eTag: Optional[str] = None) -> FileMetaData:
+        """Fetch Parquet file metadata by ranged reads of only the file's footer."""
         parsedURL: ParseResult = urlparse(url=filePath, scheme='', allow_fragments=True)
 
-        localPath: Path = self._LOCAL_CACHE_DIR_PATH / parsedURL.netloc / parsedURL.path[1:]
+        # fetch tail of file speculatively large enough to contain the whole footer,
+        # ending with 4-byte footer length & 4-byte magic number
+        s3Obj: Dict[str, Any] = self.S3_CLIENT.get_object(
+            Bucket=parsedURL.netloc, Key=parsedURL.path[1:],
+            Range=f'bytes=-{self._FOOTER_FETCH_N_BYTES}',
+            **(dict(IfMatch=eTag) if eTag else {}))
+
+        tail: bytes = s3Obj['Body'].read()
+
+        assert tail[-4:] == b'PAR1', IOError(f'*** {filePath} NOT A PARQUET FILE ***')
+
+        footerNBytes: int = int.from_bytes(tail[-8:-4], byteorder='little') + 8
+
+        if footerNBytes > len(tail):
+            # (IfMatch: fail rather than mix parts of different versions of an updated object)
+            tail: bytes = self.S3_CLIENT.get_object(Bucket=parsedURL.netloc,
+                                                    Key=parsedURL.path[1:],
+                                                    Range=f'bytes=-{footerNBytes}',
+                                                    IfMatch=s3Obj['ETag'])['Body'].read()
+
+        return read_metadata(where=BufferReader(tail[-footerNBytes:]))
+
+    def fileMetadata(self, filePath: str) -> FileMetaData:
+        """Get Parquet file metadata (schema, numbers of rows, row-group statistics, etc.).
+
+        If the file is not cached locally, only its footer is fetched (by ranged reads).
+        """
+        fileCache: Optional[Namespace] = self._FILE_CACHES.get(filePath)
+
+        if (fileCache is not None) and fileCache.localPath and \
+                self.LOCAL_CACHE.contains(fileCache.localPath):
+            return read_metadata(where=fileCache.localPath)
+
+        return self._fetchFileFooterMetadata(filePath=filePath,
+                                             eTag=None if fileCache is None else fileCache.eTag)
+
+    def _loadSummaryMetadata(self, verbose: bool = True) -> Optional[Schema]:
+        """Load data set's Parquet summary file, if any, returning its schema (else None).
+
+        From a ``_metadata`` summary file (holding all files' row groups' metadata),
+        listed files' schemas & numbers of columns & rows are loaded;
+        from a ``_common_metadata`` summary file, only the common schema.
+        Either way, the schema is merged into the data set's columns & types.
+
+        Files' metadata are loaded only if files were listed (rather than reused from catalog)
+        as last modified no later than the summary file; other files, e.g. added or overwritten
+        after it was written, still have their footers read (or catalogued metadata reused).
+        """
+        for summaryFileName in ('_metadata', '_common_metadata'):
+            try:
+                summaryMetadata: FileMetaData = self._fetchFileFooterMetadata(
+                    filePath=f"{self.path.rstrip('/')}/{summaryFileName}")
+
+            except ClientError:   # e.g., no such summary file
+                continue
+
+            schema: Schema = summaryMetadata.schema.to_arrow_schema()
+
+            if summaryFileName == '_metadata':
+                parsedURL: ParseResult = urlparse(url=f"{self.path.rstrip('/')}/_metadata",
+                                                  scheme='', allow_fragments=True)
+
+                summaryLastModified: datetime.datetime = self.S3_CLIENT.head_object(
+                    Bucket=parsedURL.netloc, Key=parsedURL.path[1:])['LastModified']
+
+                filesNRows: Dict[str, int] = {}
+
+                # (files' paths relative to data set's path recorded in column chunks' metadata)
+                for i in range(summaryMetadata.num_row_groups):
+                    rowGroupMetadata = summaryMetadata.row_group(i)
+
+                    filePath: str = (f"{self.path.rstrip('/')}/"
+                                     f'{rowGroupMetadata.column(0).file_path}')
+
+                    filesNRows[filePath] = filesNRows.get(filePath, 0) + rowGroupMetadata.num_rows
+
+                for filePath in self.filePaths.intersection(filesNRows):
+                    if ((lastModified := self._LISTED_FILE_LAST_MODIFIED.get(filePath))
+                            is not None) and (lastModified <= summaryLastModified):
+                        self._SUMMARIZED_FILES_METADATA[filePath] = \
+                            Namespace(nCols=summaryMetadata.num_columns,
+                                      nRows=filesNRows[filePath],
+                                      schema=schema)
+
+                    else:   # (possibly outdated)
+                        self._SUMMARIZED_FILES_METADATA.pop(filePath, None)
+
+            # (partition keys, as of any file, possibly also in schema but typed differently)
+            partitionKeys: Set[str] = set(self._fileCache(next(iter(self.filePaths))).partitionKVs)
+
+            self._mergeFileTypes(filePath=f"{self.path.rstrip('/')}/{summaryFileName}",
+                                 fileTypes=Namespace(**{col: schema.field(col).type
+                                                        for col in schema.names
+                                                        if col not in partitionKeys
+                                                        and col != '__index_level_0__'}))
+
+            if verbose:
+                self.classStdOutLogger().info(msg=f'Loaded Summary File "{summaryFileName}"')
+
+            return schema
+
+        return None
+
+    def writeSummaryMetadata(self, verbose: bool = True):
+        """Write data set's Parquet summary files (``_metadata`` & ``_common_metadata``) to S3.
+
+        The ``_metadata`` summary file gathers all files' row groups' metadata
+        (as read from the files' footers), for later feeders to load instead.
+        """
+        if verbose:
+            self.stdOutLogger.info(msg=(msg := f'Writing Summary Files to "{self.path}"...'))
+            tic: float = time.time()
+
+        filePaths: Tuple[str] = tuple(sorted(self.filePaths))
+
+        with ThreadPoolExecutor(max_workers=self._nWorkers(executor='thread')) as threadPool:
+            filesMetadata: List[FileMetaData] = list(threadPool.map(self.fileMetadata, filePaths))
+
+        for filePath, fileMetadata in zip(filePaths, filesMetadata):
+            fileMetadata.set_file_path(filePath[(len(self.path.rstrip('/')) + 1):])
+
+        summaryMetadata: FileMetaData = filesMetadata[0]
+
+        for fileMetadata in filesMetadata[1:]:
+            summaryMetadata.append_row_groups(fileMetadata)
+
+        summaryBuffer: BufferOutputStream = BufferOutputStream()
+        summaryMetadata.write_metadata_file(summaryBuffer)
+
+        commonSummaryBuffer: BufferOutputStream = BufferOutputStream()
+        write_metadata(schema=summaryMetadata.schema.to_arrow_schema(),
+                       where=commonSummaryBuffer)
+
+        for summaryFileName, buffer in (('_metadata', summaryBuffer),
+                                        ('_common_metadata', commonSummaryBuffer)):
+            self.S3_CLIENT.put_object(Bucket=self.s3Bucket,
+                                      Key=f"{self.pathS3Key.rstrip('/')}/{summaryFileName}",
+                                      Body=buffer.getvalue().to_pybytes())
+
+        if verbose:
+            toc: float = time.time()
+            self.stdOutLogger.info(msg=f'{msg} done!   <{toc - tic:,.1f} s>')
+
+    def _fileCaches(self, filePaths: Collection[str]) -> List[Namespace]:
+        """Get caches of files, building those of files not yet used, in order of file paths.
+
+        Building a file's cache parses partition keys & values from its path,
+        reuses its metadata from the data set's summary file or catalogued (if ETag unchanged),
+        and checks its partition-key (& catalogued column) types against the data set's.
+        """
+        if newFilePaths := [filePath for filePath in filePaths
+                            if filePath not in self._FILE_CACHES]:
+            filePathsETags: Dict[str, Optional[str]] = {
+                filePath: self._LISTED_FILE_ETAGS.get(filePath) for filePath in newFilePaths}
+
+            # (looking up catalogued metadata of all new files at once,
+            # except those of files in data set's summary file)
+            catalogedFilesMetadata: Dict[str, Namespace] = (
+                self._METADATA_CATALOG.filesMetadata(
+                    filePathsETags={filePath: eTag
+                                    for filePath, eTag in filePathsETags.items()
+                                    if filePath not in self._SUMMARIZED_FILES_METADATA})
+                if self._METADATA_CATALOG is not None
+                else {})
+
+            catalogedFilesMetadata.update((filePath, self._SUMMARIZED_FILES_METADATA[filePath])
+                                          for filePath in newFilePaths
+                                          if filePath in self._SUMMARIZED_FILES_METADATA)
+
+            for filePath in newFilePaths:
+                partitionKVs: Dict[str, Union[datetime.date, str]] = {}
+                srcTypesInclPartitionKVs: Namespace = Namespace()
+
+                for partitionKV in re.findall(pattern='[^/]+=[^/]+/', string=filePath):
+                    k, v = partitionKV.split(sep='=', maxsplit=1)
+
+                    if k == self._DATE_COL:
+                        srcTypesInclPartitionKVs[k] = _ARROW_DATE_TYPE
+                        partitionKVs[k] = datetime.datetime.strptime(v[:-1], '%Y-%m-%d').date()
+
+                    else:
+                        srcTypesInclPartitionKVs[k] = _ARROW_STR_TYPE
+                        partitionKVs[k] = v[:-1]
+
+                fileCache: Namespace = Namespace(localPath=None,
+
+                                                 eTag=filePathsETags[filePath],
+
+                                                 partitionKVs=partitionKVs,
+
+                                                 srcColsExclPartitionKVs=None,
+                                                 srcColsInclPartitionKVs=set(partitionKVs),
+
+                                                 srcTypesExclPartitionKVs=Namespace(),
+                                                 srcTypesInclPartitionKVs=srcTypesInclPartitionKVs,
+
+                                                 nCols=None, nRows=None)
+
+                self._mergeFileTypes(filePath=filePath, fileTypes=srcTypesInclPartitionKVs)
+
+                if filePath in catalogedFilesMetadata:
+                    self._setFileSchema(filePath=filePath, fileCache=fileCache,
+                                        schema=catalogedFilesMetadata[filePath].schema)
+
+                    fileCache.nCols = catalogedFilesMetadata[filePath].nCols
+                    fileCache.nRows = catalogedFilesMetadata[filePath].nRows
+
+                # (keeping cache built first if built concurrently by another thread)
+                self._FILE_CACHES.setdefault(filePath, fileCache)
+
+        return [self._FILE_CACHES[filePath] for filePath in filePaths]
+
+    def _fileCache(self, filePath: str) -> Namespace:
+        return self._fileCaches((filePath,))[0]
+
+    def _mergeFileTypes(self, filePath: str, fileTypes: Namespace):
+        # extend data set's columns & types by file's, checking types consistent across files
+        with self._SCHEMA_LOCK:
+            for col, arrowType in fileTypes.items():
+                if col in self.srcTypesInclPartitionKVs:
+                    assert arrowType == self.srcTypesInclPartitionKVs[col], \
+                        TypeError(f'*** {filePath} COLUMN {col}: '
+                                  f'DETECTED TYPE {arrowType} != '
+                                  f'{self.srcTypesInclPartitionKVs[col]} ***')
+                else:
+                    self.srcTypesInclPartitionKVs[col] = arrowType
+
+            self.srcColsInclPartitionKVs.update(fileTypes.keys())
+
+    def _setFileSchema(self, filePath: str, fileCache: Namespace, schema: Schema):
+        # (whether schema read from file or loaded from catalog or summary file)
+        for col in set(schema.names).difference(fileCache.partitionKVs):
+            assert not is_binary(schema.field(col).type), \
+                TypeError(f'*** {filePath}: {col} IS OF BINARY TYPE ***')
+
+        fileCache.srcColsExclPartitionKVs = set(schema.names) - {'__index_level_0__'}
+
+        fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+
+        for col in fileCache.srcColsExclPartitionKVs.difference(fileCache.partitionKVs):
+            fileCache.srcTypesExclPartitionKVs[col] = \
+                fileCache.srcTypesInclPartitionKVs[col] = \
+                schema.field(col).type
+
+        with self._SCHEMA_LOCK:
+            self.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+
+            self._mergeFileTypes(filePath=filePath, fileTypes=fileCache.srcTypesExclPartitionKVs)
+
+    def _setFileMetadata(self, filePath: str, fileCache: Namespace, metadata: FileMetaData):
+        schema: Schema = metadata.schema.to_arrow_schema()
+
+        self._setFileSchema(filePath=filePath, fileCache=fileCache, schema=schema)
+
+        fileCache.nCols = metadata.num_columns
+        fileCache.nRows = metadata.num_rows
+
+        self._catalogFileMetadata(filePath=filePath, schema=schema)
+
+    def _probeFileSchemas(self, filePaths: Collection[str]):
+        """Read schemas & metadata of files not yet known, concurrently.
+
+        (fetching only footers of files not cached locally;
+        data set's columns & types then extended serially, in order of file paths)
+        """
+        fileCaches: List[Namespace] = self._fileCaches(filePaths)
+
+        if filePathsToProbe := [filePath
+                                for filePath, fileCache in zip(filePaths, fileCaches)
+                                if fileCache.nRows is None]:
+            with ThreadPoolExecutor(max_workers=self._nWorkers(executor='thread')) as threadPool:
+                for filePath, metadata in zip(filePathsToProbe,
+                                              threadPool.map(self.fileMetadata, filePathsToProbe)):
+                    self._setFileMetadata(filePath=filePath,
+                                          fileCache=self._FILE_CACHES[filePath],
+                                          metadata=metadata)
+
+        # (also merging types of files whose caches were built before, e.g. for other data sets)
+        for filePath, fileCache in zip(filePaths, fileCaches):
+            self._mergeFileTypes(filePath=filePath, fileTypes=fileCache.srcTypesInclPartitionKVs)
+
+    def cacheFileMetadataAndSchema(self, filePath: str) -> Namespace:
+        """Cache file metadata and schema (fetching only file footer if not cached locally)."""
+        fileCache: Namespace = self._fileCache(filePath=filePath)
+
+        if fileCache.nRows is None:
+            metadata: FileMetaData = self.fileMetadata(filePath=filePath)
+
+            # (also checking that no column is of binary type)
+            self._setFileMetadata(filePath=filePath, fileCache=fileCache, metadata=metadata)
+
+        return fileCache
+
+    def _cacheFilesMetadataAndSchemas(self, filePaths: Collection[str], *,
+                                      maxWorkers: Optional[int] = None,
+                                      verbose: bool = True) -> List[Namespace]:
+        """Cache metadata and schemas of files concurrently, in order of file paths."""
+        self._fileCaches(filePaths)   # (building caches of files not yet used at once)
+
+        with ThreadPoolExecutor(max_workers=self._nWorkers(executor='thread',
+                                                           maxWorkers=maxWorkers)) as threadPool:
+            fileCaches: Iterator[Namespace] = threadPool.map(self.cacheFileMetadataAndSchema,
+                                                             filePaths)
+
+            return list(tqdm(fileCaches, total=len(filePaths))
+                        if verbose and (len(filePaths) > 1)
+                        else fileCaches)
+
+    def _catalogFileMetadata(self, filePath: str, schema: Schema):
+        # persist file metadata for other & later processes
+        if self._METADATA_CATALOG is not None:
+            fileCache: Namespace = self._FILE_CACHES[filePath]
+
+            self._METADATA_CATALOG.putFileMetadata(filePath=filePath, eTag=fileCache.eTag,
+                                                   schema=schema,
+                                                   nCols=fileCache.nCols, nRows=fileCache.nRows)
+
+    # =====================
+    # ROWS, COLUMNS & TYPES
+    # ---------------------
+    # approxNRows / nRows / __len__
+    # columns
+    # indexCols
+    # types
+    # type / typeIsNum
+    # possibleFeatureCols
+    # possibleCatCols
+
+    @property
+    def approxNRows(self) -> int:
+        """Approximate number of rows."""
+        if self._cache.approxNRows is None:
+            self.stdOutLogger.info(msg='Counting Approx. No. of Rows...')
+
+            self._cache.approxNRows = (
+                self.nFiles
+                * sum(fileCache.nRows
+                      for fileCache in self._cacheFilesMetadataAndSchemas(
+                          tuple(self.prelimReprSampleFilePaths)))
+                / self._reprSampleMinNFiles)
+
+        return self._cache.approxNRows
+
+    @property
+    def nRows(self) -> int:
+        """Return number of rows."""
+        if self._cache.nRows is None:
+            self.stdOutLogger.info(msg='Counting No. of Rows...')
+
+            self._cache.nRows = sum(fileCache.nRows
+                                    for fileCache in self._cacheFilesMetadataAndSchemas(
+                                        tuple(self.filePaths)))
+
+        return self._cache.nRows
+
+    def __len__(self) -> int:
+        """Return (approximate) number of rows."""
+        return self._cache.nRows if self._cache.nRows else self.approxNRows
+
+    @property
+    def columns(self) -> Set[str]:
+        """Column names.
+
+        (snapshot, safe to iterate while columns are being added by other threads)
+        """
+        with self._SCHEMA_LOCK:
+            return set(self.srcColsInclPartitionKVs)
+
+    @property
+    def indexCols(self) -> Set[str]:
+        """Return index columns."""
+        s: Set[str] = set()
+
+        if self._iCol:
+            s.add(self._iCol)
+
+        if self._dCol:
+            s.add(self._dCol)
+
+        if self._tCol:
+            s.add(self._tCol)
+
+        return s
+
+    @property
+    def types(self) -> Namespace:
+        """Return column data types.
+
+        (snapshot, safe to iterate while columns are being added by other threads)
+        """
+        with self._SCHEMA_LOCK:
+            return Namespace(**self.srcTypesInclPartitionKVs)
+
+    @lru_cache(maxsize=None, typed=False)
+    def type(self, col: str) -> DataType:
+        """Return data type of specified column."""
+        return self.types[col]
+
+    @lru_cache(maxsize=None, typed=False)
+    def typeIsNum(self, col: str) -> bool:
+        """Check whether specified column's data type is numerical."""
+        return is_num(self.type(col))
+
+    @property
+    def possibleFeatureCols(self) -> Set[str]:
+        """Possible feature columns for ML modeling."""
+        return {col for col in self.contentCols if is_possible_feature(self.type(col))}
+
+    @property
+    def possibleCatCols(self) -> Set[str]:
+        """Possible categorical content columns."""
+        return {col for col in self.contentCols if is_possible_cat(self.type(col))}
+
+    # ====================
+    # MAP/REDUCE & related
+    # --------------------
+    # map
+    # _castPlanNode / _planNodeRequiredCols / _optimizedPlan
+    # _optimizedMappers / _optimizedReduceMustInclCols / _mappersRequiredCols / explain
+    # _randomRowGroups / _partitionKVsArrowTable / _readFileArrowTable / _readFilePandasDF
+    # _readAndMapFile / _iterReadAndMapFileBatches
+    # _reduceFileArgs / _reduceFile / _reduceFileInProcess
+    # _iterPrefetchedFileArgs / _iterMapFiles / _iterFutureResults
+    # iterReduce
+    # _combineFiles
+    # _reduceIntoNumPy
+    # _concatResults / _resultNBytes / _spillResults
+    # _reduceWithinMemoryBudget / _removeSpillFiles
+    # reduce
+    # _getCols / __getitem__
+    # _castType / castType
+    # arrowColsToNumPy
+    # collect
+
+    def map(self, *mappers: callable,
+            reduceMustInclCols: Optional[ColsType] = None,
+            inputCols: Optional[ColsType] = None, passThrough: bool = False,
+            rowFilter: Optional[RowFilterType] = None, preservesValues: bool = False,
+            **kwargs: Any) -> S3ParquetDataFeeder:
+        """Apply mapper function(s) to files.
+
+        Args:
+            *mappers: function(s) to apply, in order, to each file's content
+
+            reduceMustInclCols: column(s) to always read, even if ``reduce(cols=...)`` is narrower
+
+            inputCols: all column(s) the mapper(s) read, enabling ``reduce`` to read only
+            the columns required by the whole mapper chain (default: ``None``, i.e. all columns)
+
+            passThrough: whether the mapper(s) pass all other columns through unchanged,
+            e.g. row filters and type casts (``inputCols`` then being those they additionally read)
+
+            rowFilter: row filter implied by the mapper(s), to be pushed down into file reads
+            if all previous mappers preserve values
+
+            preservesValues: whether the mapper(s) only select rows and/or columns,
+            leaving values unchanged (implied by ``rowFilter``)
+        """
+        if reduceMustInclCols is None:
+            reduceMustInclCols: Set[str] = set()
+
+        inheritCache: bool = kwargs.pop('inheritCache', False)
+        inheritNRows: bool = kwargs.pop('inheritNRows', inheritCache)
+
+        # logical-plan operation & argument (e.g., from ``__getitem__``, ``filter``, ``castType``)
+        planOp: str = kwargs.pop('planOp', 'map')
+        planArg: Any = kwargs.pop('planArg', None)
 
-        localDirPath: Path = localPath.parent
-        mkdir(dir_path=localDirPath, hdfs=False)
-        # make sure the dir has been created
-        while not localDirPath.is_dir():
-            time.sleep(1)
+        # (mapper(s) of this call forming a single node, reading ``inputCols`` altogether)
+        planNode: _PlanNode = _PlanNode(
+            op=planOp, arg=planArg, mappers=mappers,
+            inputCols=(None if inputCols is None
+                       else frozenset(to_iterable(inputCols, iterable_type=set))),
+            passThrough=(inputCols is None) or passThrough,
+            reduceMustInclCols=frozenset(to_iterable(reduceMustInclCols, iterable_type=set)),
+            rowFilter=rowFilter if self._rowFiltersPushable else None)
+
+        s3ParquetDF: S3ParquetDataFeeder = \
+            S3ParquetDataFeeder(
+                path=self.path, awsRegion=self.awsRegion, partitionRange=self.partitionRange,
+
+                _plan=self._plan + (planNode,),
+                _reduceMustInclCols=self._reduceMustInclCols,
+                _rowFilters=(self._rowFilters + (rowFilter,)
+                             if self._rowFiltersPushable and (rowFilter is not None)
+                             else self._rowFilters),
+                _rowFiltersPushable=(self._rowFiltersPushable and
+                                     (preservesValues or (rowFilter is not None))),
+
+                iCol=self._iCol, tCol=self._tCol,
+
+                reprSampleMinNFiles=self._reprSampleMinNFiles, reprSampleSize=self._reprSampleSize,
+
+                nulls=self._nulls,
+                minNonNullProportion=self._minNonNullProportion,
+                outlierTailProportion=self._outlierTailProportion,
+                maxNCats=self._maxNCats,
+                minProportionByMaxNCats=self._minProportionByMaxNCats,
+
+                **kwargs)
+
+        if inheritCache:
+            s3ParquetDF._inheritCache(self)
+
+        if inheritNRows:
+            s3ParquetDF._cache.approxNRows = self._cache.approxNRows
+            s3ParquetDF._cache.nRows = self._cache.nRows
+
+        return s3ParquetDF
+
+    @staticmethod
+    def _randomRowGroups(fileParquet: ParquetFile, minNRows: float,
+                         rowGroups: Optional[List[int]] = None) -> List[int]:
+        """Randomly choose row groups (among given ones) totalling at least given number of rows."""
+        if rowGroups is None:
+            rowGroups: List[int] = list(range(fileParquet.num_row_groups))
+
+        rowGroupIndices: List[int] = []
+        rowGroupsNRows: int = 0
+
+        for i in randomSample(population=rowGroups,
+                              sampleSize=len(rowGroups),
+                              returnCollectionType=tuple):
+            if rowGroupsNRows >= minNRows:
+                break
+
+            rowGroupIndices.append(i)
+            rowGroupsNRows += fileParquet.metadata.row_group(i).num_rows
+
+        return sorted(rowGroupIndices)
+
+    @staticmethod
+    def _readHotCacheFileArrowTable(fileHotCachePath: Path, srcCols: Set[str],
+                                    nSamplesPerFile: Optional[int] = None,
+                                    rowFilter: RowFilterType = True) -> Table:
+        """Read hot-cache (Arrow IPC) file into Arrow Table, memory-mapped, filtered & sampled.
+
+        (no row groups to skip, nor to sample from: with nothing to decode,
+        the whole file is mapped, then filtered, then rows sampled)
+        """
+        # arrow.apache.org/docs/python/generated/pyarrow.feather.read_table
+        fileArrowTable: Table = readFeather(source=str(fileHotCachePath),
+                                            columns=list(srcCols),
+                                            use_threads=True,
+                                            memory_map=True)
+
+        fileArrowTable: Table = S3ParquetDataFeeder._filterArrowTable(
+            fileArrowTable,
+            S3ParquetDataFeeder._rowFilterExprForSchema(rowFilter, fileArrowTable.schema))
+
+        if nSamplesPerFile and (nSamplesPerFile < fileArrowTable.num_rows):
+            fileArrowTable: Table = fileArrowTable.take(
+                sorted(random.sample(population=range(fileArrowTable.num_rows),
+                                     k=nSamplesPerFile)))
+
+        return fileArrowTable
+
+    @staticmethod
+    def _partitionKVsArrowTable(partitionKVs: Dict[str, Union[datetime.date, str]],
+                                nRows: int) -> Table:
+        """Arrow Table of constant partition-key columns (possibly none) with given No. of Rows.
+
+        (like ``DataFrame(index=range(nRows))``, a table without columns keeps its number of rows,
+        by selecting no columns of a placeholder one)
+        """
+        return Table.from_arrays(
+            arrays=([arrowArray([v]).take(zeros(shape=nRows, dtype=int))
+                     for v in partitionKVs.values()]
+                    if partitionKVs
+                    else [nulls(size=nRows)]),
+            names=list(partitionKVs) if partitionKVs else ['']).select(list(partitionKVs))
+
+    @staticmethod
+    def _readFileArrowTable(filePath: str, fileLocalPath: Path,
+                            srcCols: Set[str], partitionKVs: Dict[str, Union[datetime.date, str]],
+                            nRows: int, nSamplesPerFile: Optional[int] = None,
+                            rowFilter: RowFilterType = True, memoryMap: bool = False,
+                            filesystem: Optional[FileSystem] = None,
+                            hotCache: bool = False) -> Table:
+        # pylint: disable=too-many-arguments,unused-argument
+        """Read file into Arrow Table, without Pandas conversion.
+
+        (locally-cached file, or, if ``filesystem`` given, remote file,
+        or, if ``hotCache``, hot-cache file)
+        """
+        toSubSample: bool = nSamplesPerFile and (nSamplesPerFile < nRows)
+
+        if rowFilter is False:   # e.g., ruled out by partition keys
+            nRows: int = 0
+
+        if srcCols and hotCache:
+            fileArrowTable: Table = S3ParquetDataFeeder._readHotCacheFileArrowTable(
+                fileLocalPath, srcCols, nSamplesPerFile=nSamplesPerFile, rowFilter=rowFilter)
+
+            for k, v in partitionKVs.items():
+                fileArrowTable: Table = fileArrowTable.append_column(
+                    k, arrowArray([v]).take(zeros(shape=fileArrowTable.num_rows, dtype=int)))
+
+            return fileArrowTable
+
+        if srcCols:
+            # arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile
+            fileParquet: ParquetFile = ParquetFile(source=fileLocalPath,
+                                                   metadata=None,
+                                                   common_metadata=None,
+                                                   read_dictionary=None,
+                                                   memory_map=memoryMap,
+                                                   buffer_size=0,
+                                                   pre_buffer=not memoryMap,
+                                                   coerce_int96_timestamp_unit=None,
+                                                   filesystem=filesystem)
+
+            # skip row groups (or, if none left, whole file) ruled out by min/max statistics
+            rowGroups: List[int] = S3ParquetDataFeeder._matchingRowGroups(fileParquet, rowFilter)
+
+            fileArrowTable: Table = S3ParquetDataFeeder._filterArrowTable(
+                fileParquet.read_row_groups(
+                    row_groups=(S3ParquetDataFeeder._randomRowGroups(
+                                    fileParquet, minNRows=(nSamplesPerFile * nRows) ** .5,
+                                    rowGroups=rowGroups)
+                                if toSubSample
+                                else rowGroups),
+                    columns=list(srcCols),
+                    use_threads=True,
+                    use_pandas_metadata=False),
+                S3ParquetDataFeeder._rowFilterExprForSchema(rowFilter, fileParquet.schema_arrow))
+
+            if toSubSample and (nSamplesPerFile < fileArrowTable.num_rows):
+                fileArrowTable: Table = fileArrowTable.take(
+                    sorted(random.sample(population=range(fileArrowTable.num_rows),
+                                         k=nSamplesPerFile)))
+
+            # constant partition-key columns, built by taking the single value repeatedly
+            for k, v in partitionKVs.items():
+                fileArrowTable: Table = fileArrowTable.append_column(
+                    k, arrowArray([v]).take(zeros(shape=fileArrowTable.num_rows, dtype=int)))
+
+            return fileArrowTable
+
+        return S3ParquetDataFeeder._partitionKVsArrowTable(
+            partitionKVs, nRows=min(nSamplesPerFile, nRows) if toSubSample else nRows)
+
+    @staticmethod
+    def _readFilePandasDF(filePath: str, fileLocalPath: Path,
+                          srcCols: Set[str], partitionKVs: Dict[str, Union[datetime.date, str]],
+                          nRows: int, nSamplesPerFile: Optional[int] = None,
+                          rowFilter: RowFilterType = True, memoryMap: bool = False,
+                          filesystem: Optional[FileSystem] = None,
+                          hotCache: bool = False) -> DataFrame:
+        # pylint: disable=too-many-arguments,too-many-branches,too-many-locals
+        # pylint: disable=too-many-nested-blocks,too-many-statements
+        """Read file into Pandas Data Frame.
+
+        (locally-cached file, or, if ``filesystem`` given, remote file,
+        or, if ``hotCache``, hot-cache file)
+        """
+        _CHUNK_SIZE: int = 10 ** 5
+
+        if rowFilter is False:   # e.g., ruled out by partition keys
+            nRows: int = 0
+
+        if srcCols and hotCache:
+            filePandasDF: DataFrame = _arrowToPandas(
+                S3ParquetDataFeeder._readHotCacheFileArrowTable(
+                    fileLocalPath, srcCols, nSamplesPerFile=nSamplesPerFile, rowFilter=rowFilter),
+                nullableDTypes=True)
+
+            for k, v in partitionKVs.items():
+                filePandasDF[k] = v
+
+        elif srcCols:
+            pandasDFConstructed: bool = False
+
+            toSubSample: bool = nSamplesPerFile and (nSamplesPerFile < nRows)
+
+            if toSubSample or (rowFilter is not True):
+                # arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile
+                fileParquet: ParquetFile = ParquetFile(source=fileLocalPath,
+                                                       metadata=None,
+                                                       common_metadata=None,
+                                                       read_dictionary=None,
+                                                       memory_map=memoryMap,
+                                                       buffer_size=0,
+                                                       pre_buffer=not memoryMap,
+                                                       coerce_int96_timestamp_unit=None,
+                                                       filesystem=filesystem)
+
+                # skip row groups (or, if none left, whole file) ruled out by min/max statistics
+                rowGroups: List[int] = S3ParquetDataFeeder._matchingRowGroups(fileParquet,
+                                                                              rowFilter)
+
+                rowFilterExpr: Optional[Expression] = S3ParquetDataFeeder._rowFilterExprForSchema(
+                    rowFilter if rowGroups else False, fileParquet.schema_arrow)
+
+            if toSubSample:
+                intermediateN: float = (nSamplesPerFile * nRows) ** .5
+
+                # randomly choose row groups totalling at least the intermediate sample size,
+                # so as to read & decode only those row groups
+                rowGroupIndices: List[int] = \
+                    S3ParquetDataFeeder._randomRowGroups(fileParquet, minNRows=intermediateN,
+                                                         rowGroups=rowGroups)
+
+                if (len(rowGroupIndices) < fileParquet.num_row_groups) or (rowFilter is not True):
+                    filePandasDF: DataFrame = _arrowToPandas(
+                        S3ParquetDataFeeder._filterArrowTable(
+                            fileParquet.read_row_groups(row_groups=rowGroupIndices,
+                                                        columns=list(srcCols),
+                                                        use_threads=True,
+                                                        use_pandas_metadata=True),
+                            rowFilterExpr),
+                        nullableDTypes=True)
+
+                    for k, v in partitionKVs.items():
+                        filePandasDF[k] = v
+
+                    if nSamplesPerFile < len(filePandasDF):
+                        filePandasDF: DataFrame = filePandasDF.sample(n=nSamplesPerFile,
+                                                                      # frac=None,
+                                                                      replace=False,
+                                                                      weights=None,
+                                                                      random_state=None,
+                                                                      axis='index',
+                                                                      ignore_index=False)
+
+                    pandasDFConstructed: bool = True
+
+                # otherwise (e.g., single-row-group file), sample from record-batch chunks
+                elif ((nChunksForIntermediateN := int(math.ceil(intermediateN / _CHUNK_SIZE)))
+                        < (approxNChunks := int(math.ceil(nRows / _CHUNK_SIZE)))):
+                    # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table
+                    fileArrowTable: Table = read_table(source=fileLocalPath,
+                                                       columns=list(srcCols),
+                                                       use_threads=True,
+                                                       metadata=None,
+                                                       use_pandas_metadata=True,
+                                                       memory_map=memoryMap,
+                                                       read_dictionary=None,
+                                                       filesystem=filesystem,
+                                                       filters=None,
+                                                       buffer_size=0,
+                                                       partitioning='hive',
+                                                       use_legacy_dataset=False,
+                                                       ignore_prefixes=None,
+                                                       pre_buffer=not memoryMap,
+                                                       coerce_int96_timestamp_unit=None)
+
+                    chunkRecordBatches: List[RecordBatch] = \
+                        fileArrowTable.to_batches(max_chunksize=_CHUNK_SIZE)
+
+                    nChunks: int = len(chunkRecordBatches)
+
+                    assert nChunks in (approxNChunks - 1, approxNChunks), \
+                        ValueError(f'*** {filePath}: {nChunks} vs. '
+                                   f'{approxNChunks} Record Batches ***')
+
+                    assert nChunksForIntermediateN <= nChunks, \
+                        ValueError(f'*** {filePath}: {nChunksForIntermediateN} vs. '
+                                   f'{nChunks} Record Batches ***')
+
+                    chunkPandasDFs: List[DataFrame] = []
+
+                    nSamplesPerChunk: int = int(math.ceil(nSamplesPerFile /
+                                                          nChunksForIntermediateN))
+
+                    for chunkRecordBatch in randomSample(population=chunkRecordBatches,
+                                                         sampleSize=nChunksForIntermediateN,
+                                                         returnCollectionType=tuple):
+                        chunkPandasDF: DataFrame = _arrowToPandas(chunkRecordBatch)
+
+                        for k, v in partitionKVs.items():
+                            chunkPandasDF[k] = v
+
+                        if nSamplesPerChunk < len(chunkPandasDF):
+                            chunkPandasDF: DataFrame = \
+                                chunkPandasDF.sample(n=nSamplesPerChunk,
+                                                     # frac=None,
+                                                     replace=False,
+                                                     weights=None,
+                                                     random_state=None,
+                                                     axis='index',
+                                                     ignore_index=False)
+
+                        chunkPandasDFs.append(chunkPandasDF)
+
+                    filePandasDF: DataFrame = concat(objs=chunkPandasDFs,
+                                                     axis='index',
+                                                     join='outer',
+                                                     ignore_index=False,
+                                                     keys=None,
+                                                     levels=None,
+                                                     names=None,
+                                                     verify_integrity=False,
+                                                     sort=False,
+                                                     copy=False)
+
+                    pandasDFConstructed: bool = True
+
+            if not pandasDFConstructed:
+                # pandas.pydata.org/docs/reference/api/pandas.read_parquet
+                filePandasDF: DataFrame = read_parquet(
+                    path=fileLocalPath,
+                    engine='pyarrow',
+                    columns=list(srcCols),
+                    storage_options=None,
+                    use_nullable_dtypes=True,
+
+                    # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table:
+                    use_threads=True,
+                    metadata=None,
+                    use_pandas_metadata=True,
+                    memory_map=memoryMap,
+                    read_dictionary=None,
+                    filesystem=filesystem,
+                    # (Arrow also skipping row groups by statistics)
+                    filters=None if rowFilter is True else rowFilterExpr,
+                    buffer_size=0,
+                    partitioning='hive',
+                    use_legacy_dataset=False,
+                    ignore_prefixes=None,
+                    pre_buffer=not memoryMap,
+                    coerce_int96_timestamp_unit=None,
+
+                    # arrow.apache.org/docs/python/generated/pyarrow.Table.html
+                    # #pyarrow.Table.to_pandas:
+                    # memory_pool=None,   # (default)
+                    # categories=None,   # (default)
+                    # strings_to_categorical=False,   # (default)
+                    # zero_copy_only=False,   # (default)
+
+                    # integer_object_nulls=False,   # (default)
+                    # TODO: check
+                    # (bool, default False) –
+                    # Cast integers with nulls to objects
+
+                    # date_as_object=True,   # (default)
+                    # TODO: check
+                    # (bool, default True) –
+                    # Cast dates to objects.
+                    # If False, convert to datetime64[ns] dtype.
+
+                    # timestamp_as_object=False,   # (default)
+                    # use_threads=True,   # (default)
+
+                    # deduplicate_objects=True,   # (default: *** False ***)
+                    # TODO: check
+                    # (bool, default False) –
+                    # Do not create multiple copies Python objects when created,
+                    # to save on memory use. Conversion will be slower.
+
+                    # ignore_metadata=False,   # (default)
+                    # safe=True,   # (default)
+
+                    # split_blocks=True,   # (default: *** False ***)
+                    # TODO: check
+                    # (bool, default False) –
+                    # If True, generate one internal “block” for each column
+                    # when creating a pandas.DataFrame from a RecordBatch or Table.
+                    # While this can temporarily reduce memory note that
+                    # various pandas operations can trigger “consolidation”
+                    # which may balloon memory use.
+
+                    # self_destruct=True,   # (default: *** False ***)
+                    # TODO: check
+                    # EXPERIMENTAL: If True, attempt to deallocate the originating
+                    # Arrow memory while converting the Arrow object to pandas.
+                    # If you use the object after calling to_pandas with this option
+                    # it will crash your program.
+                    # Note that you may not see always memory usage improvements.
+                    # For example, if multiple columns share an underlying allocation,
+                    # memory can’t be freed until all columns are converted.
+
+                    # types_mapper=None,   # (default)
+                )
+
+                for k, v in partitionKVs.items():
+                    filePandasDF[k] = v
+
+                if toSubSample and (nSamplesPerFile < len(filePandasDF)):
+                    filePandasDF: DataFrame = filePandasDF.sample(n=nSamplesPerFile,
+                                                                  # frac=None,
+                                                                  replace=False,
+                                                                  weights=None,
+                                                                  random_state=None,
+                                                                  axis='index',
+                                                                  ignore_index=False)
+
+        else:
+            filePandasDF: DataFrame = DataFrame(index=range(nSamplesPerFile
+                                                            if nSamplesPerFile and
+                                                            (nSamplesPerFile < nRows)
+                                                            else nRows))
+
+            for k, v in partitionKVs.items():
+                filePandasDF[k] = v
+
+        return filePandasDF
+
+    @staticmethod
+    def _readAndMapFile(filePath: str, fileLocalPath: Path,
+                        srcCols: Set[str], partitionKVs: Dict[str, Union[datetime.date, str]],
+                        nRows: int, mappers: Tuple[callable], rowFilter: RowFilterType,
+                        nSamplesPerFile: Optional[int] = None,
+                        arrow: bool = False, memoryMap: bool = False,
+                        filesystem: Optional[FileSystem] = None,
+                        hotCache: bool = False) -> ReducedDataSetType:
+        # pylint: disable=too-many-arguments
+        """Read file (locally-cached, remote if ``filesystem`` given, or hot-cache) & map it.
+
+        (static & taking only picklable arguments, so as to be runnable in worker processes)
+        """
+        result: ReducedDataSetType = (S3ParquetDataFeeder._readFileArrowTable
+                                      if arrow
+                                      else S3ParquetDataFeeder._readFilePandasDF)(
+            filePath, fileLocalPath, srcCols, partitionKVs, nRows,
+            nSamplesPerFile=nSamplesPerFile, rowFilter=rowFilter, memoryMap=memoryMap,
+            filesystem=filesystem, hotCache=hotCache)
+
+        for mapper in mappers:
+            result: ReducedDataSetType = mapper(result)
+
+        return result
+
+    @staticmethod
+    def _castPlanNode(colsToTypes: Dict[str, Any]) -> _PlanNode:
+        return _PlanNode(op='cast', arg=colsToTypes,
+                         mappers=(partial(S3ParquetDataFeeder._castType,
+                                          colsToTypes=colsToTypes),),
+                         inputCols=frozenset(colsToTypes), passThrough=True,
+                         reduceMustInclCols=frozenset(colsToTypes))
+
+    @staticmethod
+    def _planNodeRequiredCols(node: _PlanNode,
+                              requiredCols: Optional[Set[str]]) -> Optional[Set[str]]:
+        """Columns required of node's input, given those required of its output (None: all)."""
+        if node.inputCols is None:
+            return None
+
+        if node.passThrough:
+            return None if requiredCols is None else requiredCols | node.inputCols
+
+        return set(node.inputCols)
+
+    @lru_cache(maxsize=None, typed=False)
+    def _optimizedPlan(self) -> Tuple[_PlanNode]:
+        """Logical plan optimized before files are read.
+
+        - consecutive projections are fused if later ones select among earlier ones' columns
+        - consecutive casts are fused unless casting same columns to different types
+        - casts of columns neither read by later nodes nor output (i.e., dead) are removed
+
+        (row filters & required columns being pushed down into file reads,
+        see ``_rowFilters`` & ``_mappersRequiredCols``)
+        """
+        plan: List[_PlanNode] = []
+
+        for node in self._plan:
+            prevNode: Optional[_PlanNode] = plan[-1] if plan else None
+
+            if ((prevNode is not None) and (node.op == prevNode.op == 'project') and
+                    (not isinstance(prevNode.arg, str)) and (node.inputCols <= prevNode.inputCols)):
+                plan[-1] = node   # (earlier projection subsumed)
+
+            elif ((prevNode is not None) and (node.op == prevNode.op == 'cast') and
+                    all(str(colType) == str(prevNode.arg[col])
+                        for col, colType in node.arg.items() if col in prevNode.arg)):
+                plan[-1] = self._castPlanNode(colsToTypes={**prevNode.arg, **node.arg})
+
+            else:
+                plan.append(node)
+
+        # walk back from output (all of whose columns are required)
+        requiredCols: Optional[Set[str]] = None
+
+        for i in reversed(range(len(plan))):
+            node: _PlanNode = plan[i]
+
+            if (node.op == 'cast') and (requiredCols is not None):
+                colsToTypes: Dict[str, Any] = {col: colType
+                                               for col, colType in node.arg.items()
+                                               if col in requiredCols}
+
+                if not colsToTypes:
+                    del plan[i]
+                    continue
+
+                if len(colsToTypes) < len(node.arg):
+                    plan[i] = node = self._castPlanNode(colsToTypes=colsToTypes)
+
+            requiredCols: Optional[Set[str]] = self._planNodeRequiredCols(node, requiredCols)
+
+        return tuple(plan)
+
+    @property
+    def _optimizedMappers(self) -> Tuple[callable]:
+        """Mappers of optimized logical plan, to apply to each file's content."""
+        return tuple(chain.from_iterable(node.mappers for node in self._optimizedPlan()))
+
+    @property
+    def _optimizedReduceMustInclCols(self) -> Set[str]:
+        """Columns to always read, as required by optimized logical plan."""
+        return self._reduceMustInclCols.union(*(node.reduceMustInclCols
+                                                for node in self._optimizedPlan()))
+
+    @property
+    def _mappersRequiredCols(self) -> Optional[Set[str]]:
+        """Source columns required by the (optimized) mapper chain (None meaning all columns)."""
+        requiredCols: Optional[Set[str]] = None   # all columns required of final output
+
+        for node in reversed(self._optimizedPlan()):
+            requiredCols: Optional[Set[str]] = self._planNodeRequiredCols(node, requiredCols)
+
+        return requiredCols
+
+    def explain(self) -> str:
+        """Describe optimized logical plan.
+
+        (from file reads, with row filters & columns pushed down into them,
+        through projections, filters, casts, preprocessing & other mappers)
+        """
+        readCols: Optional[Set[str]] = self._mappersRequiredCols
+        if readCols is not None:
+            readCols: Set[str] = readCols | self._optimizedReduceMustInclCols
+
+        scanDescStrs: List[str] = [
+            f'{self.path}: {self.nFiles:,} file(s)',
+            f"cols: {'(all)' if readCols is None else ', '.join(sorted(readCols))}"]
+
+        if self._rowFilters:
+            scanDescStrs.append('row filter: ' +
+                                str(self._rowFilters[0]
+                                    if len(self._rowFilters) == 1
+                                    else ('and', self._rowFilters)))
+
+        return '\n'.join([f"Scan[{'; '.join(scanDescStrs)}]"] +
+                         [f'  -> {node}' for node in self._optimizedPlan()])
+
+    def _reduceFileArgs(self, filePath: str, cols: Set[str],
+                        filesystem: Optional[FileSystem] = None,
+                        hotCache: bool = False) -> Tuple:
+        """Resolve local path, metadata & columns to read for a file.
+
+        If ``filesystem`` is given, the file is to be read remotely through it:
+        its path within that filesystem is resolved instead, without downloading the file.
+
+        If ``hotCache``, the hot-cache file's path is resolved (re-encoding it if needed).
+
+        The local file (unless read remotely) is pinned in the local cache
+        (so as not to be evicted while being read);
+        callers must unpin it (``_unpinLocalFile``, with the same ``filesystem``) when done.
+        """
+        self._pinLocalFile(filePath=filePath, filesystem=filesystem)
+
+        try:
+            localPath: Union[Path, str] = (filePath.replace('s3://', '', 1)
+                                           if filesystem is not None
+                                           else (self.fileHotCachePath(filePath=filePath)
+                                                 if hotCache
+                                                 else self.fileLocalPath(filePath=filePath)))
+
+            fileCache: Namespace = self.cacheFileMetadataAndSchema(filePath=filePath)
+
+        except Exception as err:
+            self._unpinLocalFile(filePath=filePath, filesystem=filesystem)
+            raise err
+
+        colsForFile: Set[str] = (
+            cols
+            if cols
+            else (fileCache.srcColsInclPartitionKVs
+                  if (mappersRequiredCols := self._mappersRequiredCols) is None
+                  # excluding columns derived by mappers rather than read from file
+                  else mappersRequiredCols & fileCache.srcColsInclPartitionKVs)
+        ) | self._optimizedReduceMustInclCols
+
+        srcCols: Set[str] = colsForFile & fileCache.srcColsExclPartitionKVs
+
+        rowFilter: RowFilterType = self._bindRowFilter(
+            ('and', self._rowFilters) if self._rowFilters else True,
+            partitionKVs=fileCache.partitionKVs, readCols=srcCols)
+
+        # whether bound row filter is applicable to file's column types, hence applied upon read
+        rowFilterApplied: bool = isinstance(rowFilter, bool) or (
+            self._rowFilterExprForSchema(
+                rowFilter,
+                makeArrowSchema([(col, fileCache.srcTypesExclPartitionKVs[col])
+                                 for col in srcCols.difference(fileCache.partitionKVs)]))
+            is not None)
+
+        # (filters' mappers dropped if their pushed-down row filters are applied exactly)
+        mappers: Tuple[callable] = tuple(chain.from_iterable(
+            ()
+            if (rowFilterApplied and (node.op == 'filter') and (node.rowFilter is not None) and
+                self._rowFilterBoundExactly(node.rowFilter,
+                                            partitionKVs=fileCache.partitionKVs,
+                                            readCols=srcCols))
+            else node.mappers
+            for node in self._optimizedPlan()))
+
+        return (filePath, localPath,
+                srcCols,
+                {k: fileCache.partitionKVs[k]
+                 for k in colsForFile.intersection(fileCache.partitionKVs)},
+                fileCache.nRows, mappers,
+                rowFilter)
+
+    def _reduceFile(self, filePath: str, cols: Set[str],
+                    **readKwargs: Any) -> ReducedDataSetType:
+        fileArgs: Tuple = self._reduceFileArgs(filePath=filePath, cols=cols,
+                                               filesystem=readKwargs.get('filesystem'),
+                                               hotCache=readKwargs.get('hotCache', False))
+
+        try:
+            return self._readAndMapFile(*fileArgs, **readKwargs)
+
+        finally:
+            self._unpinLocalFile(filePath=fileArgs[0], filesystem=readKwargs.get('filesystem'))
+
+    @staticmethod
+    def _iterReadAndMapFileBatches(filePath: str, fileLocalPath: Path,
+                                   srcCols: Set[str],
+                                   partitionKVs: Dict[str, Union[datetime.date, str]],
+                                   nRows: int, mappers: Tuple[callable], rowFilter: RowFilterType,
+                                   batchSize: int,
+                                   arrow: bool = False,
+                                   memoryMap: bool = False,
+                                   filesystem: Optional[FileSystem] = None,
+                                   hotCache: bool = False
+                                   ) -> Iterator[ReducedDataSetType]:
+        # pylint: disable=too-many-arguments,unused-argument
+        """Lazily read file by record batches & apply mapper(s) to each batch.
+
+        (locally-cached file, or, if ``filesystem`` given, remote file,
+        or, if ``hotCache``, hot-cache file)
+        """
+        if rowFilter is False:   # e.g., ruled out by partition keys
+            nRows: int = 0
+
+        if srcCols and hotCache:
+            # (memory-mapped, so record batches are only sliced, not read, upfront)
+            fileArrowTable: Table = readFeather(source=str(fileLocalPath),
+                                                columns=list(srcCols),
+                                                use_threads=True,
+                                                memory_map=True)
+
+            rowFilterExpr: Optional[Expression] = \
+                S3ParquetDataFeeder._rowFilterExprForSchema(rowFilter, fileArrowTable.schema)
+
+            batches: Iterator[Union[Table, DataFrame]] = (
+                filteredBatch
+                if arrow
+                else _arrowToPandas(filteredBatch)
+                for filteredBatch in (
+                    S3ParquetDataFeeder._filterArrowTable(Table.from_batches(batches=[recordBatch]),
+                                                          rowFilterExpr)
+                    for recordBatch in fileArrowTable.to_batches(max_chunksize=batchSize))
+                # (batches entirely filtered out are skipped)
+                if filteredBatch.num_rows or (rowFilterExpr is None))
+
+        elif srcCols:
+            # arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile
+            fileParquet: ParquetFile = ParquetFile(source=fileLocalPath,
+                                                   metadata=None,
+                                                   common_metadata=None,
+                                                   read_dictionary=None,
+                                                   memory_map=memoryMap,
+                                                   buffer_size=0,
+                                                   pre_buffer=False,
+                                                   coerce_int96_timestamp_unit=None,
+                                                   filesystem=filesystem)
+
+            rowFilterExpr: Optional[Expression] = \
+                S3ParquetDataFeeder._rowFilterExprForSchema(rowFilter, fileParquet.schema_arrow)
+
+            batches: Iterator[Union[Table, DataFrame]] = (
+                filteredBatch
+                if arrow
+                else _arrowToPandas(filteredBatch)
+                for filteredBatch in (
+                    S3ParquetDataFeeder._filterArrowTable(Table.from_batches(batches=[recordBatch]),
+                                                          rowFilterExpr)
+                    for recordBatch in fileParquet.iter_batches(
+                        batch_size=batchSize,
+                        # skip row groups ruled out by min/max statistics
+                        row_groups=S3ParquetDataFeeder._matchingRowGroups(fileParquet, rowFilter),
+                        columns=list(srcCols),
+                        use_threads=True,
+                        use_pandas_metadata=not arrow))
+                # (batches entirely filtered out are skipped)
+                if filteredBatch.num_rows or (rowFilterExpr is None))
 
-        self.S3_CLIENT.download_file(Bucket=parsedURL.netloc,
-                                     Key=parsedURL.path[1:],
-                                     Filename=str(localPath))
-        # make sure AWS S3's asynchronous process has finished
-        # downloading a potentially large file
-        while not localPath.is_file():
-            time.sleep(1)
+        else:
+            batches: Iterator[Union[Table, DataFrame]] = (
+                S3ParquetDataFeeder._partitionKVsArrowTable(partitionKVs,
+                                                            nRows=min(batchSize, nRows - i))
+                if arrow
+                else DataFrame(index=range(i, min(i + batchSize, nRows)))
+                for i in range(0, nRows, batchSize))
+
+        for batch in batches:
+            if not arrow:
+                for k, v in partitionKVs.items():
+                    batch[k] = v
+
+            elif srcCols:
+                for k, v in partitionKVs.items():
+                    batch: Table = batch.append_column(
+                        k, arrowArray([v]).take(zeros(shape=batch.num_rows, dtype=int)))
+
+            result: ReducedDataSetType = batch
+            for mapper in mappers:
+                result: ReducedDataSetType = mapper(result)
 
-        if filePath in self._FILE_CACHES:
-            self._FILE_CACHES[filePath].localPath = localPath
+            yield result
 
-        return localPath
+    def _reduceFileInProcess(self, processPool: ProcessPoolExecutor,
+                             filePath: str, cols: Set[str],
+                             **readKwargs: Any) -> ReducedDataSetType:
+        # download & read metadata in this thread (I/O-bound),
+        # then decode & map in a worker process (CPU-bound)
+        fileArgs: Tuple = self._reduceFileArgs(filePath=filePath, cols=cols,
+                                               filesystem=readKwargs.get('filesystem'),
+                                               hotCache=readKwargs.get('hotCache', False))
 
-    def cacheFileMetadataAndSchema(self, filePath: str) -> Namespace:
-        """Cache file metadata and schema."""
-        fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
+        try:
+            return processPool.submit(self._readAndMapFile, *fileArgs, **readKwargs).result()
 
-        fileCache: Namespace = self._FILE_CACHES[filePath]
+        finally:
+            self._unpinLocalFile(filePath=fileArgs[0], filesystem=readKwargs.get('filesystem'))
 
-        if fileCache.nRows is None:
-            schema: Schema = read_schema(where=fileLocalPath)
+    @classmethod
+    def _processPool(cls, nWorkers: int) -> ProcessPoolExecutor:
+        # (mappers & their arguments being pickled to worker processes)
+        return ProcessPoolExecutor(max_workers=nWorkers,
+                                   mp_context=getMultiprocessingContext(
+                                       method=cls._PROCESS_START_METHOD))
 
-            fileCache.srcColsExclPartitionKVs = set(schema.names) - {'__index_level_0__'}
+    @staticmethod
+    def _nWorkers(executor: str, maxWorkers: Optional[int] = None) -> int:
+        # same defaults as concurrent.futures' executors
+        if maxWorkers:
+            return maxWorkers
+
+        return ((os.cpu_count() or 1)
+                if executor == 'process'
+                else min(32, (os.cpu_count() or 1) + 4))
+
+    def _iterPrefetchedFileArgs(self, filePaths: Tuple[str], cols: Set[str], *,
+                                prefetch: int, prefetchAhead: Optional[int] = None,
+                                filesystem: Optional[FileSystem] = None,
+                                hotCache: bool = False,
+                                verbose: bool = True) -> Iterator[Tuple]:
+        """Download files & read their metadata ahead, yielding their read arguments in order.
+
+        At most ``prefetch`` files are downloaded concurrently, and at most ``prefetchAhead``
+        (default: twice ``prefetch``) are being or have been downloaded but not yet consumed.
+
+        (If ``filesystem`` is given for remote reads, only file metadata are fetched ahead;
+        if ``hotCache``, files are also re-encoded into the hot-cache tier ahead.)
+        """
+        with ThreadPoolExecutor(max_workers=prefetch) as downloadPool:
+            yield from self._iterFutureResults(
+                filePaths,
+                lambda filePath: downloadPool.submit(self._reduceFileArgs,
+                                                     filePath=filePath, cols=cols,
+                                                     filesystem=filesystem, hotCache=hotCache),
+                lookAhead=prefetchAhead if prefetchAhead else 2 * prefetch,
+                # unpin files prefetched but never consumed (e.g., upon error or early exit)
+                onDiscard=lambda fileArgs: self._unpinLocalFile(filePath=fileArgs[0],
+                                                                filesystem=filesystem),
+                verbose=verbose)
+
+    def _iterMapFiles(self, filePaths: Tuple[str], cols: Set[str], *,
+                      executor: Optional[str] = None, maxWorkers: Optional[int] = None,
+                      lookAhead: Optional[int] = None,
+                      prefetch: Optional[int] = None, prefetchAhead: Optional[int] = None,
+                      verbose: bool = True,
+                      **readKwargs: Any) -> Iterator[ReducedDataSetType]:
+        # pylint: disable=too-many-arguments
+        """Lazily map files, serially or in parallel, yielding results in order of file paths.
+
+        At most ``lookAhead`` files (default: unbounded, or twice the number of workers
+        if prefetching) are being or have been mapped ahead of the result being yielded.
+
+        If ``prefetch`` is specified, files are downloaded by that many dedicated threads,
+        ahead of & overlapping with decoding & mapping (see ``_iterPrefetchedFileArgs``).
+        """
+        nFilePaths: int = len(filePaths)
+
+        if prefetch and (nFilePaths > 1):
+            fileArgsIter: Iterator[Tuple] = self._iterPrefetchedFileArgs(
+                filePaths, cols, prefetch=prefetch, prefetchAhead=prefetchAhead,
+                filesystem=readKwargs.get('filesystem'),
+                hotCache=readKwargs.get('hotCache', False), verbose=False)
+
+            try:
+                if (executor is None) or (maxWorkers == 1):
+                    for fileArgs in (tqdm(fileArgsIter, total=nFilePaths)
+                                     if verbose
+                                     else fileArgsIter):
+                        try:
+                            result: ReducedDataSetType = self._readAndMapFile(*fileArgs,
+                                                                              **readKwargs)
+
+                        except Exception as err:
+                            self.stdOutLogger.error(msg=f'*** FAILED TO REDUCE "{fileArgs[0]}" ***')
+                            raise err
+
+                        finally:
+                            self._unpinLocalFile(filePath=fileArgs[0],
+                                                 filesystem=readKwargs.get('filesystem'))
+
+                        yield result
+
+                    return
+
+                if executor not in ('thread', 'process'):
+                    raise ValueError('*** executor must be one of "thread", "process" and None ***')
+
+                nWorkers: int = self._nWorkers(executor=executor, maxWorkers=maxWorkers)
+
+                def submitMapping(_filePath: str) -> Future:
+                    # (files being submitted in order, each one's prefetched arguments are next)
+                    fileArgs: Tuple = next(fileArgsIter)
+
+                    future: Future = mapPool.submit(self._readAndMapFile, *fileArgs, **readKwargs)
+                    future.add_done_callback(
+                        lambda _: self._unpinLocalFile(filePath=fileArgs[0],
+                                                       filesystem=readKwargs.get('filesystem')))
+
+                    return future
+
+                with (ThreadPoolExecutor(max_workers=nWorkers)
+                      if executor == 'thread'
+                      else self._processPool(nWorkers=nWorkers)) as mapPool:
+                    yield from self._iterFutureResults(
+                        filePaths, submitMapping,
+                        lookAhead=lookAhead if lookAhead else 2 * nWorkers,
+                        verbose=verbose)
+
+            finally:
+                # (unpinning files prefetched but not yet submitted for mapping)
+                fileArgsIter.close()
+
+            return
+
+        if (executor is None) or (maxWorkers == 1) or (nFilePaths < 2):
+            for filePath in (tqdm(filePaths) if verbose and (nFilePaths > 1) else filePaths):
+                try:
+                    result: ReducedDataSetType = self._reduceFile(filePath=filePath, cols=cols,
+                                                                  **readKwargs)
+
+                except Exception as err:
+                    self.stdOutLogger.error(msg=f'*** FAILED TO REDUCE "{filePath}" ***')
+                    raise err
+
+                yield result
+
+            return
+
+        nWorkers: int = self._nWorkers(executor=executor, maxWorkers=maxWorkers)
+
+        if executor == 'thread':
+            with ThreadPoolExecutor(max_workers=nWorkers) as threadPool:
+                yield from self._iterFutureResults(
+                    filePaths,
+                    lambda filePath: threadPool.submit(self._reduceFile,
+                                                       filePath=filePath, cols=cols,
+                                                       **readKwargs),
+                    lookAhead=lookAhead, verbose=verbose)
+
+        elif executor == 'process':
+            with ThreadPoolExecutor(max_workers=nWorkers) as threadPool, \
+                    self._processPool(nWorkers=nWorkers) as processPool:
+                yield from self._iterFutureResults(
+                    filePaths,
+                    lambda filePath: threadPool.submit(self._reduceFileInProcess, processPool,
+                                                       filePath=filePath, cols=cols,
+                                                       **readKwargs),
+                    lookAhead=lookAhead, verbose=verbose)
 
-            fileCache.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+        else:
+            raise ValueError('*** executor must be one of "thread", "process" and None ***')
 
-            self.srcColsInclPartitionKVs.update(fileCache.srcColsExclPartitionKVs)
+    def _iterFutureResults(self, filePaths: Tuple[str], submit: Callable[[str], Future], *,
+                           lookAhead: Optional[int] = None,
+                           onDiscard: Optional[Callable[[Any], None]] = None,
+                           verbose: bool = True) -> Iterator[Any]:
+        """Submit per-file work within a bounded window & yield results in order.
 
-            for col in fileCache.srcColsExclPartitionKVs.difference(fileCache.partitionKVs):
-                fileCache.srcTypesExclPartitionKVs[col] = \
-                    fileCache.srcTypesInclPartitionKVs[col] = \
-                    _arrowType = schema.field(col).type
+        The first error is logged & re-raised after cancelling pending work.
+        Results of pending work completed but never yielded are passed to ``onDiscard``, if given.
+        """
+        pendingFutures: Deque[Tuple[str, Future]] = deque()
 
-                assert not is_binary(_arrowType), \
-                    TypeError(f'*** {filePath}: {col} IS OF BINARY TYPE ***')
+        filePathsIter: Iterator[str] = iter(filePaths)
 
-                if col in self.srcTypesInclPartitionKVs:
-                    assert _arrowType == self.srcTypesInclPartitionKVs[col], \
-                        TypeError(f'*** {filePath} COLUMN {col}: '
-                                  f'DETECTED TYPE {_arrowType} != '
-                                  f'{self.srcTypesInclPartitionKVs[col]} ***')
-                else:
-                    self.srcTypesInclPartitionKVs[col] = _arrowType
+        if verbose and (len(filePaths) > 1):
+            progressBar: Optional[tqdm] = tqdm(total=len(filePaths))
+        else:
+            progressBar: Optional[tqdm] = None
+
+        try:
+            for filePath in islice(filePathsIter, lookAhead if lookAhead else None):
+                pendingFutures.append((filePath, submit(filePath)))
+
+            while pendingFutures:
+                filePath, future = pendingFutures.popleft()
+
+                try:
+                    result: Any = future.result()
+
+                except Exception as err:
+                    self.stdOutLogger.error(msg=f'*** FAILED TO REDUCE "{filePath}" ***')
+                    raise err
+
+                for nextFilePath in islice(filePathsIter, 1):
+                    pendingFutures.append((nextFilePath, submit(nextFilePath)))
+
+                if progressBar is not None:
+                    progressBar.update(1)
+
+                yield result
+
+        finally:
+            for _, future in pendingFutures:
+                future.cancel()
+
+            if onDiscard is not None:
+                for _, future in pendingFutures:
+                    if (not future.cancelled()) and (future.exception() is None):
+                        onDiscard(future.result())
+
+            if progressBar is not None:
+                progressBar.close()
+
+    def iterReduce(self, *filePaths: str, **kwargs: Any) -> Iterator[ReducedDataSetType]:
+        """Lazily yield mapped per-file (or per-record-batch) results, in order of file paths.
+
+        Memory is bounded by the look-ahead window rather than by the whole data set:
+        later files are downloaded & mapped in the background while earlier results are consumed.
+
+        Keyword Args:
+            - **cols**: column(s) to read
+            - **nSamplesPerFile**: number of rows to randomly sample from each file
+            - **batchSize**: if given, yield results per record batch of this many rows
+            instead of per file (``nSamplesPerFile`` is then not applicable)
+            - **lookAhead**: maximum number of files to prepare ahead of the one being yielded
+            (default: twice the number of workers)
+            - **arrow**: whether to read & map Arrow Tables instead of Pandas Data Frames
+            - **memoryMap**: whether to memory-map locally-cached files
+            - **remote**: whether to read only requested column chunks directly from S3
+            (by coalesced ranged reads) instead of downloading whole files to local cache
+            - **hotCache**: whether to read from hot-cache tier of locally-cached files
+            re-encoded (upon first access) into memory-mappable Arrow IPC (Feather v2) files
+            - **executor**: ``'thread'``, ``'process'`` or ``None`` (serial, by default);
+            with ``'thread'``, mappers run concurrently & so must be thread-safe;
+            with ``'process'``, mappers & their arguments are pickled to worker processes
+            & so must be picklable (e.g. module-level functions or ``partial``s thereof,
+            not lambdas or closures), and, worker processes being started by a fork server
+            (see ``_PROCESS_START_METHOD``), scripts' main code must be guarded by
+            ``if __name__ == '__main__':``
+            - **maxWorkers**: maximum number of parallel workers
+            - **prefetch**: number of concurrent downloads ahead of decoding & mapping
+            (default: ``None``, i.e. downloading each file when about to map it)
+            - **prefetchAhead**: maximum number of files downloaded but not yet decoded
+        """
+        cols: Optional[Collection[str]] = kwargs.get('cols')
+        cols: Set[str] = to_iterable(cols, iterable_type=set) if cols else set()
 
-            metadata: FileMetaData = read_metadata(where=fileCache.localPath)
-            fileCache.nCols = metadata.num_columns
-            fileCache.nRows = metadata.num_rows
+        arrow: bool = kwargs.get('arrow', False)
 
-        return fileCache
+        # (remote reads pre-buffering coalesced column-chunk byte ranges, without memory-mapping)
+        filesystem: Optional[FileSystem] = (S3FileSystem(region=self.awsRegion)
+                                            if kwargs.get('remote', self._REDUCE_REMOTE)
+                                            else None)
+        memoryMap: bool = (kwargs.get('memoryMap', self._REDUCE_MEMORY_MAP)
+                           and (filesystem is None))
 
-    # =====================
-    # ROWS, COLUMNS & TYPES
-    # ---------------------
-    # approxNRows / nRows / __len__
-    # columns
-    # indexCols
-    # types
-    # type / typeIsNum
-    # possibleFeatureCols
-    # possibleCatCols
+        hotCache: bool = kwargs.get('hotCache', self._REDUCE_HOT_CACHE)
+        assert not (hotCache and filesystem), \
+            ValueError('*** hotCache & remote CANNOT BE USED TOGETHER ***')
 
-    @property
-    def approxNRows(self) -> int:
-        """Approximate number of rows."""
-        if self._cache.approxNRows is None:
-            self.stdOutLogger.info(msg='Counting Approx. No. of Rows...')
+        executor: Optional[str] = kwargs.get('executor', self._REDUCE_EXECUTOR)
+        maxWorkers: Optional[int] = kwargs.get('maxWorkers', self._REDUCE_MAX_N_WORKERS)
 
-            self._cache.approxNRows = (
-                self.nFiles
-                * sum(self.cacheFileMetadataAndSchema(filePath=filePath).nRows
-                      for filePath in (tqdm(self.prelimReprSampleFilePaths)
-                                       if len(self.prelimReprSampleFilePaths) > 1
-                                       else self.prelimReprSampleFilePaths))
-                / self._reprSampleMinNFiles)
+        prefetch: Optional[int] = kwargs.get('prefetch', self._REDUCE_PREFETCH)
+        prefetchAhead: Optional[int] = kwargs.get('prefetchAhead', self._REDUCE_PREFETCH_AHEAD)
 
-        return self._cache.approxNRows
+        lookAhead: int = kwargs.get('lookAhead',
+                                    2 * (self._nWorkers(executor=executor, maxWorkers=maxWorkers)
+                                         if executor
+                                         else 1))
 
-    @property
-    def nRows(self) -> int:
-        """Return number of rows."""
-        if self._cache.nRows is None:
-            self.stdOutLogger.info(msg='Counting No. of Rows...')
+        verbose: bool = kwargs.get('verbose', True)
 
-            self._cache.nRows = \
-                sum(self.cacheFileMetadataAndSchema(filePath=filePath).nRows
-                    for filePath in (tqdm(self.filePaths) if self.nFiles > 1 else self.filePaths))
+        if not filePaths:
+            filePaths: Set[str] = self.filePaths
 
-        return self._cache.nRows
+        if batchSize := kwargs.get('batchSize'):
+            # prepare (i.e., download & read metadata of) files ahead,
+            # while lazily decoding & mapping record batches of the current file
+            for fileArgs in self._iterPrefetchedFileArgs(
+                    tuple(filePaths), cols,
+                    prefetch=(prefetch
+                              if prefetch
+                              else self._nWorkers(executor='thread', maxWorkers=maxWorkers)),
+                    prefetchAhead=prefetchAhead if prefetchAhead else lookAhead,
+                    filesystem=filesystem, hotCache=hotCache,
+                    verbose=verbose):
+                try:
+                    yield from self._iterReadAndMapFileBatches(*fileArgs,
+                                                               batchSize=batchSize, arrow=arrow,
+                                                               memoryMap=memoryMap,
+                                                               filesystem=filesystem,
+                                                               hotCache=hotCache)
+
+                finally:
+                    self._unpinLocalFile(filePath=fileArgs[0], filesystem=filesystem)
 
-    def __len__(self) -> int:
-        """Return (approximate) number of rows."""
-        return self._cache.nRows if self._cache.nRows else self.approxNRows
+        else:
+            yield from self._iterMapFiles(tuple(filePaths), cols,
+                                          executor=executor, maxWorkers=maxWorkers,
+                                          lookAhead=lookAhead,
+                                          prefetch=prefetch, prefetchAhead=prefetchAhead,
+                                          verbose=verbose,
+                                          nSamplesPerFile=kwargs.get('nSamplesPerFile'),
+                                          arrow=arrow, memoryMap=memoryMap,
+                                          filesystem=filesystem, hotCache=hotCache)
+
+    def _combineFiles(self, filePaths: Tuple[str], cols: Set[str], *,
+                      combiner: Combiner,
+                      executor: Optional[str] = None, maxWorkers: Optional[int] = None,
+                      prefetch: Optional[int] = None, prefetchAhead: Optional[int] = None,
+                      verbose: bool = True,
+                      **readKwargs: Any) -> Any:
+        # pylint: disable=too-many-arguments,too-many-locals
+        """Fold mapped per-file results into accumulator(s) as files finish."""
+        nFilePaths: int = len(filePaths)
+
+        if (combiner.merge is None) or (executor is None) or (maxWorkers == 1) or (nFilePaths < 2):
+            return foldLeft(combiner.combine,
+                            self._iterMapFiles(filePaths, cols,
+                                               executor=executor, maxWorkers=maxWorkers,
+                                               lookAhead=(2 * self._nWorkers(executor=executor,
+                                                                             maxWorkers=maxWorkers)
+                                                          if executor
+                                                          else None),
+                                               prefetch=prefetch, prefetchAhead=prefetchAhead,
+                                               verbose=verbose,
+                                               **readKwargs),
+                            combiner.initial)
+
+        if executor not in ('thread', 'process'):
+            raise ValueError('*** executor must be one of "thread", "process" and None ***')
+
+        # each worker pre-aggregates a contiguous shard of files,
+        # then shard accumulators are merged in order
+        nWorkers: int = min(self._nWorkers(executor=executor, maxWorkers=maxWorkers), nFilePaths)
+        shardSize: int = int(math.ceil(nFilePaths / nWorkers))
+
+        progressBar: Optional[tqdm] = tqdm(total=nFilePaths) if verbose else None
+
+        with ThreadPoolExecutor(max_workers=nWorkers) as threadPool, \
+                (self._processPool(nWorkers=nWorkers)
+                 if executor == 'process'
+                 else nullcontext()) as processPool:
+            def combineShard(shardFilePaths: Tuple[str]) -> Any:
+                acc: Any = combiner.initial
+
+                for filePath in shardFilePaths:
+                    try:
+                        result: ReducedDataSetType = (
+                            self._reduceFileInProcess(processPool,
+                                                      filePath=filePath, cols=cols,
+                                                      **readKwargs)
+                            if processPool
+                            else self._reduceFile(filePath=filePath, cols=cols, **readKwargs))
 
-    @property
-    def columns(self) -> Set[str]:
-        """Column names."""
-        return self.srcColsInclPartitionKVs
+                    except Exception as err:
+                        self.stdOutLogger.error(msg=f'*** FAILED TO REDUCE "{filePath}" ***')
+                        raise err
 
-    @property
-    def indexCols(self) -> Set[str]:
-        """Return index columns."""
-        s: Set[str] = set()
+                    acc: Any = combiner.combine(acc, result)
 
-        if self._iCol:
-            s.add(self._iCol)
+                    if progressBar is not None:
+                        progressBar.update(1)
 
-        if self._dCol:
-            s.add(self._dCol)
+                return acc
 
-        if self._tCol:
-            s.add(self._tCol)
+            shardFutures: List[Future] = [
+                threadPool.submit(combineShard, filePaths[i:(i + shardSize)])
+                for i in range(0, nFilePaths, shardSize)]
 
-        return s
+            try:
+                return foldLeft(combiner.merge,
+                                (shardFuture.result() for shardFuture in shardFutures),
+                                combiner.initial)
 
-    @property
-    def types(self) -> Namespace:
-        """Return column data types."""
-        return self.srcTypesInclPartitionKVs
+            finally:
+                for shardFuture in shardFutures:
+                    shardFuture.cancel()
 
-    @lru_cache(maxsize=None, typed=False)
-    def type(self, col: str) -> DataType:
-        """Return data type of specified column."""
-        return self.types[col]
+                if progressBar is not None:
+                    progressBar.close()
 
-    @lru_cache(maxsize=None, typed=False)
-    def typeIsNum(self, col: str) -> bool:
-        """Check whether specified column's data type is numerical."""
-        return is_num(self.type(col))
+    def _reduceIntoNumPy(self, filePaths: Tuple[str], cols: Set[str], *,
+                         out: Union[bool, str, Path],
+                         dtype: Optional[Any] = None,
+                         executor: Optional[str] = None, maxWorkers: Optional[int] = None,
+                         verbose: bool = True,
+                         **readKwargs: Any) -> ndarray:
+        # pylint: disable=too-many-arguments,too-many-locals
+        """Write mapped per-file NumPy arrays into their own slices of one preallocated array.
 
-    @property
-    def possibleFeatureCols(self) -> Set[str]:
-        """Possible feature columns for ML modeling."""
-        return {col for col in self.contentCols if is_possible_feature(self.type(col))}
+        Each file's result must have exactly as many rows as the file
+        (or as ``nSamplesPerFile``, if fewer), as per cached file metadata.
+        """
+        # cache metadata of all files (fetching their footers concurrently if not yet cached)
+        if executor:
+            fileCaches: List[Namespace] = self._cacheFilesMetadataAndSchemas(
+                filePaths, maxWorkers=maxWorkers, verbose=False)
+        else:
+            fileCaches: List[Namespace] = [self.cacheFileMetadataAndSchema(filePath=filePath)
+                                           for filePath in filePaths]
+
+        nSamplesPerFile: Optional[int] = readKwargs.get('nSamplesPerFile')
+
+        filesNRows: List[int] = [(min(nSamplesPerFile, fileCache.nRows)
+                                  if nSamplesPerFile
+                                  else fileCache.nRows)
+                                 for fileCache in fileCaches]
+
+        totalNRows: int = sum(filesNRows)
+
+        resultArray: Optional[ndarray] = None
+        rowOffset: int = 0
+
+        for filePath, fileNRows, result in zip(
+                filePaths, filesNRows,
+                self._iterMapFiles(filePaths, cols,
+                                   executor=executor, maxWorkers=maxWorkers,
+                                   lookAhead=(2 * self._nWorkers(executor=executor,
+                                                                 maxWorkers=maxWorkers)
+                                              if executor
+                                              else None),
+                                   verbose=verbose,
+                                   **readKwargs)):
+            assert isinstance(result, ndarray) and (len(result) == fileNRows), \
+                ValueError(f'*** {filePath}: MAPPED RESULT NOT A {fileNRows:,}-ROW NUMPY ARRAY '
+                           '(MAPPERS MUST NEITHER DROP NOR ADD ROWS) ***')
+
+            if resultArray is None:
+                # shape & (unless specified) type from first file's result
+                shape: Tuple[int] = (totalNRows, *result.shape[1:])
+
+                resultArray: ndarray = (
+                    empty(shape=shape, dtype=result.dtype if dtype is None else dtype, order='C')
+                    if out is True
+                    else open_memmap(filename=out, mode='w+',
+                                     dtype=result.dtype if dtype is None else dtype,
+                                     shape=shape, fortran_order=False, version=None))
+
+            resultArray[rowOffset:(rowOffset + fileNRows)] = result
+            rowOffset += fileNRows
+
+        if isinstance(out, (str, Path)) and (resultArray is not None):
+            resultArray.flush()
+
+        return resultArray
 
-    @property
-    def possibleCatCols(self) -> Set[str]:
-        """Possible categorical content columns."""
-        return {col for col in self.contentCols if is_possible_cat(self.type(col))}
+    @staticmethod
+    def _concatResults(results: List[ReducedDataSetType]) -> ReducedDataSetType:
+        """Default reducer: concatenate per-file results."""
+        return (vstack(tup=results)
+                if isinstance(results[0], ndarray)
+                else (concat_tables(tables=results, promote=True)
+                      if isinstance(results[0], Table)
+                      else concat(objs=results,
+                                  axis='index',
+                                  join='outer',
+                                  ignore_index=False,
+                                  keys=None,
+                                  levels=None,
+                                  names=None,
+                                  verify_integrity=False,
+                                  sort=False,
+                                  copy=False)))
 
-    # ====================
-    # MAP/REDUCE & related
-    # --------------------
-    # map
-    # reduce
-    # __getitem__
-    # castType
-    # collect
+    @staticmethod
+    def _resultNBytes(result: ReducedDataSetType) -> int:
+        return (int(result.memory_usage(index=True, deep=True).sum())
+                if isinstance(result, DataFrame)
+                else result.nbytes)
 
-    def map(self, *mappers: callable,
-            reduceMustInclCols: Optional[ColsType] = None,
-            **kwargs: Any) -> S3ParquetDataFeeder:
-        """Apply mapper function(s) to files."""
-        if reduceMustInclCols is None:
-            reduceMustInclCols: Set[str] = set()
+    @staticmethod
+    def _spillResults(results: List[ReducedDataSetType], spillFilePath: Path):
+        """Write mapped results into uncompressed (i.e., memory-mappable) Feather v2 file."""
+        assert all(isinstance(result, (DataFrame, Table)) for result in results), \
+            TypeError('*** ONLY PANDAS DATA FRAME & ARROW TABLE RESULTS CAN BE SPILLED ***')
+
+        # arrow.apache.org/docs/python/generated/pyarrow.feather.write_feather
+        write_feather(df=concat_tables(tables=[(result
+                                                if isinstance(result, Table)
+                                                else Table.from_pandas(df=result,
+                                                                       schema=None,
+                                                                       preserve_index=None,
+                                                                       nthreads=None,
+                                                                       columns=None,
+                                                                       safe=True))
+                                               for result in results],
+                                       promote=True),
+                      dest=str(spillFilePath),
+                      compression='uncompressed',
+                      compression_level=None,
+                      chunksize=None,
+                      version=2)
+
+    def _reduceWithinMemoryBudget(self, filePaths: Tuple[str], cols: Set[str], *,
+                                  memoryBudget: int,
+                                  reducer: callable,
+                                  executor: Optional[str] = None,
+                                  maxWorkers: Optional[int] = None,
+                                  verbose: bool = True,
+                                  **readKwargs: Any) -> ReducedDataSetType:
+        # pylint: disable=too-many-arguments,too-many-locals
+        """Collect mapped results, spilling them to local disk whenever exceeding memory budget.
+
+        If anything has been spilled, the result is an Arrow Table lazily concatenating
+        memory-mapped spill files (under the local cache directory) instead of in-memory content,
+        and a custom ``reducer`` cannot be applied (a warning being logged).
+        Spill files count towards ``LOCAL_CACHE``'s budget, pinned while that table exists,
+        then deleted once it is garbage-collected (tables derived from it still being readable,
+        as memory mappings outlive deleted files).
+        """
+        spillDirPath: Path = self._LOCAL_CACHE_DIR_PATH / self._SPILL_DIR_NAME / str(uuid4())
+        spillFilePaths: List[Path] = []
+
+        inMemoryResults: List[ReducedDataSetType] = []
+        inMemoryNBytes: int = 0
+
+        for result in self._iterMapFiles(filePaths, cols,
+                                         executor=executor, maxWorkers=maxWorkers,
+                                         lookAhead=(2 * self._nWorkers(executor=executor,
+                                                                       maxWorkers=maxWorkers)
+                                                    if executor
+                                                    else None),
+                                         verbose=verbose,
+                                         **readKwargs):
+            inMemoryResults.append(result)
+            inMemoryNBytes += self._resultNBytes(result)
+
+            if inMemoryNBytes > memoryBudget:
+                if not spillFilePaths:
+                    spillDirPath.mkdir(mode=0o777, parents=True, exist_ok=True)
+
+                    if reducer is not self._concatResults:
+                        self.stdOutLogger.warning(
+                            msg=('*** CUSTOM REDUCER NOT APPLIED TO RESULTS SPILLED '
+                                 f'BEYOND MEMORY BUDGET OF {memoryBudget:,} BYTES ***'))
+
+                spillFilePaths.append(spillDirPath / f'{len(spillFilePaths)}.feather')
+                self._spillResults(inMemoryResults, spillFilePaths[-1])
+
+                self.LOCAL_CACHE.pin(spillFilePaths[-1])
+                self.LOCAL_CACHE.add(spillFilePaths[-1])
 
-        inheritCache: bool = kwargs.pop('inheritCache', False)
-        inheritNRows: bool = kwargs.pop('inheritNRows', inheritCache)
+                if verbose:
+                    self.stdOutLogger.info(
+                        msg=f'Spilled {inMemoryNBytes:,} Bytes to "{spillFilePaths[-1]}"')
 
-        s3ParquetDF: S3ParquetDataFeeder = \
-            S3ParquetDataFeeder(
-                path=self.path, awsRegion=self.awsRegion,
+                inMemoryResults: List[ReducedDataSetType] = []
+                inMemoryNBytes: int = 0
 
-                _mappers=self._mappers + mappers,
-                _reduceMustInclCols=(self._reduceMustInclCols |
-                                     to_iterable(reduceMustInclCols, iterable_type=set)),
+        if not spillFilePaths:
+            return reducer(inMemoryResults)
 
-                iCol=self._iCol, tCol=self._tCol,
+        if inMemoryResults:
+            spillFilePaths.append(spillDirPath / f'{len(spillFilePaths)}.feather')
+            self._spillResults(inMemoryResults, spillFilePaths[-1])
 
-                reprSampleMinNFiles=self._reprSampleMinNFiles, reprSampleSize=self._reprSampleSize,
+            self.LOCAL_CACHE.pin(spillFilePaths[-1])
+            self.LOCAL_CACHE.add(spillFilePaths[-1])
 
-                nulls=self._nulls,
-                minNonNullProportion=self._minNonNullProportion,
-                outlierTailProportion=self._outlierTailProportion,
-                maxNCats=self._maxNCats,
-                minProportionByMaxNCats=self._minProportionByMaxNCats,
+        # arrow.apache.org/docs/python/generated/pyarrow.feather.read_table
+        # (concatenation only referencing memory-mapped record batches, without copying)
+        result: Table = concat_tables(tables=[readFeather(source=str(spillFilePath),
+                                                          columns=None,
+                                                          memory_map=True,
+                                                          use_threads=True)
+                                              for spillFilePath in spillFilePaths],
+                                      promote=True)
 
-                **kwargs)
+        finalize(result, self._removeSpillFiles, spillDirPath, *spillFilePaths)
 
-        if inheritCache:
-            s3ParquetDF._inheritCache(self)
+        return result
 
-        if inheritNRows:
-            s3ParquetDF._cache.approxNRows = self._cache.approxNRows
-            s3ParquetDF._cache.nRows = self._cache.nRows
+    @classmethod
+    def _removeSpillFiles(cls, spillDirPath: Path, *spillFilePaths: Path):
+        cls.LOCAL_CACHE.unpin(*spillFilePaths)
+        cls.LOCAL_CACHE.remove(*spillFilePaths)
 
-        return s3ParquetDF
+        spillDirPath.rmdir()
 
     def reduce(self, *filePaths: str, **kwargs: Any) -> ReducedDataSetType:
-        # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-        """Reduce from mapped content."""
-        _CHUNK_SIZE: int = 10 ** 5
-
+        """Reduce from mapped content.
+
+        Keyword Args:
+            - **cols**: column(s) to read
+            - **nSamplesPerFile**: number of rows to randomly sample from each file
+            - **reducer**: function to reduce the list of per-file results
+            - **combiner**: ``Combiner`` to fold per-file results in incrementally
+            instead of collecting them for ``reducer`` (constant memory for aggregates)
+            - **arrow**: whether to read files into Arrow Tables & have mappers
+            receive & return Arrow Tables, without any Pandas conversion
+            - **returnPandas**: whether to convert an Arrow Table result to Pandas at the end
+            - **preallocNumPy**: ``True`` to have per-file NumPy array results written into
+            one array preallocated with the files' exact row counts, instead of stacked
+            (halving peak memory), or path of ``.npy`` file to memory-map as that array
+            - **numPyDType**: data type of preallocated NumPy array, e.g. ``'float32'``
+            (default: that of first file's result)
+            - **memoryBudget**: maximum number of bytes of results to hold in memory,
+            beyond which they are spilled to local Feather files, in which case the result is
+            an Arrow Table over those memory-mapped files, deleted once it is garbage-collected
+            (a custom ``reducer`` then not being applied, with a warning)
+            - **memoryMap**: whether to memory-map locally-cached files
+            - **remote**: whether to read only requested column chunks directly from S3
+            (by coalesced ranged reads) instead of downloading whole files to local cache
+            - **hotCache**: whether to read from hot-cache tier of locally-cached files
+            re-encoded (upon first access) into memory-mappable Arrow IPC (Feather v2) files
+            - **executor**: ``'thread'``, ``'process'`` or ``None`` (serial, by default);
+            with ``'thread'``, mappers run concurrently & so must be thread-safe;
+            with ``'process'``, mappers & their arguments are pickled to worker processes
+            & so must be picklable (e.g. module-level functions or ``partial``s thereof,
+            not lambdas or closures), and, worker processes being started by a fork server
+            (see ``_PROCESS_START_METHOD``), scripts' main code must be guarded by
+            ``if __name__ == '__main__':``
+            - **maxWorkers**: maximum number of parallel workers
+            - **prefetch**: number of concurrent downloads ahead of decoding & mapping
+            (default: ``None``, i.e. downloading each file when about to map it)
+            - **prefetchAhead**: maximum number of files downloaded but not yet decoded
+        """
         cols: Optional[Collection[str]] = kwargs.get('cols')
         cols: Set[str] = to_iterable(cols, iterable_type=set) if cols else set()
 
         nSamplesPerFile: int = kwargs.get('nSamplesPerFile')
 
-        reducer: callable = kwargs.get('reducer',
-                                       lambda results:
-                                           vstack(tup=results)
-                                           if isinstance(results[0], ndarray)
-                                           else concat(objs=results,
-                                                       axis='index',
-                                                       join='outer',
-                                                       ignore_index=False,
-                                                       keys=None,
-                                                       levels=None,
-                                                       names=None,
-                                                       verify_integrity=False,
-                                                       sort=False,
-                                                       copy=False))
+        arrow: bool = kwargs.get('arrow', False)
+        returnPandas: bool = kwargs.get('returnPandas', False)
+
+        # (remote reads pre-buffering coalesced column-chunk byte ranges, without memory-mapping)
+        filesystem: Optional[FileSystem] = (S3FileSystem(region=self.awsRegion)
+                                            if kwargs.get('remote', self._REDUCE_REMOTE)
+                                            else None)
+        memoryMap: bool = (kwargs.get('memoryMap', self._REDUCE_MEMORY_MAP)
+                           and (filesystem is None))
+
+        hotCache: bool = kwargs.get('hotCache', self._REDUCE_HOT_CACHE)
+        assert not (hotCache and filesystem), \
+            ValueError('*** hotCache & remote CANNOT BE USED TOGETHER ***')
+
+        reducer: callable = kwargs.get('reducer', self._concatResults)
 
         verbose: bool = kwargs.pop('verbose', True)
 
         if not filePaths:
             filePaths: Set[str] = self.filePaths
 
-        results: List[ReducedDataSetType] = []
+        executor: Optional[str] = kwargs.get('executor', self._REDUCE_EXECUTOR)
+        maxWorkers: Optional[int] = kwargs.get('maxWorkers', self._REDUCE_MAX_N_WORKERS)
+
+        prefetch: Optional[int] = kwargs.get('prefetch', self._REDUCE_PREFETCH)
+        prefetchAhead: Optional[int] = kwargs.get('prefetchAhead', self._REDUCE_PREFETCH_AHEAD)
+
+        if preallocNumPy := kwargs.get('preallocNumPy'):
+            assert not kwargs.get('combiner'), \
+                ValueError('*** preallocNumPy & combiner CANNOT BE USED TOGETHER ***')
+
+            result: ndarray = self._reduceIntoNumPy(
+                tuple(filePaths), cols,
+                out=preallocNumPy, dtype=kwargs.get('numPyDType'),
+                executor=executor, maxWorkers=maxWorkers,
+                prefetch=prefetch, prefetchAhead=prefetchAhead,
+                verbose=verbose,
+                nSamplesPerFile=nSamplesPerFile, arrow=arrow, memoryMap=memoryMap,
+                filesystem=filesystem, hotCache=hotCache)
+
+        elif memoryBudget := kwargs.get('memoryBudget'):
+            assert not kwargs.get('combiner'), \
+                ValueError('*** memoryBudget & combiner CANNOT BE USED TOGETHER ***')
+
+            result: ReducedDataSetType = self._reduceWithinMemoryBudget(
+                tuple(filePaths), cols,
+                memoryBudget=memoryBudget, reducer=reducer,
+                executor=executor, maxWorkers=maxWorkers,
+                prefetch=prefetch, prefetchAhead=prefetchAhead,
+                verbose=verbose,
+                nSamplesPerFile=nSamplesPerFile, arrow=arrow, memoryMap=memoryMap,
+                filesystem=filesystem, hotCache=hotCache)
+
+        elif combiner := kwargs.get('combiner'):
+            result: Any = self._combineFiles(tuple(filePaths), cols,
+                                             combiner=combiner,
+                                             executor=executor, maxWorkers=maxWorkers,
+                                             prefetch=prefetch, prefetchAhead=prefetchAhead,
+                                             verbose=verbose,
+                                             nSamplesPerFile=nSamplesPerFile, arrow=arrow,
+                                             memoryMap=memoryMap, filesystem=filesystem,
+                                             hotCache=hotCache)
 
-        # pylint: disable=too-many-nested-blocks
-        for filePath in (tqdm(filePaths) if verbose and (len(filePaths) > 1) else filePaths):
-            fileLocalPath: Path = self.fileLocalPath(filePath=filePath)
+        else:
+            result: ReducedDataSetType = reducer(list(self._iterMapFiles(
+                tuple(filePaths), cols,
+                executor=executor, maxWorkers=maxWorkers,
+                prefetch=prefetch, prefetchAhead=prefetchAhead,
+                verbose=verbose,
+                nSamplesPerFile=nSamplesPerFile, arrow=arrow, memoryMap=memoryMap,
+                filesystem=filesystem, hotCache=hotCache)))
+
+        return (_arrowToPandas(result)
+                if returnPandas and isinstance(result, Table)
+                else result)
 
-            fileCache: Namespace = self.cacheFileMetadataAndSchema(filePath=filePath)
+    @staticmethod
+    def _getCols(pandasDF: Union[DataFrame, Table],
+                 cols: Union[str, Tuple[str]]) -> Union[DataFrame, Series, Table]:
+        if isinstance(pandasDF, Table):
+            arrowTable: Table = pandasDF
 
-            colsForFile: Set[str] = (
-                cols
-                if cols
-                else fileCache.srcColsInclPartitionKVs
-            ) | self._reduceMustInclCols
-
-            srcCols: Set[str] = colsForFile & fileCache.srcColsExclPartitionKVs
-
-            partitionKeyCols: Set[str] = colsForFile.intersection(fileCache.partitionKVs)
-
-            if srcCols:
-                pandasDFConstructed: bool = False
-
-                if toSubSample := nSamplesPerFile and (nSamplesPerFile < fileCache.nRows):
-                    intermediateN: float = (nSamplesPerFile * fileCache.nRows) ** .5
-
-                    if ((nChunksForIntermediateN := int(math.ceil(intermediateN / _CHUNK_SIZE)))
-                            < (approxNChunks := int(math.ceil(fileCache.nRows / _CHUNK_SIZE)))):
-                        # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table
-                        fileArrowTable: Table = read_table(source=fileLocalPath,
-                                                           columns=list(srcCols),
-                                                           use_threads=True,
-                                                           metadata=None,
-                                                           use_pandas_metadata=True,
-                                                           memory_map=False,
-                                                           read_dictionary=None,
-                                                           filesystem=None,
-                                                           filters=None,
-                                                           buffer_size=0,
-                                                           partitioning='hive',
-                                                           use_legacy_dataset=False,
-                                                           ignore_prefixes=None,
-                                                           pre_buffer=True,
-                                                           coerce_int96_timestamp_unit=None)
-
-                        chunkRecordBatches: List[RecordBatch] = \
-                            fileArrowTable.to_batches(max_chunksize=_CHUNK_SIZE)
-
-                        nChunks: int = len(chunkRecordBatches)
-
-                        assert nChunks in (approxNChunks - 1, approxNChunks), \
-                            ValueError(f'*** {filePath}: {nChunks} vs. '
-                                       f'{approxNChunks} Record Batches ***')
-
-                        assert nChunksForIntermediateN <= nChunks, \
-                            ValueError(f'*** {filePath}: {nChunksForIntermediateN} vs. '
-                                       f'{nChunks} Record Batches ***')
-
-                        chunkPandasDFs: List[DataFrame] = []
-
-                        nSamplesPerChunk: int = int(math.ceil(nSamplesPerFile /
-                                                              nChunksForIntermediateN))
-
-                        for chunkRecordBatch in randomSample(population=chunkRecordBatches,
-                                                             sampleSize=nChunksForIntermediateN,
-                                                             returnCollectionType=tuple):
-                            # arrow.apache.org/docs/python/generated/pyarrow.RecordBatch.html
-                            # #pyarrow.RecordBatch.to_pandas
-                            chunkPandasDF: DataFrame = \
-                                chunkRecordBatch.to_pandas(
-                                    memory_pool=None,
-                                    categories=None,
-                                    strings_to_categorical=False,
-                                    zero_copy_only=False,
-
-                                    integer_object_nulls=False,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # Cast integers with nulls to objects
-
-                                    date_as_object=True,
-                                    # TODO: check
-                                    # (bool, default True) –
-                                    # Cast dates to objects.
-                                    # If False, convert to datetime64[ns] dtype.
-
-                                    timestamp_as_object=False,
-                                    use_threads=True,
-
-                                    deduplicate_objects=True,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # Do not create multiple copies Python objects when created,
-                                    # to save on memory use. Conversion will be slower.
-
-                                    ignore_metadata=False,
-                                    safe=True,
-
-                                    split_blocks=True,
-                                    # TODO: check
-                                    # (bool, default False) –
-                                    # If True, generate one internal “block”
-                                    # for each column when creating a pandas.DataFrame
-                                    # from a RecordBatch or Table.
-                                    # While this can temporarily reduce memory
-                                    # note that various pandas operations can
-                                    # trigger “consolidation” which may balloon memory use.
-
-                                    self_destruct=True,
-                                    # TODO: check
-                                    # EXPERIMENTAL: If True, attempt to deallocate
-                                    # the originating Arrow memory while
-                                    # converting the Arrow object to pandas.
-                                    # If you use the object after calling to_pandas
-                                    # with this option it will crash your program.
-                                    # Note that you may not see always memory usage improvements.
-                                    # For example, if multiple columns share
-                                    # an underlying allocation, memory can’t be freed
-                                    # until all columns are converted.
-
-                                    types_mapper=None)
-
-                            for k in partitionKeyCols:
-                                chunkPandasDF[k] = fileCache.partitionKVs[k]
-
-                            if nSamplesPerChunk < len(chunkPandasDF):
-                                chunkPandasDF: DataFrame = \
-                                    chunkPandasDF.sample(n=nSamplesPerChunk,
-                                                         # frac=None,
-                                                         replace=False,
-                                                         weights=None,
-                                                         random_state=None,
-                                                         axis='index',
-                                                         ignore_index=False)
-
-                            chunkPandasDFs.append(chunkPandasDF)
-
-                        filePandasDF: DataFrame = concat(objs=chunkPandasDFs,
-                                                         axis='index',
-                                                         join='outer',
-                                                         ignore_index=False,
-                                                         keys=None,
-                                                         levels=None,
-                                                         names=None,
-                                                         verify_integrity=False,
-                                                         sort=False,
-                                                         copy=False)
-
-                        pandasDFConstructed: bool = True
-
-                if not pandasDFConstructed:
-                    # pandas.pydata.org/docs/reference/api/pandas.read_parquet
-                    filePandasDF: DataFrame = read_parquet(
-                        path=fileLocalPath,
-                        engine='pyarrow',
-                        columns=list(srcCols),
-                        storage_options=None,
-                        use_nullable_dtypes=True,
+            for missingCol in to_iterable(cols, iterable_type=set).difference(
+                    arrowTable.column_names):
+                arrowTable: Table = arrowTable.append_column(missingCol,
+                                                             nulls(size=arrowTable.num_rows))
 
-                        # arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table:
-                        use_threads=True,
-                        metadata=None,
-                        use_pandas_metadata=True,
-                        memory_map=False,
-                        read_dictionary=None,
-                        filesystem=None,
-                        filters=None,
-                        buffer_size=0,
-                        partitioning='hive',
-                        use_legacy_dataset=False,
-                        ignore_prefixes=None,
-                        pre_buffer=True,
-                        coerce_int96_timestamp_unit=None,
-
-                        # arrow.apache.org/docs/python/generated/pyarrow.Table.html
-                        # #pyarrow.Table.to_pandas:
-                        # memory_pool=None,   # (default)
-                        # categories=None,   # (default)
-                        # strings_to_categorical=False,   # (default)
-                        # zero_copy_only=False,   # (default)
-
-                        # integer_object_nulls=False,   # (default)
-                        # TODO: check
-                        # (bool, default False) –
-                        # Cast integers with nulls to objects
-
-                        # date_as_object=True,   # (default)
-                        # TODO: check
-                        # (bool, default True) –
-                        # Cast dates to objects.
-                        # If False, convert to datetime64[ns] dtype.
-
-                        # timestamp_as_object=False,   # (default)
-                        # use_threads=True,   # (default)
-
-                        # deduplicate_objects=True,   # (default: *** False ***)
-                        # TODO: check
-                        # (bool, default False) –
-                        # Do not create multiple copies Python objects when created,
-                        # to save on memory use. Conversion will be slower.
-
-                        # ignore_metadata=False,   # (default)
-                        # safe=True,   # (default)
-
-                        # split_blocks=True,   # (default: *** False ***)
-                        # TODO: check
-                        # (bool, default False) –
-                        # If True, generate one internal “block” for each column
-                        # when creating a pandas.DataFrame from a RecordBatch or Table.
-                        # While this can temporarily reduce memory note that
-                        # various pandas operations can trigger “consolidation”
-                        # which may balloon memory use.
-
-                        # self_destruct=True,   # (default: *** False ***)
-                        # TODO: check
-                        # EXPERIMENTAL: If True, attempt to deallocate the originating
-                        # Arrow memory while converting the Arrow object to pandas.
-                        # If you use the object after calling to_pandas with this option
-                        # it will crash your program.
-                        # Note that you may not see always memory usage improvements.
-                        # For example, if multiple columns share an underlying allocation,
-                        # memory can’t be freed until all columns are converted.
-
-                        # types_mapper=None,   # (default)
-                    )
-
-                    for k in partitionKeyCols:
-                        filePandasDF[k] = fileCache.partitionKVs[k]
-
-                    if toSubSample:
-                        filePandasDF: DataFrame = filePandasDF.sample(n=nSamplesPerFile,
-                                                                      # frac=None,
-                                                                      replace=False,
-                                                                      weights=None,
-                                                                      random_state=None,
-                                                                      axis='index',
-                                                                      ignore_index=False)
+            return arrowTable.select(to_iterable(cols, iterable_type=list))
 
-            else:
-                filePandasDF: DataFrame = DataFrame(index=range(nSamplesPerFile
-                                                                if nSamplesPerFile and
-                                                                (nSamplesPerFile < fileCache.nRows)
-                                                                else fileCache.nRows))
+        for missingCol in to_iterable(cols, iterable_type=set).difference(pandasDF.columns):
+            pandasDF.loc[:, missingCol] = None
+
+        return pandasDF[cols if isinstance(cols, str) else list(cols)]
 
-                for k in partitionKeyCols:
-                    filePandasDF[k] = fileCache.partitionKVs[k]
+    @staticmethod
+    def _castType(pandasDF: Union[DataFrame, Table],
+                  colsToTypes: Dict[str, Any]) -> Union[DataFrame, Table]:
+        if isinstance(pandasDF, Table):
+            arrowTable: Table = pandasDF
 
-            result: ReducedDataSetType = filePandasDF
-            for mapper in self._mappers:
-                result: ReducedDataSetType = mapper(result)
+            for col, colType in colsToTypes.items():
+                arrowTable: Table = arrowTable.set_column(
+                    arrowTable.schema.get_field_index(col), col,
+                    arrowTable[col].cast(colType
+                                         if isinstance(colType, DataType)
+                                         else from_numpy_dtype(numpyDType(colType))))
 
-            results.append(result)
+            return arrowTable
 
-        return reducer(results)
+        return pandasDF.astype(dtype=colsToTypes, copy=False, errors='raise')
 
     @staticmethod
-    def _getCols(pandasDF: DataFrame, cols: Union[str, Tuple[str]]) -> DataFrame:
-        for missingCol in to_iterable(cols, iterable_type=set).difference(pandasDF.columns):
-            pandasDF.loc[:, missingCol] = None
+    def arrowColsToNumPy(arrowTable: Table, *cols: str) -> Namespace:
+        """Get Arrow Table column(s) as NumPy arrays, e.g. within mappers run with ``arrow=True``.
 
-        return pandasDF[cols if isinstance(cols, str) else list(cols)]
+        Fixed-width, null-free numeric columns held in single chunks are viewed without copying
+        (read-only); other columns are copied, with chunks concatenated & nulls converted.
+        """
+        colArrays: Namespace = Namespace()
+
+        for col in (cols if cols else arrowTable.column_names):
+            chunkedArray: ChunkedArray = arrowTable[col]
+
+            colArrays[col] = (
+                chunkedArray.chunk(0).to_numpy(zero_copy_only=True, writable=False)
+                if ((is_integer(chunkedArray.type) or is_floating(chunkedArray.type)) and
+                    (chunkedArray.num_chunks == 1) and (chunkedArray.null_count == 0))
+                else chunkedArray.to_numpy())
+
+        return colArrays
 
     @lru_cache(maxsize=None, typed=False)
     def __getitem__(self, cols: Union[str, Tuple[str]], /) -> S3ParquetDataFeeder:
         """Get column(s)."""
         return self.map(partial(self._getCols, cols=cols),
                         reduceMustInclCols=cols,
-                        inheritNRows=True)
+                        inputCols=cols,
+                        preservesValues=True,
+                        inheritNRows=True,
+                        planOp='project', planArg=cols)
 
     @lru_cache(maxsize=None, typed=False)
     def castType(self, **colsToTypes: Dict[str, Any]) -> S3ParquetDataFeeder:
         """Cast data type(s) of column(s)."""
-        return self.map(lambda df: df.astype(colsToTypes, copy=False, errors='raise'),
+        return self.map(partial(self._castType, colsToTypes=colsToTypes),
                         reduceMustInclCols=set(colsToTypes),
-                        inheritNRows=True)
+                        inputCols=set(colsToTypes), passThrough=True,
+                        inheritNRows=True,
+                        planOp='cast', planArg=colsToTypes)
 
     def collect(self, *cols: str, **kwargs: Any) -> ReducedDataSetType:
-        """Collect content."""
+        """Collect content (applying optimized logical plan, see ``explain``)."""
         return self.reduce(cols=cols if cols else None, **kwargs)
 
     # =========
     # FILTERING
     # ---------
     # _subset
-    # filterByPartitionKeys
-    # filter
+    # _partitionKeyIndex / filterByPartitionKeys
+    # _conditionCols / _query / filter
+    # _parseCondition / _rowFilterFromAST
+    # _bindRowFilter / _rowFilterBoundExactly / _rowFilterMayMatch / _matchingRowGroups
+    # _rowFilterExpr / _rowFilterExprForSchema / _filterArrowTable
 
     @lru_cache(maxsize=None, typed=False)   # computationally expensive, so cached
     def _subset(self, *filePaths: str, **kwargs: Any) -> S3ParquetDataFeeder:
@@ -1045,7 +3264,9 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
             return S3ParquetDataFeeder(
                 path=subsetPath, awsRegion=self.awsRegion,
 
-                _mappers=self._mappers, _reduceMustInclCols=self._reduceMustInclCols,
+                _plan=self._plan,
+                _reduceMustInclCols=self._reduceMustInclCols,
+                _rowFilters=self._rowFilters, _rowFiltersPushable=self._rowFiltersPushable,
 
                 iCol=self._iCol, tCol=self._tCol,
 
@@ -1061,15 +3282,43 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
         return self
 
+    @lru_cache(maxsize=None, typed=False)   # built once per feeder & partition key
+    def _partitionKeyIndex(self, col: str) -> Optional[_PartitionKeyIndex]:
+        """Index files by values of partition key (None if not a partition key of any file).
+
+        (values split from files' partition directory names, without regular expressions)
+        """
+        colPrefix: str = f'{col}='
+
+        valuesFilePaths: Dict[str, Set[str]] = {}
+
+        for filePath in self.filePaths:
+            for pathComponent in filePath.split('/')[:-1]:
+                if pathComponent.startswith(colPrefix):
+                    valuesFilePaths.setdefault(pathComponent[len(colPrefix):],
+                                               set()).add(filePath)
+                    break
+
+        if not valuesFilePaths:
+            return None
+
+        sortedValues: Tuple[str] = tuple(sorted(valuesFilePaths))
+
+        return _PartitionKeyIndex(sortedValues=sortedValues,
+                                  filePathSets=tuple(frozenset(valuesFilePaths[v])
+                                                     for v in sortedValues))
+
     @lru_cache(maxsize=None, typed=False)
     def filterByPartitionKeys(self,
                               *filterCriteriaTuples: Union[Tuple[str, str], Tuple[str, str, str]],
                               **kwargs: Any) -> S3ParquetDataFeeder:
         # pylint: disable=too-many-branches
-        """Filter by partition keys."""
-        filterCriteria: Dict[str, Tuple[Optional[str], Optional[str], Optional[Set[str]]]] = {}
+        """Filter by partition keys.
 
-        _samplePath: str = next(iter(self.filePaths))
+        (resolved by binary searches of per-partition-key sorted indices of files,
+        values being compared as strings; criteria on columns not partition keys are ignored)
+        """
+        filterCriteria: Dict[str, Tuple[Optional[str], Optional[str], Optional[Set[str]]]] = {}
 
         for filterCriteriaTuple in filterCriteriaTuples:
             assert isinstance(filterCriteriaTuple, PY_LIST_OR_TUPLE)
@@ -1077,7 +3326,7 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
             col: str = filterCriteriaTuple[0]
 
-            if f'{col}=' in _samplePath:
+            if self._partitionKeyIndex(col) is not None:
                 if filterCriteriaTupleLen == 2:
                     fromVal: Optional[str] = None
                     toVal: Optional[str] = None
@@ -1102,23 +3351,18 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
                 filterCriteria[col] = fromVal, toVal, inSet
 
         if filterCriteria:
-            filePaths: Set[str] = set()
-
-            for filePath in self.filePaths:
-                filePandasDFSatisfiesCriteria: bool = True
+            filePaths: Optional[Set[str]] = None
 
-                for col, (fromVal, toVal, inSet) in filterCriteria.items():
-                    v: str = re.search(f'{col}=(.*?)/', filePath).group(1)
+            for col, (fromVal, toVal, inSet) in filterCriteria.items():
+                partitionKeyIndex: _PartitionKeyIndex = self._partitionKeyIndex(col)
 
-                    # pylint: disable=too-many-boolean-expressions
-                    if ((fromVal is not None) and (v < fromVal)) or \
-                            ((toVal is not None) and (v > toVal)) or \
-                            ((inSet is not None) and (v not in inSet)):
-                        filePandasDFSatisfiesCriteria: bool = False
-                        break
+                colFilePaths: Set[str] = (partitionKeyIndex.filePathsIn(inSet)
+                                          if inSet is not None
+                                          else partitionKeyIndex.filePathsInRange(fromVal, toVal))
 
-                if filePandasDFSatisfiesCriteria:
-                    filePaths.add(filePath)
+                filePaths: Set[str] = (colFilePaths
+                                       if filePaths is None
+                                       else filePaths & colFilePaths)
 
             assert filePaths, FileNotFoundError(f'*** {self}: NO  PATHS SATISFYING '
                                                 f'FILTER CRITERIA {filterCriteria} ***')
@@ -1127,19 +3371,330 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
         return self
 
+    def _conditionCols(self, condition: str) -> Set[str]:
+        """Columns referenced in a filtering condition (possibly over-inclusive)."""
+        return {col
+                for col in self.columns
+                if re.search(pattern=f'(?<![\\w.@]){re.escape(col)}(?!\\w)|`{re.escape(col)}`',
+                             string=condition)}
+
+    @staticmethod
+    def _query(pandasDF: Union[DataFrame, Table], condition: str,
+               rowFilter: Optional[RowFilterType] = None) -> Union[DataFrame, Table]:
+        if isinstance(pandasDF, Table):
+            # evaluate condition's row filter, if any & exactly applicable,
+            # without Pandas conversion
+            rowFilterExpr: Optional[Expression] = (
+                S3ParquetDataFeeder._rowFilterExprForSchema(rowFilter, pandasDF.schema)
+                if (rowFilter is not None) and S3ParquetDataFeeder._rowFilterBoundExactly(
+                    rowFilter, partitionKVs={}, readCols=set(pandasDF.column_names))
+                else None)
+
+            if rowFilterExpr is not None:
+                return pandasDF.filter(rowFilterExpr)
+
+            # (schema to be extracted before self-destructing Pandas conversion)
+            arrowSchema: Schema = pandasDF.schema
+
+            return Table.from_pandas(df=_arrowToPandas(pandasDF).query(expr=condition,
+                                                                       inplace=False),
+                                     schema=arrowSchema,
+                                     preserve_index=False)
+
+        return pandasDF.query(expr=condition, inplace=False)
+
     @lru_cache(maxsize=None, typed=False)
     def filter(self, *conditions: str, **kwargs: Any) -> S3ParquetDataFeeder:
         """Apply filtering mapper."""
         s3ParquetDF: S3ParquetDataFeeder = self
 
         for condition in conditions:
-            # pylint: disable=cell-var-from-loop
+            conditionCols: Set[str] = self._conditionCols(condition)
+
+            rowFilter: Optional[RowFilterType] = self._parseCondition(condition)
+
             s3ParquetDF: S3ParquetDataFeeder = \
-                s3ParquetDF.map(lambda df: df.query(expr=condition, inplace=False),
+                s3ParquetDF.map(partial(self._query, condition=condition, rowFilter=rowFilter),
+                                reduceMustInclCols=conditionCols,
+                                inputCols=conditionCols, passThrough=True,
+                                rowFilter=rowFilter,
+                                preservesValues=True,
+                                planOp='filter', planArg=condition,
                                 **kwargs)
 
         return s3ParquetDF
 
+    def _parseCondition(self, condition: str) -> Optional[RowFilterType]:
+        """Translate filtering condition into row filter, if of supported subset.
+
+        (comparisons of columns with literals, incl. ``in`` / ``not in``,
+        combined by ``and`` / ``or`` / ``&`` / ``|``; ``None`` if unsupported)
+        """
+        try:
+            return self._rowFilterFromAST(ast.parse(condition.strip(), mode='eval').body)
+
+        except SyntaxError:   # e.g., `@` local variables or backtick-quoted column names
+            return None
+
+    def _rowFilterFromAST(self, node: ast.AST) -> Optional[RowFilterType]:
+        if isinstance(node, ast.BoolOp) or (isinstance(node, ast.BinOp) and
+                                            isinstance(node.op, (ast.BitAnd, ast.BitOr))):
+            rowFilters: Tuple[Optional[RowFilterType]] = tuple(
+                self._rowFilterFromAST(operandNode)
+                for operandNode in (node.values
+                                    if isinstance(node, ast.BoolOp)
+                                    else (node.left, node.right)))
+
+            return (None
+                    if any(rowFilter is None for rowFilter in rowFilters)
+                    else ('and' if isinstance(node.op, (ast.And, ast.BitAnd)) else 'or',
+                          rowFilters))
+
+        if not isinstance(node, ast.Compare):
+            return None
+
+        rowFilters: List[RowFilterType] = []
+
+        # e.g., `a < b <= c` meaning `(a < b) and (b <= c)`
+        for leftNode, cmpOpNode, rightNode in zip((node.left, *node.comparators[:-1]),
+                                                  node.ops,
+                                                  node.comparators):
+            if (op := self._ROW_FILTER_CMP_OPS.get(type(cmpOpNode))) is None:
+                return None
+
+            if isinstance(leftNode, ast.Name) and (leftNode.id in self.columns):
+                col: str = leftNode.id
+                valueNode: ast.AST = rightNode
+
+            elif (isinstance(rightNode, ast.Name) and (rightNode.id in self.columns) and
+                    (op in self._ROW_FILTER_FLIPPED_CMP_OPS)):
+                col: str = rightNode.id
+                valueNode: ast.AST = leftNode
+                op: str = self._ROW_FILTER_FLIPPED_CMP_OPS[op]
+
+            else:
+                return None
+
+            try:
+                value: Any = ast.literal_eval(valueNode)
+            except (TypeError, ValueError):   # e.g., column-to-column comparisons
+                return None
+
+            if isinstance(value, (list, tuple, set)):
+                # Pandas' `==` / `!=` with list-likes meaning `in` / `not in`
+                op: Optional[str] = {'==': 'in', '!=': 'not in',
+                                     'in': 'in', 'not in': 'not in'}.get(op)
+                value: Tuple[Any] = tuple(value)
+
+                if (op is None) or not all(isinstance(v, (bool, str) + PY_NUM_TYPES)
+                                           for v in value):
+                    return None
+
+            elif (op in ('in', 'not in')) or not isinstance(value, (bool, str) + PY_NUM_TYPES):
+                return None
+
+            rowFilters.append((op, col, value))
+
+        return rowFilters[0] if len(rowFilters) == 1 else ('and', tuple(rowFilters))
+
+    @staticmethod
+    def _bindRowFilter(rowFilter: RowFilterType,
+                       partitionKVs: Dict[str, Union[datetime.date, str]],
+                       readCols: Set[str]) -> RowFilterType:
+        """Resolve row filter's comparisons on partition keys & drop those on unread columns.
+
+        (dropping a comparison, i.e. treating it as satisfied, only ever widens the row filter,
+        as ``and`` / ``or`` are monotonic, so the filtering mapper itself remains authoritative
+        unless none are dropped, see ``_rowFilterBoundExactly``)
+        """
+        if isinstance(rowFilter, bool):
+            return rowFilter
+
+        op: str = rowFilter[0]
+
+        if op in ('and', 'or'):
+            # True for `and`, False for `or`
+            identity: bool = op == 'and'
+
+            boundRowFilters: List[RowFilterType] = []
+
+            for boundRowFilter in (S3ParquetDataFeeder._bindRowFilter(subRowFilter,
+                                                                      partitionKVs, readCols)
+                                   for subRowFilter in rowFilter[1]):
+                if boundRowFilter is (not identity):
+                    return not identity
+
+                if boundRowFilter is not identity:
+                    boundRowFilters.append(boundRowFilter)
+
+            if not boundRowFilters:
+                return identity
+
+            return (boundRowFilters[0]
+                    if len(boundRowFilters) == 1
+                    else (op, tuple(boundRowFilters)))
+
+        _, col, value = rowFilter
+
+        if col in partitionKVs:
+            try:
+                return bool(S3ParquetDataFeeder._ROW_FILTER_CMP_FUNCS[op](partitionKVs[col],
+                                                                          value))
+            except TypeError:   # e.g., date partition key vs. string
+                return True
+
+        return rowFilter if col in readCols else True
+
+    @staticmethod
+    def _rowFilterBoundExactly(rowFilter: RowFilterType,
+                               partitionKVs: Dict[str, Union[datetime.date, str]],
+                               readCols: Set[str]) -> bool:
+        """Check whether bound row filter (``_bindRowFilter``) selects exactly as Pandas would.
+
+        (i.e., none of its comparisons being dropped, nor keeping nulls;
+        if so, & the bound row filter is applied upon read, the filtering mapper is redundant)
+        """
+        if isinstance(rowFilter, bool):
+            return True
+
+        op: str = rowFilter[0]
+
+        if op in ('and', 'or'):
+            return all(S3ParquetDataFeeder._rowFilterBoundExactly(subRowFilter,
+                                                                  partitionKVs, readCols)
+                       for subRowFilter in rowFilter[1])
+
+        _, col, value = rowFilter
+
+        if col in partitionKVs:
+            try:
+                S3ParquetDataFeeder._ROW_FILTER_CMP_FUNCS[op](partitionKVs[col], value)
+            except TypeError:   # e.g., date partition key vs. string
+                return False
+
+            return True
+
+        return (col in readCols) and (op not in S3ParquetDataFeeder._ROW_FILTER_NULL_KEEPING_OPS)
+
+    @staticmethod
+    def _rowFilterMayMatch(rowFilter: RowFilterType,
+                           colsMinMax: Dict[str, Tuple[Any, Any]]) -> bool:
+        """Check whether row filter may match rows with column values in given min/max ranges."""
+        if isinstance(rowFilter, bool):
+            return rowFilter
+
+        op: str = rowFilter[0]
+
+        if op == 'and':
+            return all(S3ParquetDataFeeder._rowFilterMayMatch(subRowFilter, colsMinMax)
+                       for subRowFilter in rowFilter[1])
+
+        if op == 'or':
+            return any(S3ParquetDataFeeder._rowFilterMayMatch(subRowFilter, colsMinMax)
+                       for subRowFilter in rowFilter[1])
+
+        _, col, value = rowFilter
+
+        # (min/max statistics exclude nulls & NaNs, which `!=` / `not in` may match)
+        if (col not in colsMinMax) or (op in ('!=', 'not in')):
+            return True
+
+        colMin, colMax = colsMinMax[col]
+
+        try:
+            if op == '==':
+                return colMin <= value <= colMax
+
+            if op == '<':
+                return colMin < value
+
+            if op == '<=':
+                return colMin <= value
+
+            if op == '>':
+                return colMax > value
+
+            if op == '>=':
+                return colMax >= value
+
+            return any(colMin <= v <= colMax for v in value)   # `in`
+
+        except TypeError:   # e.g., binary statistics vs. string
+            return True
+
+    @staticmethod
+    def _matchingRowGroups(fileParquet: ParquetFile, rowFilter: RowFilterType) -> List[int]:
+        """Row groups whose column min/max statistics do not rule out row filter."""
+        if rowFilter is True:
+            return list(range(fileParquet.num_row_groups))
+
+        matchingRowGroups: List[int] = []
+
+        for i in range(fileParquet.num_row_groups):
+            rowGroupMetadata = fileParquet.metadata.row_group(i)
+
+            colsMinMax: Dict[str, Tuple[Any, Any]] = {}
+
+            for j in range(rowGroupMetadata.num_columns):
+                colChunkMetadata = rowGroupMetadata.column(j)
+
+                if ((colStats := colChunkMetadata.statistics) is not None) and colStats.has_min_max:
+                    colsMinMax[colChunkMetadata.path_in_schema] = colStats.min, colStats.max
+
+            if S3ParquetDataFeeder._rowFilterMayMatch(rowFilter, colsMinMax):
+                matchingRowGroups.append(i)
+
+        return matchingRowGroups
+
+    @staticmethod
+    def _rowFilterExpr(rowFilter: RowFilterType) -> Expression:
+        """Translate row filter into Arrow Dataset expression."""
+        if isinstance(rowFilter, bool):
+            return scalar(rowFilter)
+
+        op: str = rowFilter[0]
+
+        if op in ('and', 'or'):
+            return foldLeft(operator.and_ if op == 'and' else operator.or_,
+                            (S3ParquetDataFeeder._rowFilterExpr(subRowFilter)
+                             for subRowFilter in rowFilter[1]))
+
+        _, col, value = rowFilter
+
+        colField: Expression = field(col)
+
+        if op == 'in':
+            return colField.isin(value)
+
+        # (keeping nulls, which Pandas may not consider as filtered out)
+        if op == 'not in':
+            return ~colField.isin(value) | colField.is_null()
+
+        if op == '!=':
+            return (colField != value) | colField.is_null()
+
+        return S3ParquetDataFeeder._ROW_FILTER_CMP_FUNCS[op](colField, value)
+
+    @staticmethod
+    def _rowFilterExprForSchema(rowFilter: RowFilterType,
+                                arrowSchema: Schema) -> Optional[Expression]:
+        """Arrow Dataset expression for row filter, if applicable to columns' types."""
+        if rowFilter is True:
+            return None
+
+        rowFilterExpr: Expression = S3ParquetDataFeeder._rowFilterExpr(rowFilter)
+
+        try:   # validate against empty table, e.g. for integer columns vs. string values
+            arrowSchema.empty_table().filter(rowFilterExpr)
+        except (ArrowException, TypeError):
+            return None
+
+        return rowFilterExpr
+
+    @staticmethod
+    def _filterArrowTable(arrowTable: Table, rowFilterExpr: Optional[Expression]) -> Table:
+        return arrowTable if rowFilterExpr is None else arrowTable.filter(rowFilterExpr)
+
     # ========
     # SAMPLING
     # --------
@@ -1150,11 +3705,25 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
     @property
     def prelimReprSampleFilePaths(self) -> Set[str]:
-        """Prelim representative sample file paths."""
+        """Prelim representative sample file paths.
+
+        (same for all feeders of the data set, e.g. derived by ``map`` / ``filter`` / ``[...]``,
+        so that files warmed by ``warmLocalCache`` are those that all of them read first)
+        """
         if self._cache.prelimReprSampleFilePaths is None:
-            self._cache.prelimReprSampleFilePaths = \
-                randomSample(population=self.filePaths,
-                             sampleSize=self._reprSampleMinNFiles)
+            # (drawing shared sample unless already drawn, of same number of files)
+            if ((sharedPrelimReprSampleFilePaths := (
+                    self._CACHE[self._cacheKey].prelimReprSampleFilePaths)) is None) or \
+                    (len(sharedPrelimReprSampleFilePaths) !=
+                     min(self._reprSampleMinNFiles, self.nFiles)):
+                sharedPrelimReprSampleFilePaths: Set[str] = \
+                    randomSample(population=self.filePaths,
+                                 sampleSize=self._reprSampleMinNFiles)
+
+                self._CACHE[self._cacheKey].prelimReprSampleFilePaths = \
+                    sharedPrelimReprSampleFilePaths
+
+            self._cache.prelimReprSampleFilePaths = sharedPrelimReprSampleFilePaths
 
         return self._cache.prelimReprSampleFilePaths
 
@@ -1232,7 +3801,7 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
     # ================
     # COLUMN PROFILING
     # ----------------
-    # count
+    # count / _countNonNulls
     # nonNullProportion
     # distinct
     # quantile
@@ -1275,44 +3844,15 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
                 self._cache.count[col] = result = int(
                     self[col]
-                    .map(((lambda series: (series.notnull()
-                                           .sum(axis='index',
-                                                skipna=True,
-                                                level=None,
-                                                # numeric_only=True,
-                                                min_count=0)))
-
-                          if isnull(upperNumericNull)
-
-                          else (lambda series: ((series < upperNumericNull)
-                                                .sum(axis='index',
-                                                     skipna=True,
-                                                     level=None,
-                                                     # numeric_only=True,
-                                                     min_count=0))))
-
-                         if isnull(lowerNumericNull)
-
-                         else ((lambda series: ((series > lowerNumericNull)
-                                                .sum(axis='index',
-                                                     skipna=True,
-                                                     level=None,
-                                                     # numeric_only=True,
-                                                     min_count=0)))
-
-                               if isnull(upperNumericNull)
-
-                               else (lambda series: (series
-                                                     .between(left=lowerNumericNull,
-                                                              right=upperNumericNull,
-                                                              inclusive='neither')
-                                                     .sum(axis='index',
-                                                          skipna=True,
-                                                          level=None,
-                                                          # numeric_only=True,
-                                                          min_count=0)))),
+                    .map(partial(self._countNonNulls,
+                                 lowerNumericNull=lowerNumericNull,
+                                 upperNumericNull=upperNumericNull),
                          reduceMustInclCols=col)
-                    .reduce(cols=col, reducer=sum))
+                    .reduce(cols=col,
+                            combiner=Combiner(initial=0,
+                                              combine=operator.add,
+                                              merge=operator.add),
+                            **{k: kwargs[k] for k in self._REDUCE_EXEC_KWARGS if k in kwargs}))
 
                 if verbose:
                     toc: float = time.time()
@@ -1321,8 +3861,15 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
 
             return self._cache.count[col]
 
-        series: Series = pandasDF[col]
+        return self._countNonNulls(pandasDF[col],
+                                   lowerNumericNull=lowerNumericNull,
+                                   upperNumericNull=upperNumericNull)
 
+    @staticmethod
+    def _countNonNulls(series: Series,
+                       lowerNumericNull: Optional[PyNumType],
+                       upperNumericNull: Optional[PyNumType]) -> int:
+        # (static, so as to be picklable into process-executor mappers when partial)
         series: Series = ((series.notnull()
 
                            if isnull(upperNumericNull)
@@ -1419,8 +3966,10 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
         col: str = cols[0]
 
         # for precision, calc from whole data set instead of from reprSample
-        return self[col].reduce(cols=col).quantile(q=kwargs.get('q', .5),
-                                                   interpolation='linear')
+        return (self[col]
+                .reduce(cols=col,
+                        **{k: kwargs[k] for k in self._REDUCE_EXEC_KWARGS if k in kwargs})
+                .quantile(q=kwargs.get('q', .5), interpolation='linear'))
 
     def sampleStat(self, *cols: str, **kwargs: Any) -> Union[float, int, Namespace]:
         """Approximate measurements of a certain stat on numerical columns.
@@ -2202,10 +4751,14 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
                     self.stdOutLogger.info(
                         msg=f'{prep_save_msg} done!   <{prep_save_toc - prep_save_tic:,.1f} s>')
 
+        preprocInputCols: Set[str] = set(pandasMLPreproc.sortedCatCols +
+                                         pandasMLPreproc.sortedNumCols)
+
         if returnNumPy:
             s3ParquetDF: S3ParquetDataFeeder = \
                 self.map(partial(pandasMLPreproc.__call__, returnNumPy=True),
-                         inheritNRows=True, **kwargs)
+                         inputCols=preprocInputCols, passThrough=False,
+                         inheritNRows=True, planOp='preprocess', **kwargs)
 
         else:
             colsToKeep: Set[str] = self.indexCols | (
@@ -2224,7 +4777,9 @@ class S3ParquetDataFeeder(AbstractS3FileDataHandler):
                     and (numPrepColDetails['logical-type'] == 'num'))))
 
             s3ParquetDF: S3ParquetDataFeeder = \
-                self.map(pandasMLPreproc, inheritNRows=True, **kwargs)[tuple(colsToKeep)]
+                self.map(pandasMLPreproc,
+                         inputCols=preprocInputCols, passThrough=True,
+                         inheritNRows=True, planOp='preprocess', **kwargs)[tuple(colsToKeep)]
             s3ParquetDF._inheritCache(self, *colsToKeep)
             s3ParquetDF._cache.reprSample = self._cache.reprSample
 
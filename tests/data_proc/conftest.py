@@ -0,0 +1,181 @@
+"""Fixtures: local directory-backed S3 client & Parquet data set with nulls."""
+
+
+from __future__ import annotations
+
+import datetime
+from hashlib import md5
+from io import BytesIO
+from pathlib import Path
+import shutil
+from typing import Any, Dict, Iterator, List, Optional
+
+from botocore.exceptions import ClientError
+from numpy.random import default_rng
+from pandas import DataFrame, concat, read_parquet
+from pyarrow.lib import (Table,   # pylint: disable=no-name-in-module
+                         array as arrowArray, concat_tables)
+from pyarrow.parquet import write_table
+import pytest
+
+from ai_utils.data_proc import s3_parquet
+from ai_utils.data_proc.local_cache import LocalFileCache
+from ai_utils.data_proc.s3_parquet import S3ParquetDataFeeder
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+# pylint: disable=protected-access
+# e.g., `._CACHE`
+
+
+_N_FILES: int = 3
+_N_ROWS_PER_FILE: int = 2000
+_ROW_GROUP_SIZE: int = 500
+
+
+class LocalS3Client:
+    """Minimal S3 client serving buckets' objects from sub-directories of a local directory."""
+
+    def __init__(self, rootDirPath: Path):
+        """Init Local S3 Client."""
+        self.rootDirPath: Path = rootDirPath
+
+    def _objPath(self, Bucket: str, Key: str) -> Path:
+        # pylint: disable=invalid-name
+        if not (objPath := self.rootDirPath / Bucket / Key).is_file():
+            raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': Key}}, 'GetObject')
+
+        return objPath
+
+    @staticmethod
+    def _objMetadata(objPath: Path) -> Dict[str, Any]:
+        return dict(ETag=f'"{md5(objPath.read_bytes()).hexdigest()}"',
+                    ContentLength=objPath.stat().st_size,
+                    LastModified=datetime.datetime.fromtimestamp(objPath.stat().st_mtime,
+                                                                 tz=datetime.timezone.utc))
+
+    def get_paginator(self, operation_name: str) -> LocalS3Client:
+        """Get paginator (only of ``list_objects_v2``, listing in a single page)."""
+        assert operation_name == 'list_objects_v2'
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str = '',
+                 Delimiter: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        # pylint: disable=invalid-name
+        """List objects under prefix (& common prefixes if delimited)."""
+        bucketDirPath: Path = self.rootDirPath / Bucket
+
+        contents: List[Dict[str, Any]] = []
+        commonPrefixes: List[str] = []
+
+        for objPath in sorted(bucketDirPath.rglob('*')):
+            if objPath.is_file() and (key := str(objPath.relative_to(bucketDirPath))).startswith(
+                    Prefix):
+                if Delimiter and (Delimiter in key[len(Prefix):]):
+                    if (commonPrefix := Prefix + key[len(Prefix):].split(Delimiter)[0] +
+                            Delimiter) not in commonPrefixes:
+                        commonPrefixes.append(commonPrefix)
+
+                else:
+                    contents.append(dict(Key=key, Size=objPath.stat().st_size,
+                                         **self._objMetadata(objPath)))
+
+        yield {'Contents': contents,
+               'CommonPrefixes': [{'Prefix': commonPrefix} for commonPrefix in commonPrefixes]}
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        # pylint: disable=invalid-name
+        """Get object's metadata."""
+        return self._objMetadata(self._objPath(Bucket, Key))
+
+    def get_object(self, Bucket: str, Key: str, Range: str,
+                   IfMatch: Optional[str] = None) -> Dict[str, Any]:
+        # pylint: disable=invalid-name
+        """Get object's suffix byte range (``bytes=-N``)."""
+        objMetadata: Dict[str, Any] = self._objMetadata(objPath := self._objPath(Bucket, Key))
+        assert IfMatch in (None, objMetadata['ETag'])
+
+        return dict(Body=BytesIO(objPath.read_bytes()[-int(Range.split('-')[-1]):]),
+                    **objMetadata)
+
+    def download_file(self, Bucket: str, Key: str, Filename: str,
+                      ExtraArgs: Optional[Dict[str, Any]] = None, Config: Any = None):
+        # pylint: disable=invalid-name,too-many-arguments,unused-argument
+        """Download object to local file."""
+        shutil.copyfile(src=self._objPath(Bucket, Key), dst=Filename)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes):
+        # pylint: disable=invalid-name
+        """Put object."""
+        (self.rootDirPath / Bucket / Key).write_bytes(Body)
+
+
+def _clearClassCaches():
+    # (data set & file caches shared by all feeders, e.g. of other tests' data sets)
+    for classCache in (S3ParquetDataFeeder._CACHE, S3ParquetDataFeeder._FILE_CACHES,
+                       S3ParquetDataFeeder._LISTED_FILE_ETAGS,
+                       S3ParquetDataFeeder._LISTED_FILE_LAST_MODIFIED,
+                       S3ParquetDataFeeder._SUMMARIZED_FILES_METADATA):
+        classCache.clear()
+
+
+@pytest.fixture
+def localS3DataSet(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Dict[str, Any]]:
+    """Data set of Parquet files with nulls in all content columns, served by local S3 client.
+
+    (content columns: unique non-null ``i``, integer ``a`` & ``d``, float ``b``, string ``c``;
+    partition key: ``date``)
+    """
+    rng = default_rng(seed=0)
+
+    s3RootDirPath: Path = tmp_path / 's3'
+
+    fileArrowTables: List[Table] = []
+    filePandasDFs: List[DataFrame] = []
+
+    def withNulls(values: Any, nullProportion: float) -> Any:
+        return arrowArray(values, mask=rng.random(len(values)) < nullProportion)
+
+    for i in range(_N_FILES):
+        n: int = _N_ROWS_PER_FILE
+
+        fileArrowTable: Table = Table.from_pydict({
+            'i': arrowArray(range(i * n, (i + 1) * n)),
+            'a': withNulls(rng.integers(0, 10, n), .1),
+            'b': withNulls(rng.choice([.5, 1.5, 2.5], n), .15),
+            'c': withNulls(rng.choice(['x', 'y', 'z'], n).astype(object), .1),
+            'd': withNulls(rng.integers(0, 10, n), .3)})
+
+        fileLocalPath: Path = (s3RootDirPath / 'bkt/ds' /
+                               f'date=2022-01-0{i + 1}' / 'part.parquet')
+        fileLocalPath.parent.mkdir(parents=True)
+
+        write_table(fileArrowTable, fileLocalPath, row_group_size=_ROW_GROUP_SIZE)
+
+        fileArrowTables.append(fileArrowTable.append_column(
+            'date', arrowArray([datetime.date(2022, 1, i + 1)] * n)))
+
+        filePandasDF: DataFrame = read_parquet(fileLocalPath, use_nullable_dtypes=True)
+        filePandasDF['date'] = datetime.date(2022, 1, i + 1)
+        filePandasDFs.append(filePandasDF)
+
+    localCacheDirPath: Path = tmp_path / 'local-cache'
+
+    monkeypatch.setattr(S3ParquetDataFeeder, 'S3_CLIENT', LocalS3Client(s3RootDirPath))
+    monkeypatch.setattr(S3ParquetDataFeeder, '_LOCAL_CACHE_DIR_PATH', localCacheDirPath)
+    monkeypatch.setattr(S3ParquetDataFeeder, 'LOCAL_CACHE',
+                        LocalFileCache(dirPath=localCacheDirPath, maxNBytes=None))
+    monkeypatch.setattr(S3ParquetDataFeeder, '_METADATA_CATALOG', None)
+    monkeypatch.setattr(s3_parquet.s3, 'rm', lambda **kwargs: None)
+
+    _clearClassCaches()
+
+    # (content as read by Pandas with nullable dtypes, & as Arrow Table)
+    yield dict(path='s3://bkt/ds', s3RootDirPath=s3RootDirPath,
+               localCacheDirPath=localCacheDirPath,
+               pandasDF=concat(filePandasDFs, axis='index', ignore_index=True),
+               arrowTable=concat_tables(fileArrowTables))
+
+    _clearClassCaches()
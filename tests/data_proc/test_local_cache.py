@@ -0,0 +1,48 @@
+"""Local File Cache tests."""
+
+
+from pathlib import Path
+from typing import List
+
+from ai_utils.data_proc.local_cache import LocalFileCache
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+
+def _cacheFile(localFileCache: LocalFileCache, path: Path, nBytes: int):
+    # (as by downloads: under lock, then tracked)
+    with localFileCache.locked(path):
+        path.write_bytes(b'0' * nBytes)
+
+    localFileCache.add(path)
+
+
+def test_evictionDeletesSidecarFiles(tmp_path: Path):
+    """Evicted files' hidden pin-lock & lock files are deleted along with them."""
+    localFileCache: LocalFileCache = LocalFileCache(dirPath=tmp_path, maxNBytes=None)
+
+    paths: List[Path] = [tmp_path / 'd' / f'{i}.parquet' for i in range(4)]
+
+    for path in paths:
+        _cacheFile(localFileCache, path, nBytes=100)
+
+    with localFileCache.pinned(paths[0]):
+        localFileCache.maxNBytes = 250
+
+        # (least recently used files evicted, except pinned one)
+        assert sorted(path.name for path in (tmp_path / 'd').iterdir()) == \
+            ['.0.parquet.lock', '.0.parquet.pin', '.3.parquet.lock', '0.parquet', '3.parquet']
+
+    localFileCache.maxNBytes = 150
+
+    # (once unpinned, evicted too)
+    assert sorted(path.name for path in (tmp_path / 'd').iterdir()) == \
+        ['.3.parquet.lock', '3.parquet']
+
+    assert localFileCache.stats.evictedNFiles == 3
+
+    # (file re-cacheable, with new lock file)
+    _cacheFile(localFileCache, paths[0], nBytes=100)
+    assert localFileCache.contains(paths[0])
@@ -0,0 +1,62 @@
+"""Metadata Catalog tests."""
+
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ai_utils.data_proc.metadata_catalog import MetadataCatalog
+from ai_utils.data_proc.s3_parquet import S3ParquetDataFeeder
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+# pylint: disable=protected-access
+# e.g., `._INITIALIZED_DB_PATHS`
+
+
+def test_schemaInitializedOncePerPath(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Tables are created upon first connection to each database path only."""
+    initializations: list = []
+
+    _initialize: callable = MetadataCatalog._initialize
+
+    def initialize(self: MetadataCatalog, connection: Any):
+        if self.dbPath not in MetadataCatalog._INITIALIZED_DB_PATHS:
+            initializations.append(self.dbPath)
+        _initialize(self, connection)
+
+    monkeypatch.setattr(MetadataCatalog, '_initialize', initialize)
+
+    for dbPath in (tmp_path / 'a.sqlite3', tmp_path / 'b.sqlite3'):
+        for metadataCatalog in (MetadataCatalog(dbPath=dbPath), MetadataCatalog(dbPath=dbPath)):
+            metadataCatalog.putListing(path='s3://bkt/ds', filePathsETags={'s3://bkt/ds/f': 'e'})
+            assert metadataCatalog.listing(path='s3://bkt/ds') == {'s3://bkt/ds/f': 'e'}
+
+    assert initializations == [tmp_path / 'a.sqlite3', tmp_path / 'b.sqlite3']
+
+
+def test_cataloguedListingReusedWithinMaxAge(localS3DataSet: Dict[str, Any], tmp_path: Path,
+                                            monkeypatch: pytest.MonkeyPatch):
+    """Restarted processes reuse catalogued listings by default, until they expire."""
+    monkeypatch.setattr(S3ParquetDataFeeder, '_METADATA_CATALOG',
+                        MetadataCatalog(dbPath=tmp_path / 'catalog.sqlite3'))
+    assert S3ParquetDataFeeder._CATALOG_LISTING_MAX_AGE is not None
+
+    nFiles: int = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False).nFiles
+
+    # (as if restarted: in-process caches cleared; files listed afterwards not seen)
+    S3ParquetDataFeeder._CACHE.clear()
+    (localS3DataSet['s3RootDirPath'] / 'bkt/ds/date=2022-01-09').mkdir()
+    (localS3DataSet['s3RootDirPath'] / 'bkt/ds/date=2022-01-09/part.parquet').write_bytes(
+        (localS3DataSet['s3RootDirPath'] / 'bkt/ds/date=2022-01-01/part.parquet').read_bytes())
+
+    assert S3ParquetDataFeeder(localS3DataSet['path'], verbose=False).nFiles == nFiles
+
+    # (once expired, re-listed)
+    S3ParquetDataFeeder._CACHE.clear()
+    monkeypatch.setattr(S3ParquetDataFeeder, '_CATALOG_LISTING_MAX_AGE', 0)
+
+    assert S3ParquetDataFeeder(localS3DataSet['path'], verbose=False).nFiles == nFiles + 1
@@ -0,0 +1,172 @@
+"""S3 Parquet Data Feeder tests, on local directory-backed S3 data set with nulls."""
+
+
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from pandas import DataFrame
+from pyarrow.fs import LocalFileSystem, SubTreeFileSystem
+import pytest
+
+from ai_utils.data_proc import s3_parquet
+from ai_utils.data_proc.s3_parquet import S3ParquetDataFeeder
+
+
+# pylint: disable=invalid-name
+# e.g., camelCase names
+
+# pylint: disable=protected-access
+# e.g., `._FILE_CACHES`
+
+# pylint: disable=redefined-outer-name
+# (pytest fixtures)
+
+
+_CONDITIONS = ('d != 5',
+               'b != 0.5',
+               'c != "x"',
+               'a not in [1, 2]',
+               'a == [3, 4]',
+               'a > 3 and d != 5',
+               'a == 3 or b != 1.5',
+               '2 <= a < 7',
+               'c in ["x", "y"]')
+
+
+def _ids(result: Any) -> set:
+    return set((result if isinstance(result, DataFrame) else result.to_pandas())['i'])
+
+
+def _localS3FileSystem(s3RootDirPath: Path, region: str) -> SubTreeFileSystem:
+    # pylint: disable=unused-argument
+    # (remote reads through local filesystem rooted at local S3 client's root directory)
+    return SubTreeFileSystem(str(s3RootDirPath), LocalFileSystem())
+
+
+@pytest.mark.parametrize('arrow', (False, True))
+@pytest.mark.parametrize('condition', _CONDITIONS)
+def test_filterPushdownMatchesPandasQuery(localS3DataSet: Dict[str, Any],
+                                          condition: str, arrow: bool):
+    """Pushed-down (or residual) filters select as ``DataFrame.query`` on the content would.
+
+    (in Pandas mode, content being read with nullable dtypes;
+    in Arrow mode, filtering mappers evaluating conditions on default Pandas conversions)
+    """
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    expectedIds: set = _ids((localS3DataSet['arrowTable'].to_pandas()
+                             if arrow
+                             else localS3DataSet['pandasDF']).query(condition))
+
+    # pushed down into file reads
+    assert feeder.filter(condition)._rowFilters
+    assert _ids(feeder.filter(condition).collect(arrow=arrow, verbose=False)) == expectedIds
+
+    # residual, after opaque mapper keeping filters from being pushed down
+    residualFiltered: S3ParquetDataFeeder = feeder.map(lambda content: content).filter(condition)
+    assert not residualFiltered._rowFilters
+    assert _ids(residualFiltered.collect(arrow=arrow, verbose=False)) == expectedIds
+
+
+@pytest.mark.parametrize('readKwargs', (dict(hotCache=True),
+                                        dict(nSamplesPerFile=100),
+                                        dict(nSamplesPerFile=100, hotCache=True),
+                                        dict(memoryMap=False),
+                                        dict(remote=True)))
+def test_readPathsKeepNullableDTypes(localS3DataSet: Dict[str, Any], readKwargs: Dict[str, Any],
+                                     monkeypatch: pytest.MonkeyPatch):
+    """Hot-cache, row-group-subsampling & remote reads give same (nullable) dtypes as full reads."""
+    monkeypatch.setattr(s3_parquet, 'S3FileSystem', partial(_localS3FileSystem,
+                                                            localS3DataSet['s3RootDirPath']))
+
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    expectedDTypes: Dict[str, Any] = feeder.collect(verbose=False).dtypes.to_dict()
+    assert expectedDTypes == localS3DataSet['pandasDF'].dtypes.to_dict()
+
+    assert feeder.collect(verbose=False, **readKwargs).dtypes.to_dict() == expectedDTypes
+
+
+@pytest.mark.parametrize('executor', ('thread', 'process'))
+def test_profilingReducesWithExecutors(localS3DataSet: Dict[str, Any], executor: str):
+    """``count`` & ``quantile`` give serial results with thread & process executors.
+
+    (their mappers having to be picklable for the latter)
+    """
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    pandasDF: DataFrame = localS3DataSet['pandasDF']
+
+    for col in ('a', 'b', 'd'):
+        assert feeder.count(col, executor=executor, maxWorkers=2) == pandasDF[col].count()
+
+        assert feeder.quantile(col, q=.5, executor=executor, maxWorkers=2) == \
+            pandasDF[col].quantile(q=.5, interpolation='linear')
+
+
+@pytest.mark.parametrize('condition', ('d != 5', 'a > 3 and c in ["x", "y"]'))
+def test_filteredReadsWithProcessExecutor(localS3DataSet: Dict[str, Any], condition: str):
+    """Pushed-down & residual filters (hence their mappers) work with the process executor."""
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    pandasDF: DataFrame = localS3DataSet['pandasDF'].query(condition)
+
+    # (pushed down, & residual after type-casting mapper keeping filters from being pushed down)
+    filteredFeeders: Tuple[S3ParquetDataFeeder] = (
+        feeder.filter(condition),
+        feeder[('i', 'a', 'b', 'c', 'd')].castType(b='float64').filter(condition))
+    assert filteredFeeders[0]._rowFilters and not filteredFeeders[1]._rowFilters
+
+    for filteredFeeder in filteredFeeders:
+        assert _ids(filteredFeeder.collect(executor='process', maxWorkers=2, verbose=False)) == \
+            set(pandasDF['i'])
+
+        assert filteredFeeder.count('a', executor='process', maxWorkers=2) == \
+            pandasDF['a'].count()
+
+
+def test_remoteReadsLeaveLocalCacheUntouched(localS3DataSet: Dict[str, Any],
+                                             monkeypatch: pytest.MonkeyPatch):
+    """Remote reads neither download files nor pin (hence create) local-cache files."""
+    monkeypatch.setattr(s3_parquet, 'S3FileSystem', partial(_localS3FileSystem,
+                                                            localS3DataSet['s3RootDirPath']))
+
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    assert _ids(feeder.collect(remote=True, verbose=False)) == \
+        set(localS3DataSet['pandasDF']['i'])
+
+    assert not [path
+                for path in localS3DataSet['localCacheDirPath'].rglob('*')
+                if path.is_file()]
+
+
+def test_cacheLocallyRecordsAllLocalPaths(localS3DataSet: Dict[str, Any]):
+    """Caching locally records local paths of all files, including those not yet used."""
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'], verbose=False)
+
+    # (as if files not yet used, e.g. not among schema-probe files of many more files)
+    S3ParquetDataFeeder._FILE_CACHES.clear()
+
+    feeder.cacheLocally(verbose=False)
+
+    for filePath in feeder.filePaths:
+        assert (localPath := feeder._fileCache(filePath).localPath) is not None
+        assert feeder.LOCAL_CACHE.contains(localPath)
+
+
+def test_derivedFeedersReuseWarmedPrelimReprSample(localS3DataSet: Dict[str, Any]):
+    """Feeders derived by ``map`` / ``filter`` / ``[...]`` read the files warmed first."""
+    feeder: S3ParquetDataFeeder = S3ParquetDataFeeder(localS3DataSet['path'],
+                                                      reprSampleMinNFiles=1, verbose=False)
+
+    for future in feeder.warmLocalCache(verbose=False):
+        future.result()
+
+    for derivedFeeder in (feeder.map(lambda content: content),
+                          feeder.filter('a > 3'),
+                          feeder[('a', 'b')],
+                          S3ParquetDataFeeder(localS3DataSet['path'],
+                                              reprSampleMinNFiles=1, verbose=False)):
+        assert derivedFeeder.prelimReprSampleFilePaths == feeder.prelimReprSampleFilePaths